@@ -0,0 +1,140 @@
+"""Overhead of going through Narwhals, per operation, compared to native code.
+
+Each class benchmarks one operation, written once with Narwhals
+(`time_narwhals`) and once with the backend's own API (`time_native`), on
+frames from 10 rows to 10 million. Converting to and from Narwhals is part of
+the timing, as it is in any function which accepts and returns native frames.
+
+The classes follow asv's conventions, so `asv run` picks them up, and
+`python -m benchmarks` runs them without it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import narwhals.stable.v1 as nw
+
+BACKENDS = ["pandas", "pyarrow"]
+SIZES = [10, 1_000, 100_000, 10_000_000]
+
+
+def make_data(n_rows: int) -> dict[str, Any]:
+    rng = np.random.default_rng(0)
+    return {
+        "a": rng.integers(-100, 100, n_rows),
+        "b": rng.random(n_rows),
+        "g": rng.integers(0, 100, n_rows),
+    }
+
+
+# Private, so that asv doesn't collect it as a benchmark itself.
+class _Benchmark:
+    params = (BACKENDS, SIZES)
+    param_names = ("backend", "n_rows")
+
+    def setup(self, backend: str, n_rows: int) -> None:
+        data = make_data(n_rows)
+        self.df = pd.DataFrame(data) if backend == "pandas" else pa.table(data)
+        self.backend = backend
+
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        raise NotImplementedError
+
+    def native(self, df: Any) -> Any:
+        raise NotImplementedError
+
+    def time_narwhals(self, *_params: Any) -> None:
+        nw.to_native(self.narwhals(nw.from_native(self.df, eager_only=True)))
+
+    def time_native(self, *_params: Any) -> None:
+        self.native(self.df)
+
+
+class FromNative(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df
+
+    def native(self, df: Any) -> Any:
+        return df
+
+
+class Add(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.with_columns(c=nw.col("a") + nw.col("b"))
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return df.assign(c=df["a"] + df["b"])
+        return df.append_column("c", pc.add(df["a"], df["b"]))
+
+
+class ArithmeticChain(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.select(((nw.col("a") * 2 + nw.col("b")) - 1).abs())
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return ((df["a"] * 2 + df["b"]) - 1).abs().to_frame()
+        result = pc.abs(pc.subtract(pc.add(pc.multiply(df["a"], 2), df["b"]), 1))
+        return pa.table({"a": result})
+
+
+class Cast(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.select(nw.col("a").cast(nw.Float64))
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return df["a"].astype("float64").to_frame()
+        return pa.table({"a": df["a"].cast(pa.float64())})
+
+
+class Sum(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.select(nw.col("a").sum())
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return pd.DataFrame({"a": [df["a"].sum()]})
+        return pa.table({"a": pa.array([pc.sum(df["a"]).as_py()])})
+
+
+class Filter(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.filter(nw.col("a") > 0)
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return df[df["a"] > 0]
+        return df.filter(pc.greater(df["a"], 0))
+
+
+class Sort(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.sort("a")
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return df.sort_values("a")
+        return df.sort_by("a")
+
+
+class GroupBySum(_Benchmark):
+    def narwhals(self, df: nw.DataFrame) -> nw.DataFrame:
+        return df.group_by("g").agg(nw.col("a").sum())
+
+    def native(self, df: Any) -> Any:
+        if self.backend == "pandas":
+            return df.groupby("g", as_index=False)["a"].sum()
+        return df.group_by("g").aggregate([("a", "sum")])
+
+
+BENCHMARKS: dict[str, type[_Benchmark]] = {
+    benchmark.__name__: benchmark for benchmark in _Benchmark.__subclasses__()
+}
@@ -0,0 +1,112 @@
+"""Run the benchmarks without asv, and report Narwhals' overhead for each.
+
+Usage:
+
+    python -m benchmarks --sizes 10 1000 --output overhead.json
+
+For each benchmark, backend and frame size, this reports the best time per
+call with and without Narwhals, their ratio, and their difference - the fixed
+cost of going through Narwhals, which dominates on small frames.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Sequence
+
+from benchmarks.expressions import BACKENDS
+from benchmarks.expressions import BENCHMARKS
+from benchmarks.expressions import SIZES
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    """Best time per call out of `repeat` rounds of at least 0.2 seconds each."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(
+    benchmarks: Sequence[str],
+    backends: Sequence[str],
+    sizes: Sequence[int],
+    repeat: int = 5,
+) -> list[dict[str, Any]]:
+    """Time each benchmark for each backend and size, and return one record each."""
+    results = []
+    for name in benchmarks:
+        for backend in backends:
+            for n_rows in sizes:
+                benchmark = BENCHMARKS[name]()
+                benchmark.setup(backend, n_rows)
+                narwhals = best_time(
+                    partial(benchmark.time_narwhals, backend, n_rows), repeat
+                )
+                native = best_time(
+                    partial(benchmark.time_native, backend, n_rows), repeat
+                )
+                results.append(
+                    {
+                        "benchmark": name,
+                        "backend": backend,
+                        "n_rows": n_rows,
+                        "narwhals_s": narwhals,
+                        "native_s": native,
+                        "overhead_ratio": narwhals / native,
+                        "overhead_s": narwhals - native,
+                    }
+                )
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure the overhead of Narwhals compared to native code.",
+    )
+    parser.add_argument(
+        "--benchmarks",
+        nargs="+",
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help="benchmarks to run (default: all of them)",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        default=BACKENDS,
+        help="backends to run (default: all of them)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=SIZES,
+        help="numbers of rows (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of rounds to take the best of"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="JSON file to write")
+    args = parser.parse_args(argv)
+
+    results = run(args.benchmarks, args.backends, args.sizes, args.repeat)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+    print(  # noqa: T201
+        f"{'benchmark':<16}{'backend':<9}{'rows':>10}"
+        f"{'narwhals':>13}{'native':>13}{'ratio':>8}{'overhead':>13}"
+    )
+    for record in results:
+        print(  # noqa: T201
+            f"{record['benchmark']:<16}{record['backend']:<9}{record['n_rows']:>10}"
+            f"{record['narwhals_s'] * 1e6:>11.1f}us{record['native_s'] * 1e6:>11.1f}us"
+            f"{record['overhead_ratio']:>7.2f}x{record['overhead_s'] * 1e6:>11.1f}us"
+        )
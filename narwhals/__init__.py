@@ -1,52 +1,141 @@
-from narwhals import selectors
-from narwhals import stable
-from narwhals.dataframe import DataFrame
-from narwhals.dataframe import LazyFrame
-from narwhals.dtypes import Boolean
-from narwhals.dtypes import Categorical
-from narwhals.dtypes import Date
-from narwhals.dtypes import Datetime
-from narwhals.dtypes import Duration
-from narwhals.dtypes import Enum
-from narwhals.dtypes import Float32
-from narwhals.dtypes import Float64
-from narwhals.dtypes import Int8
-from narwhals.dtypes import Int16
-from narwhals.dtypes import Int32
-from narwhals.dtypes import Int64
-from narwhals.dtypes import Object
-from narwhals.dtypes import String
-from narwhals.dtypes import UInt8
-from narwhals.dtypes import UInt16
-from narwhals.dtypes import UInt32
-from narwhals.dtypes import UInt64
-from narwhals.dtypes import Unknown
-from narwhals.expression import Expr
-from narwhals.expression import all
-from narwhals.expression import col
-from narwhals.expression import len
-from narwhals.expression import lit
-from narwhals.expression import max
-from narwhals.expression import mean
-from narwhals.expression import min
-from narwhals.expression import sum
-from narwhals.expression import sum_horizontal
-from narwhals.functions import concat
-from narwhals.functions import show_versions
-from narwhals.series import Series
-from narwhals.translate import from_native
-from narwhals.translate import get_native_namespace
-from narwhals.translate import narwhalify
-from narwhals.translate import to_native
-from narwhals.utils import is_ordered_categorical
-from narwhals.utils import maybe_align_index
-from narwhals.utils import maybe_convert_dtypes
-from narwhals.utils import maybe_set_index
+# Public names are only imported for type checkers, see `__getattr__`.
+# ruff: noqa: TCH004
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from narwhals import selectors
+    from narwhals import stable
+    from narwhals.config import Config
+    from narwhals.dataframe import DataFrame
+    from narwhals.dataframe import LazyFrame
+    from narwhals.dtypes import Boolean
+    from narwhals.dtypes import Categorical
+    from narwhals.dtypes import Date
+    from narwhals.dtypes import Datetime
+    from narwhals.dtypes import Duration
+    from narwhals.dtypes import Enum
+    from narwhals.dtypes import Float32
+    from narwhals.dtypes import Float64
+    from narwhals.dtypes import Int8
+    from narwhals.dtypes import Int16
+    from narwhals.dtypes import Int32
+    from narwhals.dtypes import Int64
+    from narwhals.dtypes import Object
+    from narwhals.dtypes import String
+    from narwhals.dtypes import UInt8
+    from narwhals.dtypes import UInt16
+    from narwhals.dtypes import UInt32
+    from narwhals.dtypes import UInt64
+    from narwhals.dtypes import Unknown
+    from narwhals.expression import Expr
+    from narwhals.expression import all
+    from narwhals.expression import col
+    from narwhals.expression import len
+    from narwhals.expression import lit
+    from narwhals.expression import max
+    from narwhals.expression import mean
+    from narwhals.expression import min
+    from narwhals.expression import sum
+    from narwhals.expression import sum_horizontal
+    from narwhals.functions import concat
+    from narwhals.functions import read_ipc
+    from narwhals.functions import read_parquet
+    from narwhals.functions import scan_csv
+    from narwhals.functions import scan_parquet
+    from narwhals.functions import show_versions
+    from narwhals.profiling import profile
+    from narwhals.series import Series
+    from narwhals.translate import from_native
+    from narwhals.translate import get_native_namespace
+    from narwhals.translate import narwhalify
+    from narwhals.translate import to_native
+    from narwhals.utils import is_ordered_categorical
+    from narwhals.utils import maybe_align_index
+    from narwhals.utils import maybe_convert_dtypes
+    from narwhals.utils import maybe_set_index
 
 __version__ = "1.0.0"
 
+# Module which each public attribute comes from. Nothing gets imported until
+# an attribute is first accessed, so that `import narwhals` is cheap.
+_ATTRIBUTE_MODULES = {
+    "Config": "narwhals.config",
+    "DataFrame": "narwhals.dataframe",
+    "LazyFrame": "narwhals.dataframe",
+    "Boolean": "narwhals.dtypes",
+    "Categorical": "narwhals.dtypes",
+    "Date": "narwhals.dtypes",
+    "Datetime": "narwhals.dtypes",
+    "Duration": "narwhals.dtypes",
+    "Enum": "narwhals.dtypes",
+    "Float32": "narwhals.dtypes",
+    "Float64": "narwhals.dtypes",
+    "Int8": "narwhals.dtypes",
+    "Int16": "narwhals.dtypes",
+    "Int32": "narwhals.dtypes",
+    "Int64": "narwhals.dtypes",
+    "Object": "narwhals.dtypes",
+    "String": "narwhals.dtypes",
+    "UInt8": "narwhals.dtypes",
+    "UInt16": "narwhals.dtypes",
+    "UInt32": "narwhals.dtypes",
+    "UInt64": "narwhals.dtypes",
+    "Unknown": "narwhals.dtypes",
+    "Expr": "narwhals.expression",
+    "all": "narwhals.expression",
+    "col": "narwhals.expression",
+    "len": "narwhals.expression",
+    "lit": "narwhals.expression",
+    "max": "narwhals.expression",
+    "mean": "narwhals.expression",
+    "min": "narwhals.expression",
+    "sum": "narwhals.expression",
+    "sum_horizontal": "narwhals.expression",
+    "concat": "narwhals.functions",
+    "read_ipc": "narwhals.functions",
+    "read_parquet": "narwhals.functions",
+    "scan_csv": "narwhals.functions",
+    "scan_parquet": "narwhals.functions",
+    "show_versions": "narwhals.functions",
+    "profile": "narwhals.profiling",
+    "Series": "narwhals.series",
+    "from_native": "narwhals.translate",
+    "get_native_namespace": "narwhals.translate",
+    "narwhalify": "narwhals.translate",
+    "to_native": "narwhals.translate",
+    "is_ordered_categorical": "narwhals.utils",
+    "maybe_align_index": "narwhals.utils",
+    "maybe_convert_dtypes": "narwhals.utils",
+    "maybe_set_index": "narwhals.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+    from importlib.util import find_spec
+
+    if name in _ATTRIBUTE_MODULES:
+        value = getattr(import_module(_ATTRIBUTE_MODULES[name]), name)
+        # Later accesses don't go through `__getattr__`.
+        globals()[name] = value
+        return value
+    if not name.startswith("__") and find_spec(f"narwhals.{name}") is not None:
+        # Submodules, e.g. `nw.dtypes`, which importing sets as attributes.
+        return import_module(f"narwhals.{name}")
+    msg = f"module 'narwhals' has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
 __all__ = [
     "selectors",
+    "Config",
     "concat",
     "to_native",
     "from_native",
@@ -89,5 +178,10 @@ __all__ = [
     "Date",
     "narwhalify",
     "show_versions",
+    "profile",
+    "scan_parquet",
+    "read_parquet",
+    "read_ipc",
+    "scan_csv",
     "stable",
 ]
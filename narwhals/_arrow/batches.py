@@ -0,0 +1,280 @@
+"""Sources of Arrow record batches, which lazy plans can stream over.
+
+Rather than holding a whole `pyarrow.Table`, an `ArrowBatchSource` reads a
+`RecordBatchReader`, or a `pyarrow.dataset` Dataset or Scanner, one batch at
+a time. Chains of filters and elementwise projections then run on each batch
+separately (see `narwhals._lazy.stream`), and group-by aggregations keep a
+running state which gets updated with each batch, so that memory is bounded
+by the size of a batch (and of the result) rather than that of the data.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+from narwhals._arrow.dataframe import ArrowDataFrame
+from narwhals._lazy.filters import parquet_filters
+from narwhals._pandas_like.utils import evaluate_into_exprs
+from narwhals._pandas_like.utils import generate_unique_token
+from narwhals.dependencies import get_pyarrow
+from narwhals.dependencies import get_pyarrow_compute
+from narwhals.dependencies import get_pyarrow_dataset
+from narwhals.dependencies import get_pyarrow_parquet
+
+if TYPE_CHECKING:
+    from narwhals._arrow.expr import ArrowExpr
+    from narwhals._lazy.dataframe import LazyPlanFrame
+    from narwhals._lazy.filters import ParquetFilter
+    from narwhals._pandas_like.expr import PandasExpr
+    from narwhals._pandas_like.expr_node import ExprNode
+
+# Aggregations which can be computed per batch and combined afterwards:
+# `op -> [(Arrow aggregation per batch, Arrow aggregation to combine)]`.
+PARTIAL_AGGREGATIONS = {
+    "sum": [("sum", "sum")],
+    "min": [("min", "min")],
+    "max": [("max", "max")],
+    "any": [("any", "any")],
+    "all": [("all", "all")],
+    "len": [("count_all", "sum")],
+    # The sum of the sums, divided by the sum of the (non-null) counts.
+    "mean": [("sum", "sum"), ("count", "sum")],
+}
+
+
+class ArrowBatchSource:
+    """A `RecordBatchReader`, or a `pyarrow.dataset` Dataset or Scanner."""
+
+    def __init__(
+        self,
+        native_source: Any,
+        *,
+        backend_version: tuple[int, ...],
+        batch_size: int | None = None,
+    ) -> None:
+        self._native_source = native_source
+        self._backend_version = backend_version
+        # Maximum number of rows per batch of datasets, if not PyArrow's default.
+        self._batch_size = batch_size
+        # Readers can only be iterated over once.
+        self._consumed = False
+
+    def __narwhals_lazyframe__(self) -> LazyPlanFrame:
+        from narwhals._lazy.dataframe import LazyPlanFrame
+        from narwhals._lazy.plan import BatchScan
+
+        return LazyPlanFrame(
+            BatchScan(self),
+            implementation="arrow",
+            backend_version=self._backend_version,
+        )
+
+    @property
+    def name(self) -> str:
+        return type(self._native_source).__name__
+
+    @property
+    def schema(self) -> Any:
+        source = self._native_source
+        # The schemas of scanners include the columns which they don't read.
+        return getattr(source, "projected_schema", None) or source.schema
+
+    @property
+    def columns(self) -> list[str]:
+        return self.schema.names  # type: ignore[no-any-return]
+
+    def parquet_filters(self, predicate: PandasExpr) -> list[ParquetFilter] | None:
+        """Filters which datasets can apply while reading, for `predicate`.
+
+        Datasets skip the row groups of Parquet files which the filters rule
+        out, but readers and scanners can't be told to filter anything.
+        """
+        if not _is_dataset(self._native_source):
+            return None
+        return parquet_filters(predicate._node, self.schema)
+
+    def frames(
+        self,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> Iterator[ArrowDataFrame]:
+        """Yield each batch as a frame, with only `columns` if given.
+
+        If given, only the rows matching `filters` (see `parquet_filters`) get
+        read. At least one (possibly empty) frame always gets yielded, so that
+        results have the right schema even if the source has no rows.
+        """
+        pa = get_pyarrow()
+        empty = True
+        for batch in self._batches(columns, filters):
+            empty = False
+            table = pa.Table.from_batches([batch])
+            if columns is not None:
+                table = table.select(columns)
+            yield ArrowDataFrame(table, backend_version=self._backend_version)
+        if empty:
+            table = self.schema.empty_table()
+            if columns is not None:
+                table = table.select(columns)
+            yield ArrowDataFrame(table, backend_version=self._backend_version)
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> ArrowDataFrame:
+        """Read all the batches (with only `columns` if given) into a single frame."""
+        return concat_frames(self.frames(columns, filters))
+
+    def _batches(
+        self, columns: list[str] | None, filters: list[ParquetFilter] | None
+    ) -> Iterable[Any]:
+        source = self._native_source
+        if isinstance(source, get_pyarrow().RecordBatchReader):
+            if self._consumed:
+                msg = (
+                    "A RecordBatchReader can only be read once, and this one "
+                    "already has been.\n\nHint: to run several queries over the "
+                    "same data, pass a `pyarrow.dataset.Dataset` instead."
+                )
+                raise ValueError(msg)
+            self._consumed = True
+            return source  # type: ignore[no-any-return]
+        if _is_dataset(source):
+            # Datasets only read the columns and row groups which are needed.
+            expression = (
+                get_pyarrow_parquet().filters_to_expression(filters) if filters else None
+            )
+            if self._batch_size is not None:
+                return source.to_batches(  # type: ignore[no-any-return]
+                    columns=columns, filter=expression, batch_size=self._batch_size
+                )
+            return source.to_batches(columns=columns, filter=expression)  # type: ignore[no-any-return]
+        return source.to_batches()  # type: ignore[no-any-return]
+
+
+def _is_dataset(source: Any) -> bool:
+    # Readers don't need `pyarrow.dataset`, which might not have been imported.
+    ds = get_pyarrow_dataset()
+    return ds is not None and isinstance(source, ds.Dataset)
+
+
+def concat_frames(frames: Iterable[ArrowDataFrame]) -> ArrowDataFrame:
+    frames = list(frames)
+    return frames[0]._from_native_dataframe(
+        get_pyarrow().concat_tables([frame._native_dataframe for frame in frames])
+    )
+
+
+def agg_batches(
+    frames: Iterable[ArrowDataFrame],
+    exprs: list[ArrowExpr],
+    plans: list[tuple[ArrowExpr | None, ArrowExpr | None, ExprNode]],
+    keys: list[str],
+    output_names: list[str],
+) -> ArrowDataFrame:
+    """
+    Aggregate each of `frames`, keeping a running state of partial results.
+
+    `plans` are those of `narwhals._pandas_like.expr_node.plan_aggregation`,
+    and each of their aggregations needs to be in `PARTIAL_AGGREGATIONS`.
+    The state has one row per group seen so far, and gets combined with the
+    partial results of each frame as soon as they're computed.
+    """
+    pa = get_pyarrow()
+    input_exprs = [input_expr for input_expr, _, _ in plans if input_expr is not None]
+    # Names of the partial results of each output, and how to combine them.
+    partial_columns: list[list[tuple[str, str, str]]] = []
+    taken = list(keys)
+    for expr, (_, _, node) in zip(exprs, plans):
+        assert expr._output_names is not None
+        for _ in expr._output_names:
+            columns = []
+            for partial_function, combine_function in PARTIAL_AGGREGATIONS[node.op]:
+                name = generate_unique_token(8, taken)
+                taken.append(name)
+                columns.append((name, partial_function, combine_function))
+            partial_columns.append(columns)
+
+    def aggregate_frame(frame: ArrowDataFrame) -> Any:
+        native = frame._native_dataframe
+        evaluated = iter(evaluate_into_exprs(frame, *input_exprs))  # type: ignore[arg-type]
+        arrays = [native[key] for key in keys]
+        aggregations = []
+        outputs = iter(partial_columns)
+        for expr, (input_expr, _, _) in zip(exprs, plans):
+            for _ in expr._output_names:  # type: ignore[union-attr]
+                if input_expr is None:
+                    # e.g. agg(nw.len()): any column will do to count the rows.
+                    column = native[keys[0]]
+                else:
+                    column = next(evaluated)._native_series
+                for name, partial_function, _ in next(outputs):
+                    arrays.append(column)
+                    aggregations.append((name, partial_function))
+        table = pa.Table.from_arrays(
+            arrays, names=[*keys, *(name for name, _ in aggregations)]
+        )
+        return _group_by(table, keys, aggregations)
+
+    combine = [
+        (name, combine_function)
+        for columns in partial_columns
+        for name, _, combine_function in columns
+    ]
+    state = None
+    for frame in frames:
+        partial = aggregate_frame(frame)
+        if state is None:
+            state = partial
+        else:
+            state = _group_by(pa.concat_tables([state, partial]), keys, combine)
+
+    assert state is not None  # `ArrowBatchSource.frames` yields at least one frame
+    result = [state[key] for key in keys]
+    for columns in partial_columns:
+        if len(columns) == 1:
+            result.append(state[columns[0][0]])
+        else:
+            result.append(_mean(state[columns[0][0]], state[columns[1][0]]))
+    return frame._from_native_dataframe(pa.Table.from_arrays(result, names=output_names))
+
+
+def _group_by(table: Any, keys: list[str], aggregations: list[tuple[str, str]]) -> Any:
+    """Aggregate `table` by `keys`, naming each aggregation after its column."""
+    pa = get_pyarrow()
+    pc = get_pyarrow_compute()
+    options = {
+        "sum": ("sum", pc.ScalarAggregateOptions(min_count=0)),
+        "any": ("any", pc.ScalarAggregateOptions(min_count=0)),
+        "all": ("all", pc.ScalarAggregateOptions(min_count=0)),
+        "count_all": ("count", pc.CountOptions(mode="all")),
+    }
+    result = table.group_by(keys).aggregate(
+        [
+            (name, *options.get(function, (function, None)))
+            for name, function in aggregations
+        ]
+    )
+    # Where the keys end up depends on the version of PyArrow, but the
+    # aggregations are always in order.
+    aggregated = [
+        column
+        for name, column in zip(result.column_names, result.columns)
+        if name not in keys
+    ]
+    return pa.Table.from_arrays(
+        [*(result[key] for key in keys), *aggregated],
+        names=[*keys, *(name for name, _ in aggregations)],
+    )
+
+
+def _mean(total: Any, count: Any) -> Any:
+    pa = get_pyarrow()
+    pc = get_pyarrow_compute()
+    # Groups with no (non-null) values have a null mean, rather than NaN.
+    count = pc.if_else(pc.equal(count, 0), pa.scalar(None, count.type), count)
+    return pc.divide(pc.cast(total, pa.float64()), count)
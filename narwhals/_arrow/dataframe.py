@@ -1,24 +1,30 @@
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Iterable
+from typing import Iterator
 from typing import Sequence
 from typing import overload
 
 from narwhals._arrow.utils import translate_dtype
 from narwhals._arrow.utils import validate_dataframe_comparand
 from narwhals._pandas_like.utils import evaluate_into_exprs
+from narwhals._pandas_like.utils import numpy_result_type
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pyarrow
+from narwhals.profiling import profiled
 from narwhals.utils import flatten
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from narwhals._arrow.group_by import ArrowGroupBy
     from narwhals._arrow.namespace import ArrowNamespace
     from narwhals._arrow.series import ArrowSeries
     from narwhals._arrow.typing import IntoArrowExpr
+    from narwhals._lazy.dataframe import LazyPlanFrame
     from narwhals.dtypes import DType
 
 
@@ -30,6 +36,7 @@ class ArrowDataFrame:
         self._native_dataframe = native_dataframe
         self._implementation = "arrow"  # for compatibility with PandasDataFrame
         self._backend_version = backend_version
+        self._expr_cache: dict[Any, list[ArrowSeries]] | None = None
 
     def __narwhals_namespace__(self) -> ArrowNamespace:
         from narwhals._arrow.namespace import ArrowNamespace
@@ -42,8 +49,8 @@ class ArrowDataFrame:
     def __narwhals_dataframe__(self) -> Self:
         return self
 
-    def __narwhals_lazyframe__(self) -> Self:
-        return self
+    def __narwhals_lazyframe__(self) -> LazyPlanFrame:
+        return self.lazy()
 
     def _from_native_dataframe(self, df: Any) -> Self:
         return self.__class__(df, backend_version=self._backend_version)
@@ -59,10 +66,27 @@ class ArrowDataFrame:
         self, *, named: bool = False
     ) -> list[tuple[Any, ...]] | list[dict[str, Any]]:
         if not named:
-            msg = "Unnamed rows are not yet supported on PyArrow tables"
-            raise NotImplementedError(msg)
+            return list(
+                zip(*(column.to_pylist() for column in self._native_dataframe.columns))
+            )
         return self._native_dataframe.to_pylist()  # type: ignore[no-any-return]
 
+    def iter_rows(
+        self,
+        *,
+        named: bool = False,
+        buffer_size: int = 512,
+    ) -> Iterator[tuple[Any, ...]] | Iterator[dict[str, Any]]:
+        table = self._native_dataframe
+        # Convert `buffer_size` rows at a time, so that only those get held
+        # as Python objects.
+        for offset in range(0, len(table), buffer_size):
+            buffer = table.slice(offset, buffer_size)
+            if not named:
+                yield from zip(*(column.to_pylist() for column in buffer.columns))
+            else:
+                yield from buffer.to_pylist()
+
     @overload
     def __getitem__(self, item: str) -> ArrowSeries: ...
 
@@ -112,6 +136,7 @@ class ArrowDataFrame:
     def columns(self) -> list[str]:
         return self._native_dataframe.schema.names  # type: ignore[no-any-return]
 
+    @profiled("select")
     def select(
         self,
         *exprs: IntoArrowExpr,
@@ -128,6 +153,7 @@ class ArrowDataFrame:
         df = pa.Table.from_arrays([s._native_series for s in new_series], names=names)
         return self._from_native_dataframe(df)
 
+    @profiled("with_columns")
     def with_columns(
         self,
         *exprs: IntoArrowExpr,
@@ -142,7 +168,7 @@ class ArrowDataFrame:
             if name in new_column_name_to_new_column_map:
                 to_concat.append(
                     validate_dataframe_comparand(
-                        new_column_name_to_new_column_map.pop(name)
+                        len(self), new_column_name_to_new_column_map.pop(name)
                     )
                 )
             else:
@@ -150,12 +176,34 @@ class ArrowDataFrame:
             output_names.append(name)
         for s in new_column_name_to_new_column_map:
             to_concat.append(
-                validate_dataframe_comparand(new_column_name_to_new_column_map[s])
+                validate_dataframe_comparand(
+                    len(self), new_column_name_to_new_column_map[s]
+                )
             )
             output_names.append(s)
         df = self._native_dataframe.__class__.from_arrays(to_concat, names=output_names)
         return self._from_native_dataframe(df)
 
+    @profiled("filter")
+    def filter(
+        self,
+        *predicates: IntoArrowExpr | Iterable[IntoArrowExpr],
+    ) -> Self:
+        plx = self.__narwhals_namespace__()
+        expr = plx.all_horizontal(*predicates)
+        # Safety: all_horizontal's expression only returns a single column.
+        mask = evaluate_into_exprs(self, expr)[0]  # type: ignore[arg-type]
+        if len(mask) == 1:
+            # A single value (e.g. from a reduction) applies to every row.
+            rows = len(self) if mask[0].as_py() else 0
+            return self._from_native_dataframe(self._native_dataframe.slice(0, rows))
+        return self._from_native_dataframe(
+            self._native_dataframe.filter(mask._native_series)
+        )
+
+    def head(self, n: int) -> Self:
+        return self._from_native_dataframe(self._native_dataframe.slice(0, n))
+
     def drop(self, *columns: str | Iterable[str]) -> Self:
         return self._from_native_dataframe(
             self._native_dataframe.drop(list(flatten(columns)))
@@ -164,6 +212,7 @@ class ArrowDataFrame:
     def drop_nulls(self) -> Self:
         return self._from_native_dataframe(self._native_dataframe.drop_null())
 
+    @profiled("sort")
     def sort(
         self,
         by: str | Iterable[str],
@@ -183,16 +232,82 @@ class ArrowDataFrame:
             ]
         return self._from_native_dataframe(df.sort_by(sorting=sorting))
 
+    def group_by(self, *keys: str | Iterable[str]) -> ArrowGroupBy:
+        from narwhals._arrow.group_by import ArrowGroupBy
+
+        return ArrowGroupBy(self, flatten(keys))
+
     def to_pandas(self) -> Any:
         return self._native_dataframe.to_pandas()
 
-    def lazy(self) -> Self:
-        return self
+    def to_numpy(self) -> Any:
+        np = get_numpy()
+        table = self._native_dataframe
+        # The dtype of each column in NumPy, as `ChunkedArray.to_numpy` returns
+        # it: integers with nulls become floats, and booleans with nulls objects.
+        dtypes = []
+        for column in table.columns:
+            dtype = column.slice(0, 0).to_numpy().dtype
+            if column.null_count and dtype.kind in "iu":
+                dtype = np.dtype("float64")
+            elif column.null_count and dtype.kind == "b":
+                dtype = np.dtype("object")
+            dtypes.append(dtype)
+        # Fill a single array, chunk by chunk, so that at most one chunk of a
+        # column gets converted at a time (and numeric chunks without nulls
+        # don't get converted at all). In Fortran order, each column is
+        # contiguous.
+        result = np.empty(
+            table.shape, dtype=numpy_result_type(dtypes) if dtypes else None, order="F"
+        )
+        for i, (column, dtype) in enumerate(zip(table.columns, dtypes)):
+            offset = 0
+            for chunk in column.chunks:
+                if result.dtype == object and dtype.kind in "mM":
+                    # e.g. `datetime`s, rather than integers.
+                    values = chunk.to_pylist()
+                else:
+                    values = chunk.to_numpy(zero_copy_only=False)
+                result[offset : offset + len(chunk), i] = values
+                offset += len(chunk)
+        return result
+
+    def write_parquet(  # noqa: PLR0913
+        self,
+        file: Any,
+        *,
+        compression: str,
+        compression_level: int | None,
+        statistics: bool,
+        row_group_size: int | None,
+        partition_by: list[str] | None,
+        use_dictionary: bool,
+    ) -> Any:
+        from narwhals._arrow.parquet import write_options
+        from narwhals._arrow.parquet import write_table
+
+        write_table(
+            self._native_dataframe,
+            file,
+            partition_by=partition_by,
+            row_group_size=row_group_size,
+            options=write_options(
+                compression=compression,
+                compression_level=compression_level,
+                statistics=statistics,
+                use_dictionary=use_dictionary,
+            ),
+        )
 
-    def collect(self) -> ArrowDataFrame:
-        return ArrowDataFrame(
-            self._native_dataframe, backend_version=self._backend_version
+    def write_ipc(self, file: Any, *, compression: str) -> Any:
+        import_module("pyarrow.feather").write_feather(
+            self._native_dataframe, file, compression=compression
         )
 
+    def lazy(self) -> LazyPlanFrame:
+        from narwhals._lazy.dataframe import LazyPlanFrame
+
+        return LazyPlanFrame.from_dataframe(self)
+
     def clone(self) -> Self:
         raise NotImplementedError("clone is not yet supported on PyArrow tables")
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 
+from narwhals._pandas_like.expr_node import ExprNode
+from narwhals._pandas_like.utils import evaluate_expr
 from narwhals._pandas_like.utils import reuse_series_implementation
 from narwhals._pandas_like.utils import reuse_series_namespace_implementation
 
@@ -25,6 +27,8 @@ class ArrowExpr:
         function_name: str,
         root_names: list[str] | None,
         output_names: list[str] | None,
+        is_elementwise: bool,
+        node: ExprNode,
         backend_version: tuple[int, ...],
     ) -> None:
         self._call = call
@@ -33,6 +37,10 @@ class ArrowExpr:
         self._root_names = root_names
         self._depth = depth
         self._output_names = output_names
+        self._is_elementwise = is_elementwise
+        # The operation this expression applies, along with its inputs.
+        self._node = node
+        node.expr = self
         self._implementation = "arrow"
         self._backend_version = backend_version
 
@@ -67,6 +75,8 @@ class ArrowExpr:
             function_name="col",
             root_names=list(column_names),
             output_names=list(column_names),
+            is_elementwise=True,
+            node=ExprNode("col", *column_names),
             backend_version=backend_version,
         )
 
@@ -84,9 +94,51 @@ class ArrowExpr:
     def __mul__(self, other: ArrowExpr | Any) -> Self:
         return reuse_series_implementation(self, "__mul__", other)  # type: ignore[type-var]
 
+    def __eq__(self, other: ArrowExpr | Any) -> Self:  # type: ignore[override]
+        return reuse_series_implementation(self, "__eq__", other)  # type: ignore[type-var]
+
+    def __ne__(self, other: ArrowExpr | Any) -> Self:  # type: ignore[override]
+        return reuse_series_implementation(self, "__ne__", other)  # type: ignore[type-var]
+
+    def __lt__(self, other: ArrowExpr | Any) -> Self:
+        return reuse_series_implementation(self, "__lt__", other)  # type: ignore[type-var]
+
+    def __le__(self, other: ArrowExpr | Any) -> Self:
+        return reuse_series_implementation(self, "__le__", other)  # type: ignore[type-var]
+
+    def __gt__(self, other: ArrowExpr | Any) -> Self:
+        return reuse_series_implementation(self, "__gt__", other)  # type: ignore[type-var]
+
+    def __ge__(self, other: ArrowExpr | Any) -> Self:
+        return reuse_series_implementation(self, "__ge__", other)  # type: ignore[type-var]
+
+    def __and__(self, other: ArrowExpr | Any) -> Self:
+        return reuse_series_implementation(self, "__and__", other)  # type: ignore[type-var]
+
+    def __or__(self, other: ArrowExpr | Any) -> Self:
+        return reuse_series_implementation(self, "__or__", other)  # type: ignore[type-var]
+
+    def __invert__(self) -> Self:
+        return reuse_series_implementation(self, "__invert__")  # type: ignore[type-var]
+
     def mean(self) -> Self:
         return reuse_series_implementation(self, "mean", returns_scalar=True)  # type: ignore[type-var]
 
+    def sum(self) -> Self:
+        return reuse_series_implementation(self, "sum", returns_scalar=True)  # type: ignore[type-var]
+
+    def min(self) -> Self:
+        return reuse_series_implementation(self, "min", returns_scalar=True)  # type: ignore[type-var]
+
+    def max(self) -> Self:
+        return reuse_series_implementation(self, "max", returns_scalar=True)  # type: ignore[type-var]
+
+    def len(self) -> Self:
+        return reuse_series_implementation(self, "len", returns_scalar=True)  # type: ignore[type-var]
+
+    def n_unique(self) -> Self:
+        return reuse_series_implementation(self, "n_unique", returns_scalar=True)  # type: ignore[type-var]
+
     def std(self, ddof: int = 1) -> Self:
         return reuse_series_implementation(self, "std", ddof=ddof, returns_scalar=True)  # type: ignore[type-var]
 
@@ -97,10 +149,13 @@ class ArrowExpr:
         return reuse_series_implementation(self, "abs")  # type: ignore[type-var]
 
     def diff(self) -> Self:
-        return reuse_series_implementation(self, "diff")  # type: ignore[type-var]
+        return reuse_series_implementation(self, "diff", is_elementwise=False)  # type: ignore[type-var]
 
     def cum_sum(self) -> Self:
-        return reuse_series_implementation(self, "cum_sum")  # type: ignore[type-var]
+        return reuse_series_implementation(self, "cum_sum", is_elementwise=False)  # type: ignore[type-var]
+
+    def is_null(self) -> Self:
+        return reuse_series_implementation(self, "is_null")  # type: ignore[type-var]
 
     def any(self) -> Self:
         return reuse_series_implementation(self, "any", returns_scalar=True)  # type: ignore[type-var]
@@ -112,11 +167,13 @@ class ArrowExpr:
         # Define this one manually, so that we can
         # override `output_names` and not increase depth
         return self.__class__(
-            lambda df: [series.alias(name) for series in self._call(df)],
+            lambda df: [series.alias(name) for series in evaluate_expr(df, self)],  # type: ignore[arg-type, misc]
             depth=self._depth,
             function_name=self._function_name,
             root_names=self._root_names,
             output_names=[name],
+            is_elementwise=self._is_elementwise,
+            node=ExprNode("alias", self._node, name),
             backend_version=self._backend_version,
         )
 
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from copy import copy
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
+from narwhals._pandas_like.expr_node import plan_aggregation
+from narwhals._pandas_like.utils import evaluate_into_exprs
+from narwhals._pandas_like.utils import generate_unique_token
+from narwhals._pandas_like.utils import parse_into_exprs
+from narwhals.dependencies import get_pyarrow
+from narwhals.dependencies import get_pyarrow_compute
+from narwhals.profiling import profiled
+
+if TYPE_CHECKING:
+    from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._arrow.expr import ArrowExpr
+    from narwhals._arrow.typing import IntoArrowExpr
+    from narwhals._pandas_like.expr_node import ExprNode
+
+# Hash aggregations for each narwhals aggregation: given its node, return the
+# name of the Arrow function and its options.
+POLARS_TO_ARROW_AGGREGATIONS: dict[str, Callable[[ExprNode], tuple[str, Any]]] = {
+    "sum": lambda _node: (
+        "sum",
+        get_pyarrow_compute().ScalarAggregateOptions(min_count=0),
+    ),
+    "mean": lambda _node: ("mean", None),
+    "min": lambda _node: ("min", None),
+    "max": lambda _node: ("max", None),
+    "std": lambda node: (
+        "stddev",
+        get_pyarrow_compute().VarianceOptions(ddof=node.kwargs["ddof"]),
+    ),
+    "any": lambda _node: (
+        "any",
+        get_pyarrow_compute().ScalarAggregateOptions(min_count=0),
+    ),
+    "all": lambda _node: (
+        "all",
+        get_pyarrow_compute().ScalarAggregateOptions(min_count=0),
+    ),
+    "len": lambda _node: ("count", get_pyarrow_compute().CountOptions(mode="all")),
+    "n_unique": lambda _node: (
+        "count_distinct",
+        get_pyarrow_compute().CountOptions(mode="all"),
+    ),
+}
+
+
+class ArrowGroupBy:
+    def __init__(self, df: ArrowDataFrame, keys: list[str]) -> None:
+        self._df = df
+        self._keys = list(keys)
+
+    @profiled("group_by.agg")
+    def agg(
+        self,
+        *aggs: IntoArrowExpr | Iterable[IntoArrowExpr],
+        **named_aggs: IntoArrowExpr,
+    ) -> ArrowDataFrame:
+        exprs = parse_into_exprs(
+            "arrow",
+            *aggs,  # type: ignore[arg-type]
+            backend_version=self._df._backend_version,
+            **named_aggs,  # type: ignore[arg-type]
+        )
+        output_names: list[str] = copy(self._keys)
+        for expr in exprs:
+            if expr._output_names is None:
+                msg = (
+                    "Anonymous expressions are not supported in group_by.agg.\n"
+                    "Instead of `nw.all()`, try using a named expression, such as "
+                    "`nw.col('a', 'b')`\n"
+                )
+                raise ValueError(msg)
+            output_names.extend(expr._output_names)
+
+        return agg_arrow(
+            self._df,
+            exprs,  # type: ignore[arg-type]
+            self._keys,
+            output_names,
+        )
+
+
+def agg_arrow(
+    df: ArrowDataFrame,
+    exprs: list[ArrowExpr],
+    keys: list[str],
+    output_names: list[str],
+) -> ArrowDataFrame:
+    """
+    Aggregate using `pyarrow.Table.group_by`.
+
+    Aggregations of columns map directly onto Arrow's hash aggregations.
+    Aggregations of other elementwise expressions (e.g. `(nw.col('a') * 2).sum()`)
+    get their inputs pre-projected as temporary columns first.
+    """
+    pa = get_pyarrow()
+    native = df._native_dataframe
+    plans = []
+    for expr in exprs:
+        plan = plan_aggregation(expr, POLARS_TO_ARROW_AGGREGATIONS)
+        if plan is None:
+            msg = (
+                f"Unsupported aggregation for PyArrow group-by: {expr._node}.\n\n"
+                "Hint: aggregations of elementwise expressions, such as\n\n"
+                "    df.group_by('a').agg((nw.col('b') * 2).sum())\n\n"
+                "are supported, but aggregations which depend on other "
+                "aggregations or on row order aren't."
+            )
+            raise ValueError(msg)
+        plans.append(plan)
+
+    # Everything gets pre-projected in one go, so that common subexpressions
+    # only get evaluated once.
+    to_evaluate = [
+        input_expr
+        for input_expr, _, _ in plans
+        if input_expr is not None and input_expr._node.op != "col"
+    ]
+    evaluated = iter(evaluate_into_exprs(df, *to_evaluate))  # type: ignore[arg-type]
+
+    table = native
+    aggregations: list[tuple[str, str, Any]] = []
+    for expr, (input_expr, _, node) in zip(exprs, plans):
+        assert expr._output_names is not None
+        if input_expr is None:
+            # e.g. agg(nw.len()): any column will do to count the rows.
+            columns = [keys[0]] * len(expr._output_names)
+        elif input_expr._node.op != "col":
+            columns = []
+            for _ in expr._output_names:
+                name = generate_unique_token(8, table.column_names)
+                table = table.append_column(name, next(evaluated)._native_series)
+                columns.append(name)
+        else:
+            columns = list(input_expr._node.args)
+        function_name, options = POLARS_TO_ARROW_AGGREGATIONS[node.op](node)
+        aggregations.extend((column, function_name, options) for column in columns)
+
+    # PyArrow names aggregations `<column>_<function>`, which could be the name
+    # of a key (e.g. `group_by('b_sum').agg(nw.col('b').sum())`). Grouping by
+    # copies of the keys named after tokens, which have no underscores, avoids
+    # that.
+    key_tokens = []
+    for key in keys:
+        token = generate_unique_token(8, table.column_names)
+        table = table.append_column(token, table[key])
+        key_tokens.append(token)
+    result = table.group_by(key_tokens).aggregate(aggregations)
+    # Where the keys end up depends on the version of PyArrow, but the
+    # aggregations are always in order.
+    aggregated = [
+        column
+        for name, column in zip(result.column_names, result.columns)
+        if name not in key_tokens
+    ]
+    return df._from_native_dataframe(
+        pa.Table.from_arrays(
+            [*(result[token] for token in key_tokens), *aggregated],
+            names=output_names,
+        )
+    )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Iterable
 
 from narwhals import dtypes
 from narwhals._arrow.expr import ArrowExpr
+from narwhals._pandas_like.expr_node import ExprNode
+from narwhals._pandas_like.utils import parse_into_exprs
 from narwhals.utils import flatten
 
 if TYPE_CHECKING:
@@ -14,6 +17,7 @@ if TYPE_CHECKING:
     from narwhals._arrow.dataframe import ArrowDataFrame
     from narwhals._arrow.expr import ArrowExpr
     from narwhals._arrow.series import ArrowSeries
+    from narwhals._arrow.typing import IntoArrowExpr
 
 
 class ArrowNamespace:
@@ -45,6 +49,8 @@ class ArrowNamespace:
         function_name: str,
         root_names: list[str] | None,
         output_names: list[str] | None,
+        is_elementwise: bool,
+        node: ExprNode,
     ) -> ArrowExpr:
         from narwhals._arrow.expr import ArrowExpr
 
@@ -54,6 +60,8 @@ class ArrowNamespace:
             function_name=function_name,
             root_names=root_names,
             output_names=output_names,
+            is_elementwise=is_elementwise,
+            node=node,
             backend_version=self._backend_version,
         )
 
@@ -66,6 +74,8 @@ class ArrowNamespace:
             function_name="series",
             root_names=None,
             output_names=None,
+            is_elementwise=False,
+            node=ExprNode("series", series),
             backend_version=self._backend_version,
         )
 
@@ -109,5 +119,42 @@ class ArrowNamespace:
             function_name="all",
             root_names=None,
             output_names=None,
+            is_elementwise=True,
+            node=ExprNode("all"),
             backend_version=self._backend_version,
         )
+
+    # --- reduction ---
+    def len(self) -> ArrowExpr:
+        from narwhals._arrow.expr import ArrowExpr
+        from narwhals._arrow.series import ArrowSeries
+
+        return ArrowExpr(
+            lambda df: [
+                ArrowSeries._from_iterable(
+                    [len(df._native_dataframe)],
+                    name="len",
+                    backend_version=df._backend_version,
+                )
+            ],
+            depth=0,
+            function_name="len",
+            root_names=None,
+            output_names=["len"],
+            is_elementwise=False,
+            node=ExprNode("len"),
+            backend_version=self._backend_version,
+        )
+
+    # --- horizontal ---
+    def all_horizontal(
+        self, *exprs: IntoArrowExpr | Iterable[IntoArrowExpr]
+    ) -> ArrowExpr:
+        return reduce(  # type: ignore[return-value]
+            lambda x, y: x & y,
+            parse_into_exprs(
+                "arrow",
+                *exprs,  # type: ignore[arg-type]
+                backend_version=self._backend_version,
+            ),
+        )
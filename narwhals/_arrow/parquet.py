@@ -0,0 +1,121 @@
+"""Writing Parquet files with PyArrow.
+
+The PyArrow backend writes Parquet files with `pyarrow.parquet`, and the
+pandas-like backends with `to_parquet`, which passes the same options on to
+PyArrow. Readers skip whole row groups whose statistics rule out their
+filters, and the directories of hive-partitioned datasets (`key=value/`)
+which don't match, so statistics get written unless turned off.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from itertools import chain
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from uuid import uuid4
+
+from narwhals.dependencies import get_pyarrow
+from narwhals.dependencies import get_pyarrow_parquet
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from narwhals._arrow.dataframe import ArrowDataFrame
+
+# PyArrow's default maximum number of rows per row group.
+DEFAULT_ROW_GROUP_SIZE = 1024 * 1024
+
+
+def write_options(
+    *,
+    compression: str,
+    compression_level: int | None,
+    statistics: bool,
+    use_dictionary: bool,
+) -> dict[str, Any]:
+    """Options for `pyarrow.parquet.write_table`, from those of `write_parquet`."""
+    return {
+        # Polars calls it "uncompressed".
+        "compression": "none" if compression == "uncompressed" else compression,
+        "compression_level": compression_level,
+        "write_statistics": statistics,
+        "use_dictionary": use_dictionary,
+    }
+
+
+def write_table(
+    table: Any,
+    file: Any,
+    *,
+    partition_by: list[str] | None,
+    row_group_size: int | None,
+    options: dict[str, Any],
+) -> None:
+    pq = get_pyarrow_parquet()
+    if partition_by:
+        pq.write_to_dataset(
+            table,
+            file,
+            partition_cols=partition_by,
+            row_group_size=row_group_size,
+            **options,
+        )
+    else:
+        pq.write_table(table, file, row_group_size=row_group_size, **options)
+
+
+def write_batches(
+    frames: Iterable[ArrowDataFrame],
+    file: str | Path,
+    *,
+    partition_by: list[str] | None,
+    row_group_size: int | None,
+    options: dict[str, Any],
+) -> None:
+    """Write `frames` as they come, rather than concatenating them first.
+
+    At most a row group's worth of rows (per partition) gets held in memory:
+    small frames get gathered into full row groups, so that each of them has
+    useful statistics. There needs to be at least one frame, as
+    `ArrowBatchSource.frames` always yields.
+    """
+    pa = get_pyarrow()
+    row_group_size = row_group_size or DEFAULT_ROW_GROUP_SIZE
+    frames = iter(frames)
+    first = next(frames)
+    tables = (frame._native_dataframe for frame in chain([first], frames))
+    schema = first._native_dataframe.schema
+    if partition_by:
+        ds = import_module("pyarrow.dataset")
+        batches = (batch for table in tables for batch in table.to_batches())
+        ds.write_dataset(
+            pa.RecordBatchReader.from_batches(schema, batches),
+            file,
+            format="parquet",
+            partitioning=partition_by,
+            partitioning_flavor="hive",
+            file_options=ds.ParquetFileFormat().make_write_options(**options),
+            min_rows_per_group=row_group_size,
+            max_rows_per_group=row_group_size,
+            # Like `pyarrow.parquet.write_to_dataset`, add files to the
+            # partitions rather than overwriting those already there.
+            basename_template=f"{uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        return
+    with get_pyarrow_parquet().ParquetWriter(file, schema, **options) as writer:
+        pending = []
+        rows = 0
+        for table in tables:
+            pending.append(table)
+            rows += table.num_rows
+            if rows >= row_group_size:
+                gathered = pa.concat_tables(pending)
+                full = rows - rows % row_group_size
+                writer.write_table(gathered.slice(0, full), row_group_size=row_group_size)
+                pending = [gathered.slice(full)]
+                rows -= full
+        if rows:
+            writer.write_table(pa.concat_tables(pending), row_group_size=row_group_size)
@@ -75,18 +75,77 @@ class ArrowSeries:
         other = validate_column_comparand(other)
         return self._from_native_series(pc.multiply(self._native_series, other))
 
+    def __eq__(self, other: object) -> Self:  # type: ignore[override]
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.equal(self._native_series, other))
+
+    def __ne__(self, other: object) -> Self:  # type: ignore[override]
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.not_equal(self._native_series, other))
+
+    def __lt__(self, other: Any) -> Self:
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.less(self._native_series, other))
+
+    def __le__(self, other: Any) -> Self:
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.less_equal(self._native_series, other))
+
+    def __gt__(self, other: Any) -> Self:
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.greater(self._native_series, other))
+
+    def __ge__(self, other: Any) -> Self:
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.greater_equal(self._native_series, other))
+
+    def __and__(self, other: Any) -> Self:
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.and_kleene(self._native_series, other))
+
+    def __or__(self, other: Any) -> Self:
+        pc = get_pyarrow_compute()
+        other = validate_column_comparand(other)
+        return self._from_native_series(pc.or_kleene(self._native_series, other))
+
+    def __invert__(self) -> Self:
+        pc = get_pyarrow_compute()
+        return self._from_native_series(pc.invert(self._native_series))
+
     def mean(self) -> int:
         pc = get_pyarrow_compute()
         return pc.mean(self._native_series)  # type: ignore[no-any-return]
 
+    def min(self) -> int:
+        pc = get_pyarrow_compute()
+        return pc.min(self._native_series)  # type: ignore[no-any-return]
+
     def max(self) -> int:
         pc = get_pyarrow_compute()
         return pc.max(self._native_series)  # type: ignore[no-any-return]
 
+    def sum(self) -> int:
+        pc = get_pyarrow_compute()
+        return pc.sum(self._native_series, min_count=0)  # type: ignore[no-any-return]
+
     def std(self, ddof: int = 1) -> int:
         pc = get_pyarrow_compute()
         return pc.stddev(self._native_series, ddof=ddof)  # type: ignore[no-any-return]
 
+    def len(self) -> int:
+        return len(self._native_series)
+
+    def n_unique(self) -> int:
+        pc = get_pyarrow_compute()
+        return pc.count_distinct(self._native_series, mode="all")  # type: ignore[no-any-return]
+
     def __narwhals_namespace__(self) -> ArrowNamespace:
         return ArrowNamespace(backend_version=self._backend_version)
 
@@ -144,6 +203,10 @@ class ArrowSeries:
         pc = get_pyarrow_compute()
         return pc.all(self._native_series)  # type: ignore[no-any-return]
 
+    def is_null(self) -> Self:
+        pc = get_pyarrow_compute()
+        return self._from_native_series(pc.is_null(self._native_series))
+
     def is_empty(self) -> bool:
         return len(self) == 0
 
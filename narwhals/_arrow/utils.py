@@ -123,11 +123,13 @@ def validate_column_comparand(other: Any) -> Any:
     return other
 
 
-def validate_dataframe_comparand(other: Any) -> Any:
+def validate_dataframe_comparand(length: int, other: Any) -> Any:
     """Validate RHS of binary operation.
 
     If the comparison isn't supported, return `NotImplemented` so that the
     "right-hand-side" operation (e.g. `__radd__`) can be tried.
+
+    Series of length 1 get broadcast to `length`, the length of the frame.
     """
     from narwhals._arrow.dataframe import ArrowDataFrame
     from narwhals._arrow.series import ArrowSeries
@@ -135,9 +137,9 @@ def validate_dataframe_comparand(other: Any) -> Any:
     if isinstance(other, ArrowDataFrame):
         return NotImplemented
     if isinstance(other, ArrowSeries):
-        if len(other) == 1:
+        if len(other) == 1 and length != 1:
             # broadcast
-            msg = "not implemented yet"  # pragma: no cover
-            raise NotImplementedError(msg)
+            pa = get_pyarrow()
+            return pa.chunked_array([pa.repeat(other[0], length)])
         return other._native_series
     raise AssertionError("Please report a bug")
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import Literal
+from typing import Sequence
+
+from narwhals._lazy.optimize import optimize
+from narwhals._lazy.plan import Clone
+from narwhals._lazy.plan import Concat
+from narwhals._lazy.plan import Drop
+from narwhals._lazy.plan import DropNulls
+from narwhals._lazy.plan import Filter
+from narwhals._lazy.plan import Head
+from narwhals._lazy.plan import Join
+from narwhals._lazy.plan import Rename
+from narwhals._lazy.plan import Scan
+from narwhals._lazy.plan import Select
+from narwhals._lazy.plan import Sort
+from narwhals._lazy.plan import Tail
+from narwhals._lazy.plan import Unique
+from narwhals._lazy.plan import WithColumns
+from narwhals._lazy.plan import WithRowIndex
+from narwhals._lazy.plan import execute
+from narwhals._lazy.stream import stream_frames
+from narwhals._pandas_like.utils import parse_into_exprs
+from narwhals.dependencies import get_cudf
+from narwhals.dependencies import get_modin
+from narwhals.dependencies import get_pandas
+from narwhals.dependencies import get_pyarrow
+from narwhals.profiling import profiled
+from narwhals.utils import flatten
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from narwhals._arrow.namespace import ArrowNamespace
+    from narwhals._lazy.group_by import LazyPlanGroupBy
+    from narwhals._lazy.plan import PlanNode
+    from narwhals._pandas_like.expr import PandasExpr
+    from narwhals._pandas_like.namespace import PandasNamespace
+    from narwhals._pandas_like.typing import IntoPandasExpr
+    from narwhals.dtypes import DType
+
+
+class LazyPlanFrame:
+    """Lazy dataframe for the pandas-like and PyArrow backends.
+
+    Each method records a node in a logical plan (see `narwhals._lazy.plan`),
+    and the plan only gets executed on `collect`.
+    """
+
+    # --- not in the spec ---
+    def __init__(
+        self,
+        plan: PlanNode,
+        *,
+        implementation: str,
+        backend_version: tuple[int, ...],
+    ) -> None:
+        self._plan = plan
+        self._implementation = implementation
+        self._backend_version = backend_version
+        self._collected: Any = None
+
+    @classmethod
+    def from_dataframe(cls: type[Self], df: Any) -> Self:
+        return cls(
+            Scan(df),
+            implementation=df._implementation,
+            backend_version=df._backend_version,
+        )
+
+    def __narwhals_lazyframe__(self) -> Self:
+        return self
+
+    def __narwhals_namespace__(self) -> PandasNamespace | ArrowNamespace:
+        if self._implementation == "arrow":
+            from narwhals._arrow.namespace import ArrowNamespace
+
+            return ArrowNamespace(backend_version=self._backend_version)
+        from narwhals._pandas_like.namespace import PandasNamespace
+
+        return PandasNamespace(self._implementation, self._backend_version)
+
+    def __native_namespace__(self) -> Any:
+        if self._implementation == "pandas":
+            return get_pandas()
+        if self._implementation == "arrow":
+            return get_pyarrow()
+        if self._implementation == "modin":  # pragma: no cover
+            return get_modin()
+        if self._implementation == "cudf":  # pragma: no cover
+            return get_cudf()
+        msg = f"Expected pandas/modin/cudf/arrow, got: {type(self._implementation)}"  # pragma: no cover
+        raise AssertionError(msg)
+
+    def _from_plan(self, plan: PlanNode) -> Self:
+        return self.__class__(
+            plan,
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+        )
+
+    def _parse_into_exprs(
+        self,
+        *exprs: IntoPandasExpr | Iterable[IntoPandasExpr],
+        **named_exprs: IntoPandasExpr,
+    ) -> list[PandasExpr]:
+        return parse_into_exprs(
+            self._implementation,
+            *exprs,
+            backend_version=self._backend_version,
+            **named_exprs,
+        )
+
+    @property
+    def _native_dataframe(self) -> Any:
+        # Converting to native requires materialising the plan.
+        return self.collect()._native_dataframe
+
+    # --- properties ---
+    @property
+    def columns(self) -> list[str]:
+        if (names := self._plan.output_names()) is not None:
+            return names
+        return self.collect().columns  # type: ignore[no-any-return]
+
+    @property
+    def schema(self) -> dict[str, DType]:
+        return self.collect().schema  # type: ignore[no-any-return]
+
+    # --- reshape ---
+    def select(
+        self,
+        *exprs: IntoPandasExpr,
+        **named_exprs: IntoPandasExpr,
+    ) -> Self:
+        exprs = tuple(flatten(exprs))
+        return self._from_plan(
+            Select(
+                self._plan,
+                exprs,
+                named_exprs,
+                self._parse_into_exprs(*exprs, **named_exprs),
+            )
+        )
+
+    def with_columns(
+        self,
+        *exprs: IntoPandasExpr,
+        **named_exprs: IntoPandasExpr,
+    ) -> Self:
+        exprs = tuple(flatten(exprs))
+        return self._from_plan(
+            WithColumns(
+                self._plan,
+                exprs,
+                named_exprs,
+                self._parse_into_exprs(*exprs, **named_exprs),
+            )
+        )
+
+    def filter(
+        self,
+        *predicates: IntoPandasExpr | Iterable[IntoPandasExpr],
+    ) -> Self:
+        predicates = tuple(flatten(predicates))
+        return self._from_plan(
+            Filter(self._plan, predicates, self._parse_into_exprs(*predicates))
+        )
+
+    def drop_nulls(self) -> Self:
+        return self._from_plan(DropNulls(self._plan))
+
+    def with_row_index(self, name: str) -> Self:
+        return self._from_plan(WithRowIndex(self._plan, name))
+
+    def rename(self, mapping: dict[str, str]) -> Self:
+        return self._from_plan(Rename(self._plan, mapping))
+
+    def drop(self, *columns: str | Iterable[str]) -> Self:
+        return self._from_plan(Drop(self._plan, list(flatten(columns))))
+
+    # --- transform ---
+    def sort(
+        self,
+        by: str | Iterable[str],
+        *more_by: str,
+        descending: bool | Sequence[bool] = False,
+    ) -> Self:
+        flat_keys = flatten([*flatten([by]), *more_by])
+        return self._from_plan(Sort(self._plan, flat_keys, descending=descending))
+
+    # --- convert ---
+    @profiled("collect", count_rows_in=False)
+    def collect(self) -> Any:
+        if self._collected is None:
+            self._collected = execute(optimize(self._plan))
+        return self._collected
+
+    def sink_parquet(  # noqa: PLR0913
+        self,
+        path: Any,
+        *,
+        compression: str,
+        compression_level: int | None,
+        statistics: bool,
+        row_group_size: int | None,
+        partition_by: list[str] | None,
+        use_dictionary: bool,
+    ) -> None:
+        if (
+            self._implementation == "arrow"
+            and (frames := stream_frames(optimize(self._plan))) is not None
+        ):
+            from narwhals._arrow.parquet import write_batches
+            from narwhals._arrow.parquet import write_options
+
+            # Write each batch out as it gets computed, without ever holding
+            # the whole result in memory.
+            write_batches(
+                frames,
+                path,
+                partition_by=partition_by,
+                row_group_size=row_group_size,
+                options=write_options(
+                    compression=compression,
+                    compression_level=compression_level,
+                    statistics=statistics,
+                    use_dictionary=use_dictionary,
+                ),
+            )
+            return
+        self.collect().write_parquet(
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            statistics=statistics,
+            row_group_size=row_group_size,
+            partition_by=partition_by,
+            use_dictionary=use_dictionary,
+        )
+
+    def explain(self, *, optimized: bool = True) -> str:
+        from narwhals._lazy.explain import explain
+
+        plan = optimize(self._plan) if optimized else self._plan
+        return explain(
+            plan,
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+        )
+
+    # --- actions ---
+    def group_by(self, *keys: str | Iterable[str]) -> LazyPlanGroupBy:
+        from narwhals._lazy.group_by import LazyPlanGroupBy
+
+        return LazyPlanGroupBy(self, flatten(keys))
+
+    def join(
+        self,
+        other: Self,
+        *,
+        how: Literal["left", "inner", "outer", "cross", "anti", "semi"] = "inner",
+        left_on: str | list[str] | None = None,
+        right_on: str | list[str] | None = None,
+    ) -> Self:
+        if isinstance(left_on, str):
+            left_on = [left_on]
+        if isinstance(right_on, str):
+            right_on = [right_on]
+        other_plan = other._plan if isinstance(other, LazyPlanFrame) else Scan(other)
+        return self._from_plan(
+            Join(self._plan, other_plan, how=how, left_on=left_on, right_on=right_on)
+        )
+
+    # --- partial reduction ---
+    def head(self, n: int) -> Self:
+        return self._from_plan(Head(self._plan, n))
+
+    def tail(self, n: int) -> Self:
+        return self._from_plan(Tail(self._plan, n))
+
+    def unique(self, subset: str | list[str]) -> Self:
+        return self._from_plan(Unique(self._plan, flatten(subset)))
+
+    # --- lazy-only ---
+    def lazy(self) -> Self:
+        return self
+
+    def clone(self) -> Self:
+        return self._from_plan(Clone(self._plan))
+
+    def _concat(self, others: Iterable[LazyPlanFrame], *, how: str) -> Self:
+        return self._from_plan(
+            Concat([self._plan, *(other._plan for other in others)], how=how)
+        )
@@ -0,0 +1,178 @@
+"""Describe how a logical plan will get executed, for `LazyFrame.explain`.
+
+Besides each node of the plan, this reports which strategy the backend will
+pick for it wherever it has a choice between a fast and a slow path, and why.
+The strategies are worked out with the same helpers which the backends use to
+make those choices, so that what gets reported is what will happen.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from narwhals._arrow.group_by import POLARS_TO_ARROW_AGGREGATIONS
+from narwhals._lazy.plan import Aggregate
+from narwhals._lazy.plan import Filter
+from narwhals._lazy.plan import Head
+from narwhals._lazy.plan import Join
+from narwhals._lazy.plan import Select
+from narwhals._lazy.plan import WithColumns
+from narwhals._lazy.stream import streamed_subplans
+from narwhals._pandas_like.expr_node import plan_aggregation
+from narwhals._pandas_like.group_by import plan_pandas_aggregation
+from narwhals._pandas_like.group_by import plan_pandas_window
+from narwhals._pandas_like.utils import supports_cross_join
+from narwhals._pandas_like.utils import with_columns_slow_path
+
+if TYPE_CHECKING:
+    from narwhals._lazy.plan import PlanNode
+    from narwhals._pandas_like.expr import PandasExpr
+
+
+def explain(
+    plan: PlanNode, *, implementation: str, backend_version: tuple[int, ...]
+) -> str:
+    """Return `plan` as an indented tree, with the strategy chosen for each node.
+
+    Subplans which appear more than once (e.g. in a self-join) only get
+    computed once, so they only get described once too.
+    """
+    lines: list[str] = []
+    seen: set[int] = set()
+    streamed = streamed_subplans(plan)
+
+    def _explain(node: PlanNode, depth: int) -> None:
+        indent = "  " * depth
+        if id(node) in seen:
+            lines.append(f"{indent}{node.describe()} (shared, see above)")
+            return
+        seen.add(id(node))
+        lines.append(indent + node.describe())
+        if id(node) in streamed:
+            strategies = _streamed_strategies(node)
+        elif implementation == "arrow":
+            strategies = _arrow_strategies(node)
+        else:
+            strategies = _pandas_strategies(node, implementation, backend_version)
+        lines.extend(f"{indent}  strategy: {strategy}" for strategy in strategies)
+        for input_node in node.inputs:
+            _explain(input_node, depth + 1)
+
+    _explain(plan, 0)
+    return "\n".join(lines)
+
+
+def _pandas_strategies(
+    node: PlanNode, implementation: str, backend_version: tuple[int, ...]
+) -> list[str]:
+    if isinstance(node, WithColumns):
+        strategies = _window_strategies(node.parsed_exprs)
+        reason = with_columns_slow_path([*node.exprs, *node.named_exprs.values()])
+        if reason is not None:
+            strategies.append(f"assign, as {reason}")
+        else:
+            strategies.append(
+                "fast path: concatenate the new columns, as every expression "
+                "returns a full column (unless the frame has fewer than 2 rows)"
+            )
+        return strategies
+    if isinstance(node, Select):
+        return _window_strategies(node.parsed_exprs)
+    if isinstance(node, Filter):
+        strategies = _window_strategies(node.parsed_predicates)
+        if len(node.parsed_predicates) > 1:
+            strategies.append(
+                f"{len(node.parsed_predicates)} predicates combined into a single mask"
+            )
+        return strategies
+    if isinstance(node, Aggregate):
+        return _aggregation_strategies(
+            node.parsed_aggs,
+            plan_pandas_aggregation,
+            fast_path="groupby(...).agg with pandas' own aggregations",
+            fallback="per-group apply (slow)",
+        )
+    if isinstance(node, Join):
+        if node.how == "cross":
+            if supports_cross_join(implementation, backend_version):
+                return ["merge(how='cross')"]
+            return [
+                "merge on a constant key column, as merge(how='cross') isn't "
+                f"available in {implementation} {_format_version(backend_version)}"
+            ]
+        if node.how in {"anti", "semi"}:
+            if len(node.left_on or []) == 1:
+                return ["isin mask on the key, without merging"]
+            return ["MultiIndex.isin mask on the keys, without merging"]
+        return [f"merge(how={node.how!r})"]
+    return []
+
+
+def _streamed_strategies(node: PlanNode) -> list[str]:
+    if isinstance(node, Aggregate):
+        return ["streamed batch by batch, keeping running partial aggregations"]
+    if isinstance(node, Head):
+        return ["streamed batch by batch, until enough rows have been read"]
+    return ["streamed batch by batch"]
+
+
+def _arrow_strategies(node: PlanNode) -> list[str]:
+    if isinstance(node, Aggregate):
+        return _aggregation_strategies(
+            node.parsed_aggs,
+            lambda expr: plan_aggregation(expr, POLARS_TO_ARROW_AGGREGATIONS),
+            fast_path="Table.group_by(...).aggregate with Arrow's hash aggregations",
+            fallback="unsupported, raises",
+        )
+    return []
+
+
+def _aggregation_strategies(
+    exprs: list[PandasExpr],
+    plan: Any,
+    *,
+    fast_path: str,
+    fallback: str,
+) -> list[str]:
+    """Strategies for `group_by(...).agg(*exprs)`, given the backend's planner."""
+    plans = [(expr, plan(expr)) for expr in exprs]
+    complex_exprs = [expr for expr, expr_plan in plans if expr_plan is None]
+    if complex_exprs:
+        return [
+            f"complex aggregation {expr._node} at depth {expr._depth} -> {fallback}"
+            for expr in complex_exprs
+        ]
+    strategies = [fast_path]
+    for expr, (input_expr, mask, _) in plans:
+        if mask is not None:
+            strategies.append(
+                f"{expr._node}: aggregate {input_expr._node} masked by {mask._node}"
+            )
+        elif input_expr is not None and input_expr._node.op != "col":
+            strategies.append(f"{expr._node}: pre-project {input_expr._node}")
+    return strategies
+
+
+def _window_strategies(exprs: list[PandasExpr]) -> list[str]:
+    """Strategies for the window expressions (`over`) within `exprs`."""
+    strategies = []
+    for expr in exprs:
+        for node in expr._node.walk():
+            if node.op != "over":
+                continue
+            inner = node.args[0].expr
+            if plan_pandas_window(inner) is not None:
+                strategies.append(f"{node}: groupby(...).transform, keeping the rows")
+            else:
+                # Anything which can be aggregated simply can also be
+                # transformed, so this falls back to `agg`'s slow path.
+                strategies.append(
+                    f"{node}: complex aggregation at depth {inner._depth} -> "
+                    "per-group apply, joined back (slow)"
+                )
+    return strategies
+
+
+def _format_version(version: tuple[int, ...]) -> str:
+    return ".".join(str(part) for part in version)
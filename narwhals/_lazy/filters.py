@@ -0,0 +1,152 @@
+"""Translation of predicates into filters which Parquet readers understand.
+
+Parquet readers (`pyarrow.dataset`, and `read_parquet` in pandas-like
+libraries) skip the row groups whose statistics show that none of their rows
+can match, and only keep the matching rows of the others. They take filters
+as lists of `(column, op, value)` tuples which all need to hold, e.g.
+`[("a", ">", 1), ("b", "in", ["x", "y"])]`. Predicates comparing a column with
+a literal (possibly several of them, combined with `&`) have such a
+translation; any other predicate stays in a `Filter` above the scan.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+from typing import Any
+from typing import Tuple
+
+from narwhals._pandas_like.expr_node import ExprNode
+from narwhals.dependencies import get_pyarrow
+
+# A condition on a single column, as Parquet readers take them.
+ParquetFilter = Tuple[str, str, Any]
+
+COMPARISONS = {
+    "__eq__": "==",
+    "__ne__": "!=",
+    "__ge__": ">=",
+    "__gt__": ">",
+    "__le__": "<=",
+    "__lt__": "<",
+}
+
+# `lit(1) < col("a")` is `col("a") > 1`.
+SWAPPED = {"==": "==", "!=": "!=", ">=": "<=", ">": "<", "<=": ">=", "<": ">"}
+
+# Stands for operands which aren't literals.
+_NOT_A_LITERAL = object()
+
+# Comparisons for each value of `is_between`'s `closed`.
+BETWEEN = {
+    "both": (">=", "<="),
+    "left": (">=", "<"),
+    "right": (">", "<="),
+    "none": (">", "<"),
+}
+
+
+def parquet_filters(node: ExprNode, schema: Any) -> list[ParquetFilter] | None:
+    """Filters which keep the same rows as the predicate `node`, if there are any.
+
+    `schema` is the Arrow schema of the data. Comparisons only get translated
+    if the literal has the same kind of type as the column (e.g. not a
+    datetime compared with a date column), as readers and backends don't
+    always agree on how to compare values of different kinds.
+    """
+    if node.op == "__and__":
+        left, right = _operands(node)
+        if (left_filters := parquet_filters(left, schema)) is None or (
+            right_filters := parquet_filters(right, schema)
+        ) is None:
+            return None
+        return left_filters + right_filters
+    if node.op in COMPARISONS:
+        left, right = _operands(node)
+        op = COMPARISONS[node.op]
+        if (name := _column_name(left)) is None:
+            name, right, op = _column_name(right), left, SWAPPED[op]
+        value = _literal_value(right)
+        if name is None or not _comparable(schema, name, value):
+            return None
+        return [(name, op, value)]
+    if node.op == "is_in":
+        name, values = _column_name(node.args[0]), _other(node)
+        if (
+            name is None
+            or not isinstance(values, (list, tuple))
+            or not all(_comparable(schema, name, value) for value in values)
+        ):
+            return None
+        return [(name, "in", list(values))]
+    if node.op == "is_between":
+        name = _column_name(node.args[0])
+        lower, upper = node.kwargs["lower_bound"], node.kwargs["upper_bound"]
+        if (
+            name is None
+            or not _comparable(schema, name, lower)
+            or not _comparable(schema, name, upper)
+        ):
+            return None
+        lower_op, upper_op = BETWEEN[node.kwargs["closed"]]
+        return [(name, lower_op, lower), (name, upper_op, upper)]
+    if (name := _column_name(node)) is not None and _is_boolean(schema, name):
+        # Boolean columns on their own.
+        return [(name, "==", True)]
+    return None
+
+
+def _operands(node: ExprNode) -> tuple[Any, Any]:
+    # Some backends pass the other operand by keyword, others positionally.
+    return node.args[0], _other(node)
+
+
+def _other(node: ExprNode) -> Any:
+    if "other" in node.kwargs:
+        return node.kwargs["other"]
+    return node.args[1]
+
+
+def _column_name(operand: Any) -> str | None:
+    if (
+        isinstance(operand, ExprNode)
+        and operand.op == "col"
+        and len(operand.args) == 1
+        and isinstance(operand.args[0], str)
+    ):
+        return operand.args[0]
+    return None
+
+
+def _literal_value(operand: Any) -> Any:
+    if isinstance(operand, ExprNode):
+        if operand.op == "lit" and operand.args[1] is None:
+            return operand.args[0]
+        # Anything else can't be used as a filter value, and neither can
+        # literals which get cast, as that could change the comparison.
+        return _NOT_A_LITERAL
+    return operand
+
+
+def _is_boolean(schema: Any, name: str) -> bool:
+    return _comparable(schema, name, True)
+
+
+def _comparable(schema: Any, name: str, value: Any) -> bool:
+    """Whether `value` has the same kind of type as the column `name` of `schema`."""
+    types = get_pyarrow().types
+    if name not in schema.names:
+        return False
+    dtype = schema.field(name).type
+    if isinstance(value, bool):
+        return types.is_boolean(dtype)  # type: ignore[no-any-return]
+    if isinstance(value, (int, float)):
+        return types.is_integer(dtype) or types.is_floating(dtype)  # type: ignore[no-any-return]
+    if isinstance(value, str):
+        return types.is_string(dtype) or types.is_large_string(dtype)  # type: ignore[no-any-return]
+    if isinstance(value, datetime):
+        return types.is_timestamp(dtype) and dtype.tz is None and value.tzinfo is None
+    if isinstance(value, date):
+        return types.is_date(dtype)  # type: ignore[no-any-return]
+    # Including `None`, which no comparison is true for.
+    return False
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Iterable
+
+from narwhals._lazy.plan import Aggregate
+from narwhals.utils import flatten
+
+if TYPE_CHECKING:
+    from narwhals._lazy.dataframe import LazyPlanFrame
+    from narwhals._pandas_like.typing import IntoPandasExpr
+
+
+class LazyPlanGroupBy:
+    def __init__(self, df: LazyPlanFrame, keys: list[str]) -> None:
+        self._df = df
+        self._keys = list(keys)
+
+    def agg(
+        self,
+        *aggs: IntoPandasExpr | Iterable[IntoPandasExpr],
+        **named_aggs: IntoPandasExpr,
+    ) -> LazyPlanFrame:
+        aggs = tuple(flatten(aggs))
+        return self._df._from_plan(
+            Aggregate(
+                self._df._plan,
+                self._keys,
+                aggs,
+                named_aggs,
+                self._df._parse_into_exprs(*aggs, **named_aggs),
+            )
+        )
@@ -0,0 +1,143 @@
+"""Optimization passes for logical plans.
+
+Each pass takes a plan and returns an equivalent plan which is cheaper to
+execute. Passes never modify nodes in-place.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Tuple
+
+from narwhals._lazy.plan import Filter
+
+if TYPE_CHECKING:
+    from narwhals._lazy.plan import PlanNode
+    from narwhals._pandas_like.expr import PandasExpr
+
+# A predicate as passed by the user, along with its parsed version.
+Predicate = Tuple[Any, "PandasExpr"]
+
+
+def optimize(plan: PlanNode) -> PlanNode:
+    """Run all optimization passes on `plan`."""
+    return pushdown_projections(pushdown_predicates(plan))
+
+
+def pushdown_predicates(plan: PlanNode) -> PlanNode:
+    """Filter rows as early as possible, and fuse consecutive filters.
+
+    Elementwise predicates move down the plan for as long as nodes let them
+    through (see `PlanNode.pushdown_targets`), so that intermediate frames are
+    smaller. Scans which can skip rows as they read them (e.g. of Parquet
+    files) take over the predicates they understand, see
+    `PlanNode.absorb_predicate`. Predicates which end up next to each other
+    get combined into a single filter, so the mask only gets applied once.
+    """
+    # Keep track of rewritten subplans, so that nodes which are shared
+    # (e.g. in a self-join) stay shared if no predicate gets pushed into them.
+    rewritten: dict[int, PlanNode] = {}
+
+    def push(node: PlanNode, predicates: list[Predicate]) -> PlanNode:
+        if not predicates and id(node) in rewritten:
+            return rewritten[id(node)]
+        if isinstance(node, Filter):
+            own = list(zip(node.predicates, node.parsed_predicates))
+            if all(parsed._is_elementwise for _, parsed in own):
+                result = push(node.input, own + predicates)
+            else:
+                # Predicates from above can't go past this filter, as it would
+                # change what non-elementwise predicates (e.g. `a > a.mean()`)
+                # get evaluated on.
+                result = _filter(node.with_inputs(push(node.input, [])), predicates)
+        else:
+            remaining: list[Predicate] = []
+            pushed: list[list[Predicate]] = [[] for _ in node.inputs]
+            new_node = node
+            for predicate in predicates:
+                root_names = predicate[1]._root_names
+                targets = (
+                    [] if root_names is None else node.pushdown_targets(set(root_names))
+                )
+                for target in targets:
+                    pushed[target].append(predicate)
+                if targets:
+                    continue
+                if (absorbed := new_node.absorb_predicate(predicate[1])) is not None:
+                    new_node = absorbed
+                else:
+                    remaining.append(predicate)
+            if node.inputs:
+                new_node = new_node.with_inputs(
+                    *(push(i, p) for i, p in zip(node.inputs, pushed))
+                )
+            result = _filter(new_node, remaining)
+        if not predicates:
+            rewritten[id(node)] = result
+        return result
+
+    return push(plan, [])
+
+
+def pushdown_projections(plan: PlanNode) -> PlanNode:
+    """Only read and compute the columns which are needed to produce the output.
+
+    Works out which columns each node needs from its inputs (based on the
+    root names of expressions and on keys), all the way down to the scans,
+    which then only select what's required. Expressions in `with_columns` and
+    `group_by.agg` whose outputs aren't used get dropped.
+    """
+    nodes = _topological_order(plan)
+    required: dict[int, set[str] | None] = {id(plan): None}
+    # Parents come before children, so by the time we get to a node, we know
+    # everything that its parents need from it.
+    for node in nodes:
+        node_required = required[id(node)]
+        for input_node, input_required in zip(
+            node.inputs, node.required_input_columns(node_required)
+        ):
+            if id(input_node) not in required:
+                required[id(input_node)] = input_required
+            else:
+                previous = required[id(input_node)]
+                required[id(input_node)] = (
+                    None
+                    if previous is None or input_required is None
+                    else previous | input_required
+                )
+
+    projected: dict[int, PlanNode] = {}
+    for node in reversed(nodes):
+        new_node = node
+        if node.inputs:
+            new_node = node.with_inputs(*(projected[id(i)] for i in node.inputs))
+        projected[id(node)] = new_node.project(required[id(node)])
+    return projected[id(plan)]
+
+
+def _filter(node: PlanNode, predicates: list[Predicate]) -> PlanNode:
+    if not predicates:
+        return node
+    return Filter(
+        node,
+        [predicate for predicate, _ in predicates],
+        [parsed for _, parsed in predicates],
+    )
+
+
+def _topological_order(plan: PlanNode) -> list[PlanNode]:
+    """Every node in `plan`, with each node coming before all of its inputs."""
+    order: list[PlanNode] = []
+    seen: set[int] = set()
+
+    def visit(node: PlanNode) -> None:
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        for input_node in node.inputs:
+            visit(input_node)
+        order.append(node)
+
+    visit(plan)
+    return order[::-1]
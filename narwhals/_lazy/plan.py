@@ -0,0 +1,837 @@
+"""Logical query plans for the pandas-like and PyArrow backends.
+
+A plan is a tree of `PlanNode`s. Leaves are `Scan`s of eager (compliant)
+dataframes, `BatchScan`s of sources of Arrow record batches, or
+`ParquetScan`s of Parquet files, and every other node records one dataframe
+method call along with its arguments.
+Nothing is computed until `execute` walks the tree, at which point each node
+calls the corresponding method of the eager dataframe produced by its inputs.
+"""
+
+from __future__ import annotations
+
+from copy import copy
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Sequence
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from narwhals._arrow.batches import ArrowBatchSource
+    from narwhals._lazy.filters import ParquetFilter
+    from narwhals._pandas_like.csv import CsvSource
+    from narwhals._pandas_like.expr import PandasExpr
+    from narwhals._pandas_like.parquet import ParquetSource
+
+
+class PlanNode:
+    """Node of a logical plan.
+
+    Nodes should be treated as immutable: use `with_inputs` to get a copy of a
+    node with different inputs.
+    """
+
+    inputs: tuple[PlanNode, ...] = ()
+
+    def execute(self, *frames: Any) -> Any:
+        """Compute this node, given the evaluated (eager) inputs."""
+        raise NotImplementedError  # pragma: no cover
+
+    def output_names(self) -> list[str] | None:
+        """Output column names, or `None` if they can't be known without executing."""
+        return None
+
+    def describe(self) -> str:
+        """One-line description of this node, for `explain`."""
+        raise NotImplementedError  # pragma: no cover
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        """Columns which each input needs to provide, given the columns needed from
+        this node's output.
+
+        `None` means "all of them". The default is to require everything, which is
+        always correct.
+        """
+        return [None] * len(self.inputs)
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        """Return a version of this node which only computes what's `required`."""
+        return self
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        """Inputs which an elementwise predicate reading `root_names` can move to.
+
+        Filtering the output of this node by such a predicate needs to give the
+        same result as filtering each of the returned inputs. The default is not
+        to let predicates through, which is always correct.
+        """
+        return []
+
+    def absorb_predicate(self, predicate: PandasExpr) -> PlanNode | None:
+        """Return a version of this node which only outputs the rows matching the
+        elementwise `predicate`, or `None` if it can't filter them itself.
+
+        This is for scans which can skip rows as they read them. The default is
+        to leave filtering to a `Filter` node.
+        """
+        return None
+
+    def with_inputs(self, *inputs: PlanNode) -> Self:
+        node = copy(self)
+        node.inputs = inputs
+        return node
+
+    @property
+    def input(self) -> PlanNode:
+        return self.inputs[0]
+
+    def _input_names(self) -> list[str] | None:
+        return self.input.output_names()
+
+
+class Scan(PlanNode):
+    def __init__(self, frame: Any, columns: list[str] | None = None) -> None:
+        self.frame = frame
+        self.columns = columns
+
+    def execute(self, *frames: Any) -> Any:
+        if self.columns is not None:
+            return self.frame.select(*self.columns)
+        return self.frame
+
+    def describe(self) -> str:
+        library = type(self.frame._native_dataframe).__module__.split(".")[0]
+        columns = self.frame.columns
+        if self.columns is None:
+            return f"SCAN {library} [{_format_names(columns)}]"
+        return (
+            f"SCAN {library} [{_format_names(self.columns)}] "
+            f"({len(self.columns)} of {len(columns)} columns)"
+        )
+
+    def output_names(self) -> list[str] | None:
+        if self.columns is not None:
+            return self.columns
+        return self.frame.columns  # type: ignore[no-any-return]
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        names = self.output_names()
+        if required is None or names is None:
+            return self
+        # Always keep at least one column, so that the number of rows is preserved.
+        columns = [name for name in names if name in required] or names[:1]
+        if columns == names:
+            return self
+        return Scan(self.frame, columns)
+
+
+class BatchScan(PlanNode):
+    """Scan of an `ArrowBatchSource` or a `CsvSource`, read one batch at a time."""
+
+    def __init__(
+        self,
+        source: ArrowBatchSource | CsvSource,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> None:
+        self.source = source
+        self.columns = columns
+        self.filters = filters or []
+
+    def execute(self, *frames: Any) -> Any:
+        # Only reached if nothing above this node can be streamed, in which
+        # case all the batches need to be read into a single table.
+        return self.source.read(self.columns, self.filters)
+
+    def describe(self) -> str:
+        description = _describe_scan(
+            self.source.name, self.source.columns, self.columns, self.filters
+        )
+        return f"{description} (streaming)"
+
+    def output_names(self) -> list[str] | None:
+        if self.columns is not None:
+            return self.columns
+        return self.source.columns
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        columns = _project_columns(self.source.columns, self.columns, required)
+        if columns is None:
+            return self
+        return BatchScan(self.source, columns, self.filters)
+
+    def absorb_predicate(self, predicate: PandasExpr) -> PlanNode | None:
+        if (filters := self.source.parquet_filters(predicate)) is None:
+            return None
+        return BatchScan(self.source, self.columns, [*self.filters, *filters])
+
+
+class ParquetScan(PlanNode):
+    """Scan of a Parquet file, read with a pandas-like library's `read_parquet`."""
+
+    def __init__(
+        self,
+        source: ParquetSource,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> None:
+        self.source = source
+        self.columns = columns
+        self.filters = filters or []
+
+    def execute(self, *frames: Any) -> Any:
+        return self.source.read(self.columns, self.filters)
+
+    def describe(self) -> str:
+        return _describe_scan(
+            self.source.name, self.source.columns, self.columns, self.filters
+        )
+
+    def output_names(self) -> list[str] | None:
+        if self.columns is not None:
+            return self.columns
+        return self.source.columns
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        columns = _project_columns(self.source.columns, self.columns, required)
+        if columns is None:
+            return self
+        return ParquetScan(self.source, columns, self.filters)
+
+    def absorb_predicate(self, predicate: PandasExpr) -> PlanNode | None:
+        if (filters := self.source.parquet_filters(predicate)) is None:
+            return None
+        return ParquetScan(self.source, self.columns, [*self.filters, *filters])
+
+
+class Select(PlanNode):
+    def __init__(
+        self,
+        input: PlanNode,  # noqa: A002
+        exprs: Sequence[Any],
+        named_exprs: dict[str, Any],
+        parsed_exprs: list[PandasExpr],
+    ) -> None:
+        self.inputs = (input,)
+        self.exprs = exprs
+        self.named_exprs = named_exprs
+        self.parsed_exprs = parsed_exprs
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].select(*self.exprs, **self.named_exprs)
+
+    def describe(self) -> str:
+        return f"SELECT [{_format_exprs(self.parsed_exprs)}]"
+
+    def output_names(self) -> list[str] | None:
+        return _output_names_of(self.parsed_exprs)
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        # Unused expressions are kept: dropping them could change whether the
+        # remaining ones get broadcast.
+        return [_root_names_of(self.parsed_exprs)]
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        if not all(expr._is_elementwise for expr in self.parsed_exprs):
+            return []
+        # Only columns which are selected as they are can be filtered on upstream.
+        passed_through = {
+            name
+            for expr in self.parsed_exprs
+            if expr._node.op == "col"
+            for name in expr._output_names or []
+        }
+        return [0] if root_names <= passed_through else []
+
+
+class WithColumns(PlanNode):
+    def __init__(
+        self,
+        input: PlanNode,  # noqa: A002
+        exprs: Sequence[Any],
+        named_exprs: dict[str, Any],
+        parsed_exprs: list[PandasExpr],
+    ) -> None:
+        self.inputs = (input,)
+        self.exprs = exprs
+        self.named_exprs = named_exprs
+        self.parsed_exprs = parsed_exprs
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].with_columns(*self.exprs, **self.named_exprs)
+
+    def describe(self) -> str:
+        return f"WITH_COLUMNS [{_format_exprs(self.parsed_exprs)}]"
+
+    def output_names(self) -> list[str] | None:
+        input_names = self._input_names()
+        new_names = _output_names_of(self.parsed_exprs)
+        if input_names is None or new_names is None:
+            return None
+        return [*input_names, *(name for name in new_names if name not in input_names)]
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        if required is None:
+            return [None]
+        kept = [expr for _, expr in _used_exprs(self.parsed_exprs, required)]
+        root_names = _root_names_of(kept)
+        output_names = _output_names_of(kept)
+        if root_names is None or output_names is None:
+            return [None]
+        return [(required - set(output_names)) | root_names]
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        if required is None:
+            return self
+        used = _used_exprs(self.parsed_exprs, required)
+        if not used:
+            return self.input
+        if len(used) == len(self.parsed_exprs):
+            return self
+        exprs, named_exprs = _split_exprs(
+            self.exprs, self.named_exprs, [i for i, _ in used]
+        )
+        return WithColumns(self.input, exprs, named_exprs, [expr for _, expr in used])
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        if not all(expr._is_elementwise for expr in self.parsed_exprs):
+            return []
+        new_names = _output_names_of(self.parsed_exprs)
+        if new_names is None or root_names.intersection(new_names):
+            return []
+        return [0]
+
+
+class Filter(PlanNode):
+    def __init__(
+        self,
+        input: PlanNode,  # noqa: A002
+        predicates: Sequence[Any],
+        parsed_predicates: list[PandasExpr],
+    ) -> None:
+        self.inputs = (input,)
+        self.predicates = predicates
+        self.parsed_predicates = parsed_predicates
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].filter(*self.predicates)
+
+    def describe(self) -> str:
+        return f"FILTER [{_format_exprs(self.parsed_predicates)}]"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [_union(required, _root_names_of(self.parsed_predicates))]
+
+
+class Aggregate(PlanNode):
+    def __init__(  # noqa: PLR0913
+        self,
+        input: PlanNode,  # noqa: A002
+        keys: list[str],
+        aggs: Sequence[Any],
+        named_aggs: dict[str, Any],
+        parsed_aggs: list[PandasExpr],
+    ) -> None:
+        self.inputs = (input,)
+        self.keys = keys
+        self.aggs = aggs
+        self.named_aggs = named_aggs
+        self.parsed_aggs = parsed_aggs
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].group_by(self.keys).agg(*self.aggs, **self.named_aggs)
+
+    def describe(self) -> str:
+        return (
+            f"AGGREGATE [{_format_exprs(self.parsed_aggs)}] "
+            f"BY [{_format_names(self.keys)}]"
+        )
+
+    def output_names(self) -> list[str] | None:
+        agg_names = _output_names_of(self.parsed_aggs)
+        if agg_names is None:
+            return None
+        return [*self.keys, *agg_names]
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        aggs = self.parsed_aggs
+        if required is not None and (used := _used_exprs(aggs, required)):
+            aggs = [expr for _, expr in used]
+        return [_union(set(self.keys), _root_names_of(aggs))]
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        if required is None:
+            return self
+        used = _used_exprs(self.parsed_aggs, required)
+        # Keep at least one aggregation, so that the node remains valid.
+        if not used or len(used) == len(self.parsed_aggs):
+            return self
+        aggs, named_aggs = _split_exprs(self.aggs, self.named_aggs, [i for i, _ in used])
+        return Aggregate(
+            self.input, self.keys, aggs, named_aggs, [expr for _, expr in used]
+        )
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        # Predicates on the keys keep or discard whole groups.
+        return [0] if root_names <= set(self.keys) else []
+
+
+class Join(PlanNode):
+    def __init__(  # noqa: PLR0913
+        self,
+        left: PlanNode,
+        right: PlanNode,
+        *,
+        how: str,
+        left_on: list[str] | None,
+        right_on: list[str] | None,
+    ) -> None:
+        self.inputs = (left, right)
+        self.how = how
+        self.left_on = left_on
+        self.right_on = right_on
+
+    def execute(self, *frames: Any) -> Any:
+        left, right = frames
+        return left.join(
+            right, how=self.how, left_on=self.left_on, right_on=self.right_on
+        )
+
+    def describe(self) -> str:
+        if self.how == "cross":
+            return "CROSS JOIN"
+        return (
+            f"{self.how.upper()} JOIN ON [{_format_names(self.left_on or [])}] "
+            f"= [{_format_names(self.right_on or [])}]"
+        )
+
+    def output_names(self) -> list[str] | None:
+        left_names = self.inputs[0].output_names()
+        right_names = self.inputs[1].output_names()
+        if left_names is None or right_names is None:
+            return None
+        if self.how in {"anti", "semi"}:
+            return left_names
+        merged_keys = self._merged_keys()
+        return [
+            *left_names,
+            *(
+                f"{name}_right" if name in left_names else name
+                for name in right_names
+                if name not in merged_keys
+            ),
+        ]
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        left_on = set(self.left_on or [])
+        right_on = set(self.right_on or [])
+        if self.how in {"anti", "semi"}:
+            return [_union(required, left_on), right_on]
+        left_names = self.inputs[0].output_names()
+        right_names = self.inputs[1].output_names()
+        if required is None or left_names is None or right_names is None:
+            return [None, None]
+        left_required = (required & set(left_names)) | left_on
+        right_required = set(right_on)
+        for name in right_names:
+            if name in left_names and f"{name}_right" in required:
+                right_required.add(name)
+                # The suffix only gets added if the left side has the same name.
+                left_required.add(name)
+            elif name not in left_names and name in required:
+                right_required.add(name)
+        return [left_required, right_required]
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        if self.how not in {"inner", "left", "cross", "anti", "semi"}:
+            return []
+        left_names = self.inputs[0].output_names()
+        right_names = self.inputs[1].output_names()
+        if left_names is None or right_names is None:
+            return []
+        merged_keys = self._merged_keys() if self.how == "inner" else set()
+        if root_names <= merged_keys:
+            # Rows only match if their keys are equal, so both sides can be filtered.
+            return [0, 1]
+        if root_names <= set(left_names):
+            return [0]
+        # Right columns keep their name unless it clashes with a left column.
+        right_only = {name for name in right_names if name not in left_names}
+        if self.how in {"inner", "cross"} and root_names <= right_only | merged_keys:
+            return [1]
+        return []
+
+    def _merged_keys(self) -> set[str]:
+        """Keys which have the same name on both sides, and get merged into one column.
+
+        Any other clashing name gets suffixed with `'_right'`.
+        """
+        if self.how == "cross":
+            return set()
+        return {
+            left_key
+            for left_key, right_key in zip(self.left_on or [], self.right_on or [])
+            if left_key == right_key
+        }
+
+
+class Sort(PlanNode):
+    def __init__(
+        self,
+        input: PlanNode,  # noqa: A002
+        by: list[str],
+        *,
+        descending: bool | Sequence[bool],
+    ) -> None:
+        self.inputs = (input,)
+        self.by = by
+        self.descending = descending
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].sort(self.by, descending=self.descending)
+
+    def describe(self) -> str:
+        return f"SORT BY [{_format_names(self.by)}] descending={self.descending}"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [_union(required, set(self.by))]
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        return [0]
+
+
+class Head(PlanNode):
+    def __init__(self, input: PlanNode, n: int) -> None:  # noqa: A002
+        self.inputs = (input,)
+        self.n = n
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].head(self.n)
+
+    def describe(self) -> str:
+        return f"HEAD {self.n}"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [required]
+
+
+class Tail(PlanNode):
+    def __init__(self, input: PlanNode, n: int) -> None:  # noqa: A002
+        self.inputs = (input,)
+        self.n = n
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].tail(self.n)
+
+    def describe(self) -> str:
+        return f"TAIL {self.n}"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [required]
+
+
+class Drop(PlanNode):
+    def __init__(self, input: PlanNode, columns: list[str]) -> None:  # noqa: A002
+        self.inputs = (input,)
+        self.columns = columns
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].drop(self.columns)
+
+    def describe(self) -> str:
+        return f"DROP [{_format_names(self.columns)}]"
+
+    def output_names(self) -> list[str] | None:
+        input_names = self._input_names()
+        if input_names is None:
+            return None
+        return [name for name in input_names if name not in self.columns]
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        if required is None:
+            # Dropped columns don't need to be read in the first place.
+            return [None if (names := self.output_names()) is None else set(names)]
+        return [required]
+
+    def project(self, required: set[str] | None) -> PlanNode:
+        input_names = self._input_names()
+        if input_names is None:
+            return self
+        columns = [name for name in self.columns if name in input_names]
+        if not columns:
+            return self.input
+        if columns == self.columns:
+            return self
+        return Drop(self.input, columns)
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        return [0]
+
+
+class Rename(PlanNode):
+    def __init__(self, input: PlanNode, mapping: dict[str, str]) -> None:  # noqa: A002
+        self.inputs = (input,)
+        self.mapping = mapping
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].rename(self.mapping)
+
+    def describe(self) -> str:
+        renames = ", ".join(f"{old} -> {new}" for old, new in self.mapping.items())
+        return f"RENAME [{renames}]"
+
+    def output_names(self) -> list[str] | None:
+        input_names = self._input_names()
+        if input_names is None:
+            return None
+        return [self.mapping.get(name, name) for name in input_names]
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        if required is None:
+            return [None]
+        inverse = {new: old for old, new in self.mapping.items()}
+        return [{inverse.get(name, name) for name in required}]
+
+
+class Unique(PlanNode):
+    def __init__(self, input: PlanNode, subset: list[str]) -> None:  # noqa: A002
+        self.inputs = (input,)
+        self.subset = subset
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].unique(self.subset)
+
+    def describe(self) -> str:
+        return f"UNIQUE [{_format_names(self.subset)}]"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [_union(required, set(self.subset))]
+
+
+class DropNulls(PlanNode):
+    def __init__(self, input: PlanNode) -> None:  # noqa: A002
+        self.inputs = (input,)
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].drop_nulls()
+
+    def describe(self) -> str:
+        return "DROP_NULLS"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        return [0]
+
+
+class WithRowIndex(PlanNode):
+    def __init__(self, input: PlanNode, name: str) -> None:  # noqa: A002
+        self.inputs = (input,)
+        self.name = name
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].with_row_index(self.name)
+
+    def describe(self) -> str:
+        return f"WITH_ROW_INDEX {self.name}"
+
+    def output_names(self) -> list[str] | None:
+        input_names = self._input_names()
+        if input_names is None:
+            return None
+        return [self.name, *input_names]
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [None if required is None else required - {self.name}]
+
+
+class Clone(PlanNode):
+    def __init__(self, input: PlanNode) -> None:  # noqa: A002
+        self.inputs = (input,)
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].clone()
+
+    def describe(self) -> str:
+        return "CLONE"
+
+    def output_names(self) -> list[str] | None:
+        return self._input_names()
+
+    def required_input_columns(self, required: set[str] | None) -> list[set[str] | None]:
+        return [required]
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        return [0]
+
+
+class Concat(PlanNode):
+    def __init__(self, inputs: Sequence[PlanNode], *, how: str) -> None:
+        self.inputs = tuple(inputs)
+        self.how = how
+
+    def execute(self, *frames: Any) -> Any:
+        return frames[0].__narwhals_namespace__().concat(frames, how=self.how)
+
+    def describe(self) -> str:
+        return f"CONCAT {self.how}"
+
+    def output_names(self) -> list[str] | None:
+        if self.how == "vertical":
+            return self.inputs[0].output_names()
+        names: list[str] = []
+        for node in self.inputs:
+            if (node_names := node.output_names()) is None:
+                return None
+            names.extend(node_names)
+        return names
+
+    def pushdown_targets(self, root_names: set[str]) -> list[int]:
+        if self.how == "vertical":
+            return list(range(len(self.inputs)))
+        return []
+
+
+def execute(plan: PlanNode) -> Any:
+    """Execute `plan` and return the resulting eager dataframe.
+
+    Subplans which appear more than once (e.g. in a self-join) are only
+    computed once. Subplans reading sources of record batches get streamed
+    where possible (see `narwhals._lazy.stream`).
+    """
+    from narwhals._lazy.stream import streamed_subplans
+
+    results: dict[int, Any] = {}
+    streamed = streamed_subplans(plan)
+
+    def _execute(node: PlanNode) -> Any:
+        if id(node) not in results:
+            if id(node) in streamed:
+                results[id(node)] = streamed[id(node)]()
+            else:
+                results[id(node)] = node.execute(*(_execute(i) for i in node.inputs))
+        return results[id(node)]
+
+    return _execute(plan)
+
+
+def _format_names(names: list[str]) -> str:
+    return ", ".join(names)
+
+
+def _describe_scan(
+    name: str,
+    all_columns: list[str],
+    columns: list[str] | None,
+    filters: list[ParquetFilter],
+) -> str:
+    if columns is None:
+        description = f"SCAN {name} [{_format_names(all_columns)}]"
+    else:
+        description = (
+            f"SCAN {name} [{_format_names(columns)}] "
+            f"({len(columns)} of {len(all_columns)} columns)"
+        )
+    if filters:
+        conditions = " & ".join(
+            f"{column} {op} {value!r}" for column, op, value in filters
+        )
+        description += f" WHERE {conditions}"
+    return description
+
+
+def _project_columns(
+    all_columns: list[str], columns: list[str] | None, required: set[str] | None
+) -> list[str] | None:
+    """Columns for a scan reading `columns` to read, if only `required` are needed.
+
+    Returns `None` if the scan doesn't need to change.
+    """
+    if required is None:
+        return None
+    names = all_columns if columns is None else columns
+    # Always keep at least one column, so that the number of rows is preserved.
+    projected = [name for name in names if name in required] or names[:1]
+    if projected == names:
+        return None
+    return projected
+
+
+def _format_exprs(exprs: list[PandasExpr]) -> str:
+    return ", ".join(str(expr._node) for expr in exprs)
+
+
+def _output_names_of(exprs: list[PandasExpr]) -> list[str] | None:
+    names: list[str] = []
+    for expr in exprs:
+        if expr._output_names is None:
+            return None
+        names.extend(expr._output_names)
+    return names
+
+
+def _root_names_of(exprs: list[PandasExpr]) -> set[str] | None:
+    """Columns which `exprs` read from their input, or `None` if it's not known."""
+    names: set[str] = set()
+    for expr in exprs:
+        if expr._root_names is None:
+            return None
+        names.update(expr._root_names)
+    return names
+
+
+def _union(left: set[str] | None, right: set[str] | None) -> set[str] | None:
+    if left is None or right is None:
+        return None
+    return left | right
+
+
+def _used_exprs(
+    exprs: list[PandasExpr], required: set[str]
+) -> list[tuple[int, PandasExpr]]:
+    """Expressions (with their positions) with at least one output in `required`.
+
+    Expressions whose outputs aren't known are always considered to be used.
+    """
+    return [
+        (i, expr)
+        for i, expr in enumerate(exprs)
+        if expr._output_names is None or required.intersection(expr._output_names)
+    ]
+
+
+def _split_exprs(
+    exprs: Sequence[Any], named_exprs: dict[str, Any], positions: list[int]
+) -> tuple[list[Any], dict[str, Any]]:
+    """Select the (raw) expressions at `positions`.
+
+    Positions refer to the parsed expressions, in which positional expressions
+    come before named ones.
+    """
+    n_exprs = len(exprs)
+    names = list(named_exprs)
+    return (
+        [exprs[i] for i in positions if i < n_exprs],
+        {
+            names[i - n_exprs]: named_exprs[names[i - n_exprs]]
+            for i in positions
+            if i >= n_exprs
+        },
+    )
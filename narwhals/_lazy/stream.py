@@ -0,0 +1,172 @@
+"""Streaming execution of lazy plans over sources of batches.
+
+A subplan gets streamed if it's a chain of operations which can be computed
+on each batch separately (filters, elementwise projections, ...) on top of a
+`BatchScan`, whose source is either one of Arrow record batches or a CSV file
+read by a pandas-like library in chunks. The chain may be topped by a `Head`,
+which stops reading once it has enough rows, or (for Arrow) by an `Aggregate`
+whose aggregations can be combined across batches (see
+`narwhals._arrow.batches`). Each batch then goes through
+the whole chain before the next one gets read, so that only one batch of the
+source is in memory at a time. The rest of the plan runs on the (usually much
+smaller) result of the streamed subplan, as usual. `sink_parquet` writes the
+batches of a plan which is such a chain out as they get computed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+
+from narwhals._arrow.batches import PARTIAL_AGGREGATIONS
+from narwhals._arrow.batches import ArrowBatchSource
+from narwhals._arrow.batches import agg_batches
+from narwhals._arrow.batches import concat_frames
+from narwhals._arrow.dataframe import ArrowDataFrame
+from narwhals._lazy.plan import Aggregate
+from narwhals._lazy.plan import BatchScan
+from narwhals._lazy.plan import Drop
+from narwhals._lazy.plan import DropNulls
+from narwhals._lazy.plan import Filter
+from narwhals._lazy.plan import Head
+from narwhals._lazy.plan import Select
+from narwhals._lazy.plan import WithColumns
+from narwhals._pandas_like.expr_node import plan_aggregation
+
+if TYPE_CHECKING:
+    from narwhals._lazy.plan import PlanNode
+
+
+def streamed_subplans(plan: PlanNode) -> dict[int, Callable[[], Any]]:
+    """Top-most subplans of `plan` which can be streamed.
+
+    Returns the function computing each of them, by the `id` of its root node.
+    Subplans with nodes which appear more than once in `plan` don't get
+    streamed, so that shared nodes still only get computed once (and readers,
+    which can't be rewound, only get read once).
+    """
+    parents: dict[int, int] = {}
+
+    def count_parents(node: PlanNode) -> None:
+        for input_node in node.inputs:
+            parents[id(input_node)] = parents.get(id(input_node), 0) + 1
+            if parents[id(input_node)] == 1:
+                count_parents(input_node)
+
+    count_parents(plan)
+    streamed: dict[int, Callable[[], Any]] = {}
+    seen: set[int] = set()
+
+    def visit(node: PlanNode) -> None:
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        if (run := _stream(node, parents)) is not None:
+            streamed[id(node)] = run
+            return
+        for input_node in node.inputs:
+            visit(input_node)
+
+    visit(plan)
+    return streamed
+
+
+def stream_frames(plan: PlanNode) -> Iterator[Any] | None:
+    """The result of `plan` batch by batch, if it can be computed that way.
+
+    This is the case for chains of operations which can be computed on each
+    batch separately on top of a `BatchScan`, e.g. to write them out as they
+    get computed.
+    """
+    chain, scan = _chain(plan)
+    if not isinstance(scan, BatchScan):
+        return None
+    return _frames(chain, scan)
+
+
+def _stream(node: PlanNode, parents: dict[int, int]) -> Callable[[], Any] | None:
+    terminal = node if isinstance(node, (Aggregate, Head)) else None
+    chain, scan = _chain(node if terminal is None else node.input)
+    if not isinstance(scan, BatchScan) or (
+        # Unless it filters rows as they get read, a scan on its own just
+        # gets all the batches.
+        terminal is None and not chain and not scan.filters
+    ):
+        return None
+    if any(parents.get(id(chain_node), 0) > 1 for chain_node in [*chain, scan]):
+        return None
+
+    if isinstance(terminal, Aggregate):
+        if not isinstance(scan.source, ArrowBatchSource):
+            # Only the batches of Arrow sources get aggregated as they're
+            # read; other sources get the streamed chain below aggregated.
+            return None
+        plans = [
+            plan_aggregation(expr, PARTIAL_AGGREGATIONS) for expr in terminal.parsed_aggs
+        ]
+        output_names = terminal.output_names()
+        if output_names is None or any(plan is None for plan in plans):
+            return None
+        return lambda: agg_batches(
+            _frames(chain, scan),
+            terminal.parsed_aggs,  # type: ignore[arg-type]
+            plans,  # type: ignore[arg-type]
+            terminal.keys,
+            output_names,
+        )
+    if isinstance(terminal, Head):
+        return lambda: _head(_frames(chain, scan), terminal.n)
+    return lambda: _concat(_frames(chain, scan))
+
+
+def _chain(node: PlanNode) -> tuple[list[PlanNode], PlanNode]:
+    """Batch-local nodes from `node` down, and the node below them."""
+    chain: list[PlanNode] = []
+    while _is_batch_local(node):
+        chain.append(node)
+        node = node.input
+    return chain, node
+
+
+def _frames(chain: list[PlanNode], scan: BatchScan) -> Iterator[Any]:
+    for batch in scan.source.frames(scan.columns, scan.filters):
+        frame = batch
+        for chain_node in reversed(chain):
+            frame = chain_node.execute(frame)
+        yield frame
+
+
+def _is_batch_local(node: PlanNode) -> bool:
+    """Whether `node` can be computed on each batch of its input separately."""
+    if isinstance(node, Filter):
+        return all(expr._is_elementwise for expr in node.parsed_predicates)
+    if isinstance(node, WithColumns):
+        return all(expr._is_elementwise for expr in node.parsed_exprs)
+    if isinstance(node, Select):
+        # Literals on their own would give a single row per batch.
+        return all(expr._is_elementwise for expr in node.parsed_exprs) and any(
+            expr._node.reads_columns for expr in node.parsed_exprs
+        )
+    return isinstance(node, (Drop, DropNulls))
+
+
+def _head(frames: Iterable[Any], n: int) -> Any:
+    """First `n` rows of `frames`, without reading any more of them than needed."""
+    kept = []
+    rows = 0
+    for frame in frames:
+        kept.append(frame)
+        rows += len(frame)
+        if rows >= n:
+            break
+    return _concat(kept).head(n)
+
+
+def _concat(frames: Iterable[Any]) -> Any:
+    frames = list(frames)
+    if isinstance(frames[0], ArrowDataFrame):
+        return concat_frames(frames)
+    return frames[0].__narwhals_namespace__().concat(frames, how="vertical")
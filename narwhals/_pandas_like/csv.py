@@ -0,0 +1,121 @@
+"""CSV files which lazy plans read into pandas-like frames, chunk by chunk.
+
+A `CsvSource` reads its file with the library's own `read_csv`, `chunksize`
+rows at a time, and only parses the columns which the plan needs. Like the
+batches of an `ArrowBatchSource`, the chunks go through the chain of filters
+and elementwise projections above the scan one at a time (see
+`narwhals._lazy.stream`), so that only the rows and columns which the query
+keeps get held in memory.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterator
+
+from narwhals._pandas_like.dataframe import PandasDataFrame
+
+if TYPE_CHECKING:
+    from narwhals._lazy.dataframe import LazyPlanFrame
+    from narwhals._lazy.filters import ParquetFilter
+    from narwhals._pandas_like.expr import PandasExpr
+
+# The same as PyArrow's default number of rows per batch.
+DEFAULT_BATCH_SIZE = 2**17
+
+
+class CsvSource:
+    """A CSV file, which a pandas-like library reads in chunks when needed."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        source: str | Path,
+        *,
+        batch_size: int | None,
+        native_namespace: Any,
+        implementation: str,
+        backend_version: tuple[int, ...],
+    ) -> None:
+        self._source = source
+        self._batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self._native_namespace = native_namespace
+        self._implementation = implementation
+        self._backend_version = backend_version
+        self.columns: list[str] = native_namespace.read_csv(
+            source, nrows=0
+        ).columns.tolist()
+
+    def __narwhals_lazyframe__(self) -> LazyPlanFrame:
+        from narwhals._lazy.dataframe import LazyPlanFrame
+        from narwhals._lazy.plan import BatchScan
+
+        return LazyPlanFrame(
+            BatchScan(self),
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+        )
+
+    @property
+    def name(self) -> str:
+        return Path(self._source).name
+
+    def parquet_filters(self, predicate: PandasExpr) -> list[ParquetFilter] | None:
+        # `read_csv` can't filter rows, but predicates still get evaluated on
+        # each chunk as it gets read.
+        return None
+
+    def frames(
+        self,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> Iterator[PandasDataFrame]:
+        """Yield each chunk as a frame, with only `columns` if given.
+
+        At least one (possibly empty) frame always gets yielded, so that
+        results have the right columns even if the file has no rows.
+        """
+        if self._implementation == "cudf":  # pragma: no cover
+            # cuDF can't read files in chunks.
+            yield self._from_chunk(
+                self._native_namespace.read_csv(self._source, usecols=columns),
+                columns,
+            )
+            return
+        empty = True
+        reader = self._native_namespace.read_csv(
+            self._source, usecols=columns, chunksize=self._batch_size
+        )
+        try:
+            for chunk in reader:
+                empty = False
+                yield self._from_chunk(chunk, columns)
+        finally:
+            # e.g. if `head` stops reading before the end of the file.
+            reader.close()
+        if empty:  # pragma: no cover
+            # Older versions of pandas don't yield any chunk for empty files.
+            chunk = self._native_namespace.read_csv(
+                self._source, usecols=columns, nrows=0
+            )
+            yield self._from_chunk(chunk, columns)
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> PandasDataFrame:
+        """Read all the chunks (with only `columns` if given) into a single frame."""
+        frames = list(self.frames(columns))
+        return frames[0].__narwhals_namespace__().concat(frames, how="vertical")
+
+    def _from_chunk(self, chunk: Any, columns: list[str] | None) -> PandasDataFrame:
+        if columns is not None:
+            # `usecols` keeps the columns in the order of the file.
+            chunk = chunk[columns]
+        return PandasDataFrame(
+            chunk,
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+        )
@@ -9,23 +9,29 @@ from typing import Literal
 from typing import Sequence
 from typing import overload
 
-from narwhals._pandas_like.expr import PandasExpr
+from narwhals._pandas_like.partition import map_partitions
+from narwhals._pandas_like.partition import row_partitions
 from narwhals._pandas_like.utils import create_native_series
 from narwhals._pandas_like.utils import evaluate_into_exprs
 from narwhals._pandas_like.utils import generate_unique_token
 from narwhals._pandas_like.utils import horizontal_concat
+from narwhals._pandas_like.utils import numpy_result_type
+from narwhals._pandas_like.utils import supports_cross_join
 from narwhals._pandas_like.utils import translate_dtype
 from narwhals._pandas_like.utils import validate_dataframe_comparand
 from narwhals._pandas_like.utils import validate_indices
+from narwhals._pandas_like.utils import with_columns_slow_path
 from narwhals.dependencies import get_cudf
 from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pandas
+from narwhals.profiling import profiled
 from narwhals.utils import flatten
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from narwhals._lazy.dataframe import LazyPlanFrame
     from narwhals._pandas_like.group_by import PandasGroupBy
     from narwhals._pandas_like.namespace import PandasNamespace
     from narwhals._pandas_like.series import PandasSeries
@@ -46,12 +52,14 @@ class PandasDataFrame:
         self._native_dataframe = native_dataframe
         self._implementation = implementation
         self._backend_version = backend_version
+        self._expr_cache: dict[Any, list[PandasSeries]] | None = None
+        self._schema: dict[str, DType] | None = None
 
     def __narwhals_dataframe__(self) -> Self:
         return self
 
-    def __narwhals_lazyframe__(self) -> Self:
-        return self
+    def __narwhals_lazyframe__(self) -> LazyPlanFrame:
+        return self.lazy()
 
     def __narwhals_namespace__(self) -> PandasNamespace:
         from narwhals._pandas_like.namespace import PandasNamespace
@@ -134,31 +142,63 @@ class PandasDataFrame:
         *,
         named: bool = False,
         buffer_size: int = 512,
-    ) -> Iterator[list[tuple[Any, ...]]] | Iterator[list[dict[str, Any]]]:
+    ) -> Iterator[tuple[Any, ...]] | Iterator[dict[str, Any]]:
         """
         NOTE:
-            The param ``buffer_size`` is only here for compatibility with the polars API
-            and has no effect on the output.
+            Rows get converted ``buffer_size`` at a time, one column at a time,
+            which avoids the per-row overhead of ``itertuples``.
         """
-        if not named:
-            yield from self._native_dataframe.itertuples(index=False, name=None)
-        else:
-            yield from (
-                row._asdict() for row in self._native_dataframe.itertuples(index=False)
-            )
+        native = self._native_dataframe
+        columns = native.columns.tolist()
+        series = [native.iloc[:, i] for i in range(len(columns))]
+        for start in range(0, len(native), buffer_size):
+            stop = start + buffer_size
+            rows = zip(*(self._python_values(s, start, stop) for s in series))
+            if not named:
+                yield from rows
+            else:
+                yield from (dict(zip(columns, row)) for row in rows)
+
+    def _python_values(self, native_series: Any, start: int, stop: int) -> list[Any]:
+        """Values of `native_series[start:stop]`, as Python objects."""
+        dtype = native_series.dtype
+        if (
+            self._implementation == "pandas"
+            and isinstance(dtype, get_numpy().dtype)
+            and dtype.kind not in "mM"
+        ):
+            # Slicing the NumPy array is much cheaper than slicing the Series.
+            # Datetimes aren't converted to `Timestamp`s by NumPy though.
+            return native_series.to_numpy()[start:stop].tolist()  # type: ignore[no-any-return]
+        return native_series.iloc[start:stop].tolist()  # type: ignore[no-any-return]
 
     @property
     def schema(self) -> dict[str, DType]:
-        return {
-            col: translate_dtype(self._native_dataframe.loc[:, col])
-            for col in self._native_dataframe.columns
-        }
+        if self._schema is None:
+            # Native frames never get modified in-place, so this can be cached.
+            native = self._native_dataframe
+            self._schema = {col: translate_dtype(native[col]) for col in native.columns}
+        return dict(self._schema)
 
     # --- reshape ---
+    @profiled("select")
     def select(
         self,
         *exprs: IntoPandasExpr,
         **named_exprs: IntoPandasExpr,
+    ) -> Self:
+        if (partitions := row_partitions(self, *exprs, **named_exprs)) is not None:
+            return map_partitions(  # type: ignore[return-value]
+                self,
+                partitions,
+                lambda partition: partition._select(*exprs, **named_exprs),
+            )
+        return self._select(*exprs, **named_exprs)
+
+    def _select(
+        self,
+        *exprs: IntoPandasExpr,
+        **named_exprs: IntoPandasExpr,
     ) -> Self:
         new_series = evaluate_into_exprs(self, *exprs, **named_exprs)
         if not new_series:
@@ -190,36 +230,60 @@ class PandasDataFrame:
             )
         )
 
+    @profiled("filter")
     def filter(
         self,
         *predicates: IntoPandasExpr | Iterable[IntoPandasExpr],
+    ) -> Self:
+        if (partitions := row_partitions(self, *predicates)) is not None:
+            return map_partitions(  # type: ignore[return-value]
+                self, partitions, lambda partition: partition._filter(*predicates)
+            )
+        return self._filter(*predicates)
+
+    def _filter(
+        self,
+        *predicates: IntoPandasExpr | Iterable[IntoPandasExpr],
     ) -> Self:
         from narwhals._pandas_like.namespace import PandasNamespace
 
         plx = PandasNamespace(self._implementation, self._backend_version)
         expr = plx.all_horizontal(*predicates)
         # Safety: all_horizontal's expression only returns a single column.
-        mask = expr._call(self)[0]
+        mask = evaluate_into_exprs(self, expr)[0]
+        if mask.len() == 1:
+            # A single value (e.g. from a reduction) applies to every row.
+            rows = slice(None) if mask.item() else slice(0)
+            return self._from_native_dataframe(self._native_dataframe.iloc[rows])
         _mask = validate_dataframe_comparand(self._native_dataframe.index, mask)
         return self._from_native_dataframe(self._native_dataframe.loc[_mask])
 
+    @profiled("with_columns")
     def with_columns(
         self,
         *exprs: IntoPandasExpr,
         **named_exprs: IntoPandasExpr,
+    ) -> Self:
+        if (partitions := row_partitions(self, *exprs, **named_exprs)) is not None:
+            return map_partitions(  # type: ignore[return-value]
+                self,
+                partitions,
+                lambda partition: partition._with_columns(*exprs, **named_exprs),
+            )
+        return self._with_columns(*exprs, **named_exprs)
+
+    def _with_columns(
+        self,
+        *exprs: IntoPandasExpr,
+        **named_exprs: IntoPandasExpr,
     ) -> Self:
         index = self._native_dataframe.index
         new_columns = evaluate_into_exprs(self, *exprs, **named_exprs)
         # If the inputs are all Expressions which return full columns
         # (as opposed to scalars), we can use a fast path (concat, instead of assign).
-        # We can't use the fastpath if any input is not an expression (e.g.
-        # if it's a Series) because then we might be changing its flags.
-        # See `test_memmap` for an example of where this is necessary.
-        fast_path = (
-            all(len(s) > 1 for s in new_columns)
-            and all(isinstance(x, PandasExpr) for x in exprs)
-            and all(isinstance(x, PandasExpr) for (_, x) in named_exprs.items())
-        )
+        # `LazyFrame.explain` reports the same choice.
+        slow_path = with_columns_slow_path([*exprs, *named_exprs.values()])
+        fast_path = slow_path is None and all(len(s) > 1 for s in new_columns)
 
         if fast_path:
             new_column_name_to_new_column_map = {s.name: s for s in new_columns}
@@ -259,6 +323,7 @@ class PandasDataFrame:
         )
 
     # --- transform ---
+    @profiled("sort")
     def sort(
         self,
         by: str | Iterable[str],
@@ -273,14 +338,6 @@ class PandasDataFrame:
             ascending = [not d for d in descending]
         return self._from_native_dataframe(df.sort_values(flat_keys, ascending=ascending))
 
-    # --- convert ---
-    def collect(self) -> PandasDataFrame:
-        return PandasDataFrame(
-            self._native_dataframe,
-            implementation=self._implementation,
-            backend_version=self._backend_version,
-        )
-
     # --- actions ---
     def group_by(self, *keys: str | Iterable[str]) -> PandasGroupBy:
         from narwhals._pandas_like.group_by import PandasGroupBy
@@ -290,11 +347,12 @@ class PandasDataFrame:
             flatten(keys),
         )
 
+    @profiled("join")
     def join(
         self,
         other: Self,
         *,
-        how: Literal["left", "inner", "outer", "cross", "anti"] = "inner",
+        how: Literal["left", "inner", "outer", "cross", "anti", "semi"] = "inner",
         left_on: str | list[str] | None = None,
         right_on: str | list[str] | None = None,
     ) -> Self:
@@ -304,9 +362,7 @@ class PandasDataFrame:
             right_on = [right_on]
 
         if how == "cross":
-            if self._implementation in {"modin", "cudf"} or (
-                self._implementation == "pandas" and self._backend_version < (1, 4)
-            ):
+            if not supports_cross_join(self._implementation, self._backend_version):
                 key_token = generate_unique_token(
                     n_bytes=8, columns=[*self.columns, *other.columns]
                 )
@@ -329,30 +385,24 @@ class PandasDataFrame:
                     ),
                 )
 
-        if how == "anti":
-            indicator_token = generate_unique_token(
-                n_bytes=8, columns=[*self.columns, *other.columns]
-            )
-
-            other = (
-                other._native_dataframe.loc[:, right_on]
-                .rename(  # rename to avoid creating extra columns in join
-                    columns=dict(zip(right_on, left_on))  # type: ignore[arg-type]
-                )
-                .drop_duplicates()
-            )
-            return self._from_native_dataframe(
-                self._native_dataframe.merge(
-                    other,
-                    how="outer",
-                    indicator=indicator_token,
-                    left_on=left_on,
-                    right_on=left_on,
+        if how in {"anti", "semi"}:
+            # Only the keys of `other` get looked at, and the result is a
+            # boolean mask on the left rows rather than a merged frame.
+            left = self._native_dataframe
+            right = other._native_dataframe
+            if len(left_on) == 1:  # type: ignore[arg-type]
+                mask = left[left_on[0]].isin(right[right_on[0]])  # type: ignore[index]
+            else:
+                # The codes of a MultiIndex are the factorized keys, so
+                # membership gets checked on those rather than on tuples.
+                mask = (
+                    left.loc[:, left_on]
+                    .set_index(left_on)
+                    .index.isin(right.loc[:, right_on].set_index(right_on).index)
                 )
-                .loc[lambda t: t[indicator_token] == "left_only"]
-                .drop(columns=[indicator_token])
-                .reset_index(drop=True)
-            )
+            if how == "anti":
+                mask = ~mask
+            return self._from_native_dataframe(left.loc[mask].reset_index(drop=True))
 
         return self._from_native_dataframe(
             self._native_dataframe.merge(
@@ -379,8 +429,10 @@ class PandasDataFrame:
         )
 
     # --- lazy-only ---
-    def lazy(self) -> Self:
-        return self
+    def lazy(self) -> LazyPlanFrame:
+        from narwhals._lazy.dataframe import LazyPlanFrame
+
+        return LazyPlanFrame.from_dataframe(self)
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -403,17 +455,49 @@ class PandasDataFrame:
 
     def to_numpy(self) -> Any:
         from narwhals._pandas_like.series import PANDAS_TO_NUMPY_DTYPE_MISSING
+        from narwhals._pandas_like.series import PANDAS_TO_NUMPY_DTYPE_NO_MISSING
 
         # pandas return `object` dtype for nullable dtypes, so we cast each
         # Series to numpy and let numpy find a common dtype.
         # If there aren't any dtypes where `to_numpy()` is "broken" (i.e. it
         # returns Object) then we just call `to_numpy()` on the DataFrame.
-        for dtype in self._native_dataframe.dtypes:
+        native = self._native_dataframe
+        if not any(
+            str(dtype) in PANDAS_TO_NUMPY_DTYPE_MISSING for dtype in native.dtypes
+        ):
+            return native.to_numpy()
+        np = get_numpy()
+        series = [self[col] for col in self.columns]
+        # The dtype which `PandasSeries.to_numpy` returns for each column,
+        # and the values of those which had to be converted to find out.
+        dtypes = []
+        converted: dict[int, Any] = {}
+        for i, s in enumerate(series):
+            dtype = s._native_series.dtype
             if str(dtype) in PANDAS_TO_NUMPY_DTYPE_MISSING:
-                import numpy as np
-
-                return np.hstack([self[col].to_numpy()[:, None] for col in self.columns])
-        return self._native_dataframe.to_numpy()
+                dtypes.append(
+                    PANDAS_TO_NUMPY_DTYPE_MISSING[str(dtype)]
+                    if s._native_series.isna().any()
+                    else PANDAS_TO_NUMPY_DTYPE_NO_MISSING[str(dtype)]
+                )
+            elif isinstance(dtype, np.dtype):
+                dtypes.append(dtype)
+            else:
+                converted[i] = s.to_numpy()
+                dtypes.append(converted[i].dtype)
+        # Fill a single array, column by column, rather than stacking arrays
+        # of each column. In Fortran order, each column is contiguous.
+        result = np.empty(native.shape, dtype=numpy_result_type(dtypes), order="F")
+        for i, s in enumerate(series):
+            if result.dtype == object and np.dtype(dtypes[i]).kind in "mM":
+                # e.g. datetimes as `Timestamp`s, rather than as integers
+                # (including those of extension dtypes, converted above).
+                result[:, i] = s._native_series.to_numpy(dtype=object)
+            elif i in converted:
+                result[:, i] = converted[i]
+            else:
+                result[:, i] = s.to_numpy()
+        return result
 
     def to_pandas(self) -> Any:
         if self._implementation == "pandas":
@@ -422,8 +506,43 @@ class PandasDataFrame:
             return self._native_dataframe._to_pandas()
         return self._native_dataframe.to_pandas()  # pragma: no cover
 
-    def write_parquet(self, file: Any) -> Any:
-        self._native_dataframe.to_parquet(file)
+    def write_parquet(  # noqa: PLR0913
+        self,
+        file: Any,
+        *,
+        compression: str,
+        compression_level: int | None,
+        statistics: bool,
+        row_group_size: int | None,
+        partition_by: list[str] | None,
+        use_dictionary: bool,
+    ) -> Any:
+        if self._implementation == "cudf":  # pragma: no cover
+            # cuDF has its own Parquet writer, with its own options.
+            self._native_dataframe.to_parquet(
+                file,
+                compression=compression,
+                statistics="ROWGROUP" if statistics else "NONE",
+                row_group_size_rows=row_group_size,
+                partition_cols=partition_by,
+            )
+            return
+        from narwhals._arrow.parquet import write_options
+
+        self._native_dataframe.to_parquet(
+            file,
+            partition_cols=partition_by,
+            row_group_size=row_group_size,
+            **write_options(
+                compression=compression,
+                compression_level=compression_level,
+                statistics=statistics,
+                use_dictionary=use_dictionary,
+            ),
+        )
+
+    def write_ipc(self, file: Any, *, compression: str) -> Any:
+        self._native_dataframe.to_feather(file, compression=compression)
 
     # --- descriptive ---
     def is_duplicated(self: Self) -> PandasSeries:
@@ -5,9 +5,12 @@ from typing import Any
 from typing import Callable
 from typing import Literal
 
+from narwhals._pandas_like.expr_node import ExprNode
 from narwhals._pandas_like.series import PandasSeries
+from narwhals._pandas_like.utils import evaluate_expr
 from narwhals._pandas_like.utils import reuse_series_implementation
 from narwhals._pandas_like.utils import reuse_series_namespace_implementation
+from narwhals._pandas_like.utils import set_axis
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -25,6 +28,8 @@ class PandasExpr:
         function_name: str,
         root_names: list[str] | None,
         output_names: list[str] | None,
+        is_elementwise: bool,
+        node: ExprNode,
         implementation: str,
         backend_version: tuple[int, ...],
     ) -> None:
@@ -34,6 +39,10 @@ class PandasExpr:
         self._root_names = root_names
         self._depth = depth
         self._output_names = output_names
+        self._is_elementwise = is_elementwise
+        # The operation this expression applies, along with its inputs.
+        self._node = node
+        node.expr = self
         self._implementation = implementation
         self._backend_version = backend_version
 
@@ -74,6 +83,8 @@ class PandasExpr:
             function_name="col",
             root_names=list(column_names),
             output_names=list(column_names),
+            is_elementwise=True,
+            node=ExprNode("col", *column_names),
             implementation=implementation,
             backend_version=backend_version,
         )
@@ -215,28 +226,32 @@ class PandasExpr:
 
         plx = PandasNamespace(self._implementation, self._backend_version)
         expr = plx.all_horizontal(*predicates)
-        return reuse_series_implementation(self, "filter", other=expr)
+        return reuse_series_implementation(
+            self, "filter", other=expr, is_elementwise=False
+        )
 
     def drop_nulls(self) -> Self:
-        return reuse_series_implementation(self, "drop_nulls")
+        return reuse_series_implementation(self, "drop_nulls", is_elementwise=False)
 
     def sort(self, *, descending: bool = False) -> Self:
-        return reuse_series_implementation(self, "sort", descending=descending)
+        return reuse_series_implementation(
+            self, "sort", descending=descending, is_elementwise=False
+        )
 
     def abs(self) -> Self:
         return reuse_series_implementation(self, "abs")
 
     def cum_sum(self) -> Self:
-        return reuse_series_implementation(self, "cum_sum")
+        return reuse_series_implementation(self, "cum_sum", is_elementwise=False)
 
     def unique(self) -> Self:
-        return reuse_series_implementation(self, "unique")
+        return reuse_series_implementation(self, "unique", is_elementwise=False)
 
     def diff(self) -> Self:
-        return reuse_series_implementation(self, "diff")
+        return reuse_series_implementation(self, "diff", is_elementwise=False)
 
     def shift(self, n: int) -> Self:
-        return reuse_series_implementation(self, "shift", n=n)
+        return reuse_series_implementation(self, "shift", n=n, is_elementwise=False)
 
     def sample(
         self,
@@ -246,23 +261,32 @@ class PandasExpr:
         with_replacement: bool = False,
     ) -> Self:
         return reuse_series_implementation(
-            self, "sample", n=n, fraction=fraction, with_replacement=with_replacement
+            self,
+            "sample",
+            n=n,
+            fraction=fraction,
+            with_replacement=with_replacement,
+            is_elementwise=False,
         )
 
     def alias(self, name: str) -> Self:
         # Define this one manually, so that we can
         # override `output_names` and not increase depth
         return self.__class__(
-            lambda df: [series.alias(name) for series in self._call(df)],
+            lambda df: [series.alias(name) for series in evaluate_expr(df, self)],
             depth=self._depth,
             function_name=self._function_name,
             root_names=self._root_names,
             output_names=[name],
+            is_elementwise=self._is_elementwise,
+            node=ExprNode("alias", self._node, name),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
 
     def over(self, keys: list[str]) -> Self:
+        from narwhals._pandas_like.group_by import window_pandas
+
         def func(df: PandasDataFrame) -> list[PandasSeries]:
             if self._output_names is None:
                 msg = (
@@ -271,31 +295,49 @@ class PandasExpr:
                     "`nw.col('a', 'b')`\n"
                 )
                 raise ValueError(msg)
+            result = window_pandas(df, self, keys)
+            if result is not None:
+                return result
             tmp = df.group_by(keys).agg(self)
             tmp = df.select(*keys).join(tmp, how="left", left_on=keys, right_on=keys)
-            return [tmp[name] for name in self._output_names]
+            # The join doesn't keep the index of `df`, but it does keep its order.
+            return [
+                tmp[name]._from_native_series(
+                    set_axis(
+                        tmp[name]._native_series,
+                        df._native_dataframe.index,
+                        implementation=self._implementation,
+                        backend_version=self._backend_version,
+                    )
+                )
+                for name in self._output_names
+            ]
 
         return self.__class__(
             func,
             depth=self._depth + 1,
             function_name=self._function_name + "->over",
-            root_names=self._root_names,
+            root_names=None if self._root_names is None else [*self._root_names, *keys],
             output_names=self._output_names,
+            is_elementwise=False,
+            node=ExprNode("over", self._node, *keys),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
 
     def is_duplicated(self) -> Self:
-        return reuse_series_implementation(self, "is_duplicated")
+        return reuse_series_implementation(self, "is_duplicated", is_elementwise=False)
 
     def is_unique(self) -> Self:
-        return reuse_series_implementation(self, "is_unique")
+        return reuse_series_implementation(self, "is_unique", is_elementwise=False)
 
     def is_first_distinct(self) -> Self:
-        return reuse_series_implementation(self, "is_first_distinct")
+        return reuse_series_implementation(
+            self, "is_first_distinct", is_elementwise=False
+        )
 
     def is_last_distinct(self) -> Self:
-        return reuse_series_implementation(self, "is_last_distinct")
+        return reuse_series_implementation(self, "is_last_distinct", is_elementwise=False)
 
     def quantile(
         self,
@@ -307,10 +349,10 @@ class PandasExpr:
         )
 
     def head(self, n: int) -> Self:
-        return reuse_series_implementation(self, "head", n)
+        return reuse_series_implementation(self, "head", n, is_elementwise=False)
 
     def tail(self, n: int) -> Self:
-        return reuse_series_implementation(self, "tail", n)
+        return reuse_series_implementation(self, "tail", n, is_elementwise=False)
 
     def round(self: Self, decimals: int) -> Self:
         return reuse_series_implementation(self, "round", decimals)
@@ -340,6 +382,7 @@ class PandasExprCatNamespace:
             self._expr,
             "cat",
             "get_categories",
+            is_elementwise=False,
         )
 
 
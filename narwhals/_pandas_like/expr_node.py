@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Container
+from typing import Iterator
+
+# Operations whose results can't be shared between two occurrences, even if
+# they look the same: samples are random, selectors and Series are opaque.
+UNSHAREABLE_OPS = frozenset({"sample", "selector", "series"})
+
+# Operations which reduce their input to a single value.
+REDUCTIONS = frozenset(
+    {
+        "all",
+        "any",
+        "len",
+        "max",
+        "mean",
+        "min",
+        "n_unique",
+        "null_count",
+        "quantile",
+        "std",
+        "sum",
+    }
+)
+
+# Symbols of binary operators, for printing expressions. Reflected operators
+# (e.g. `"__radd__"`) use the same symbols, with the operands swapped.
+OPERATOR_SYMBOLS = {
+    "__eq__": "==",
+    "__ne__": "!=",
+    "__ge__": ">=",
+    "__gt__": ">",
+    "__le__": "<=",
+    "__lt__": "<",
+    "__and__": "&",
+    "__or__": "|",
+    "__add__": "+",
+    "__sub__": "-",
+    "__mul__": "*",
+    "__truediv__": "/",
+    "__floordiv__": "//",
+    "__pow__": "**",
+    "__mod__": "%",
+}
+
+
+class ExprNode:
+    """One operation in the tree making up an expression.
+
+    `op` is the name of the operation (e.g. `"col"`, `"__mul__"`, `"sum"` or
+    `"str.starts_with"`), applied to `args` and `kwargs`. Arguments which are
+    expressions themselves are stored as their nodes, and the expression which
+    a method gets called on comes first. For example,
+    `(nw.col('a') * nw.col('b')).sum()` is
+
+        ExprNode('sum', ExprNode('__mul__', ExprNode('col', 'a'), other=ExprNode('col', 'b')))
+    """
+
+    def __init__(self, op: str, *args: Any, **kwargs: Any) -> None:
+        self.op = op
+        self.args = args
+        self.kwargs = kwargs
+        self.key = self._structural_key()
+        # The (compliant) expression computing this node, which sets it when
+        # it gets created, so that subtrees can be evaluated on their own.
+        self.expr: Any = None
+
+    def __repr__(self) -> str:
+        arguments = [repr(arg) for arg in self.args] + [
+            f"{name}={value!r}" for name, value in self.kwargs.items()
+        ]
+        return f"ExprNode({self.op!r}{''.join(', ' + arg for arg in arguments)})"
+
+    def __str__(self) -> str:
+        """Polars-like rendering of the expression, e.g. `(col('a') * 2).sum()`."""
+        op = self.op
+        if op in OPERATOR_SYMBOLS or (
+            op.startswith("__r") and f"__{op[3:]}" in OPERATOR_SYMBOLS
+        ):
+            # The other operand is passed by keyword by some backends only.
+            if "other" in self.kwargs:
+                left, right = self.args[0], self.kwargs["other"]
+            else:
+                left, right = self.args
+            if op not in OPERATOR_SYMBOLS:
+                left, right, op = right, left, f"__{op[3:]}"
+            return f"({_format(left)} {OPERATOR_SYMBOLS[op]} {_format(right)})"
+        if op == "__invert__":
+            return f"~{self.args[0]}"
+        if op == "series":
+            return "series"
+        args = list(self.args)
+        if op == "lit" and args[1] is None:
+            args = args[:1]
+        receiver = None
+        if args and isinstance(args[0], ExprNode):
+            # Methods: the expression they get called on comes first.
+            receiver, args = args[0], args[1:]
+        arguments = ", ".join(
+            [_format(arg) for arg in args]
+            + [
+                # e.g. `filter(other=...)` reads better as `filter(...)`.
+                _format(value) if name == "other" else f"{name}={_format(value)}"
+                for name, value in self.kwargs.items()
+            ]
+        )
+        if receiver is None:
+            return f"{op}({arguments})"
+        return f"{receiver}.{op}({arguments})"
+
+    @property
+    def inputs(self) -> list[ExprNode]:
+        """Nodes of the expressions this operation takes as input."""
+        return [
+            arg
+            for arg in (*self.args, *self.kwargs.values())
+            if isinstance(arg, ExprNode)
+        ]
+
+    @property
+    def literals(self) -> list[Any]:
+        """Arguments of this operation which aren't expressions."""
+        return [
+            arg
+            for arg in (*self.args, *self.kwargs.values())
+            if not isinstance(arg, ExprNode)
+        ]
+
+    @property
+    def reads_columns(self) -> bool:
+        """Whether any of the leaves below this node reads columns.
+
+        Literals on their own have a single row, rather than one per row of
+        the frame they're evaluated on.
+        """
+        return any(leaf.op != "lit" for leaf in self.walk() if not leaf.inputs)
+
+    def walk(self) -> Iterator[ExprNode]:
+        """Iterate over this node and all of the nodes below it."""
+        yield self
+        for input_node in self.inputs:
+            yield from input_node.walk()
+
+    def _structural_key(self) -> tuple[Any, ...] | None:
+        """Key such that nodes with the same key compute the same thing.
+
+        Literals are identified by their type and value (so that `1` and
+        `True` differ), or by their identity if they're not hashable.
+        """
+        if self.op in UNSHAREABLE_OPS or any(node.key is None for node in self.inputs):
+            return None
+        return (
+            self.op,
+            *(_literal_key(arg) for arg in self.args),
+            *((name, _literal_key(value)) for name, value in self.kwargs.items()),
+        )
+
+
+def returns_scalar(node: ExprNode) -> bool:
+    """Whether `node` computes a single value, rather than one per row."""
+    if node.op in REDUCTIONS and (node.args or node.op == "len"):
+        # Without arguments, `all` is `nw.all()`, which selects columns.
+        return True
+    if node.op == "lit":
+        return True
+    if node.op in {"over", "series"} or not node.inputs:
+        return False
+    return all(returns_scalar(input_node) for input_node in node.inputs)
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, ExprNode):
+        return str(value)
+    if hasattr(value, "_native_series"):
+        return "series"
+    if isinstance(value, type):
+        # e.g. dtypes
+        return value.__name__
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_format(item) for item in value)}]"
+    return repr(value)
+
+
+def _literal_key(value: Any) -> Any:
+    if isinstance(value, ExprNode):
+        return value.key
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return (type(value), value)
+
+
+def plan_aggregation(
+    expr: Any,
+    aggregations: Container[str],
+    masked_aggregations: Container[str] = (),
+) -> tuple[Any, Any, ExprNode] | None:
+    """
+    Rewrite `expr` as an aggregation of a pre-projected column.
+
+    Only aggregations in `aggregations` are considered, and only those in
+    `masked_aggregations` may aggregate filtered columns. Returns the
+    expression to pre-project (`None` for `nw.len()`, which doesn't need one),
+    the mask selecting which of its rows to aggregate (`None` if all of them),
+    and the node of the aggregation. For example:
+
+    - nw.col('a').mean() -> (nw.col('a'), None, mean)
+    - nw.col('b').round(2).mean() -> (nw.col('b').round(2), None, mean)
+    - nw.col('b').filter(nw.col('c') > 0).sum() -> (nw.col('b'), nw.col('c') > 0, sum)
+
+    Returns `None` if `expr` can't be rewritten like this, e.g.
+
+    - (nw.col('b') - nw.col('b').mean()).abs().max()
+
+    because the pre-projection would need to know about the groups.
+    """
+    node = expr._node
+    while node.op == "alias":
+        node = node.args[0]
+    if node.op not in aggregations:
+        return None
+    if node.op == "len" and not node.args:
+        return None, None, node
+    (input_node,) = node.inputs
+    mask = None
+    if input_node.op == "filter":
+        if node.op not in masked_aggregations:
+            return None
+        input_node, mask_node = input_node.inputs
+        if not mask_node.expr._is_elementwise:
+            return None
+        mask = mask_node.expr
+    if not input_node.expr._is_elementwise or not input_node.reads_columns:
+        return None
+    return input_node.expr, mask, node
@@ -9,20 +9,57 @@ from typing import Callable
 from typing import Iterable
 from typing import Iterator
 
-from narwhals._pandas_like.utils import is_simple_aggregation
+from narwhals._pandas_like.expr_node import plan_aggregation
+from narwhals._pandas_like.partition import agg_partitioned
+from narwhals._pandas_like.partition import can_agg_partitioned
+from narwhals._pandas_like.partition import n_partitions
+from narwhals._pandas_like.series import PandasSeries
+from narwhals._pandas_like.utils import evaluate_expr
+from narwhals._pandas_like.utils import evaluate_into_exprs
+from narwhals._pandas_like.utils import generate_unique_token
+from narwhals._pandas_like.utils import horizontal_concat
 from narwhals._pandas_like.utils import native_series_from_iterable
 from narwhals._pandas_like.utils import parse_into_exprs
-from narwhals.utils import remove_prefix
+from narwhals._pandas_like.utils import set_axis
+from narwhals.profiling import profiled
 
 if TYPE_CHECKING:
     from narwhals._pandas_like.dataframe import PandasDataFrame
     from narwhals._pandas_like.expr import PandasExpr
+    from narwhals._pandas_like.expr_node import ExprNode
     from narwhals._pandas_like.typing import IntoPandasExpr
 
+# Aggregations which pandas can do natively, and what pandas calls them.
 POLARS_TO_PANDAS_AGGREGATIONS = {
+    "sum": "sum",
+    "mean": "mean",
+    "max": "max",
+    "min": "min",
+    "std": "std",
+    "any": "any",
+    "all": "all",
     "len": "size",
 }
 
+# Aggregations over filtered columns, done by masking out the rows which the
+# filter would drop: `(column, mask) -> (masked column, aggregation)`.
+MASKED_AGGREGATIONS: dict[str, Callable[[Any, Any], tuple[Any, str]]] = {
+    "sum": lambda column, mask: (column.where(mask, 0), "sum"),
+    "mean": lambda column, mask: (column.where(mask), "mean"),
+    "any": lambda column, mask: (column & mask, "any"),
+    "all": lambda column, mask: (column | ~mask, "all"),
+    "len": lambda _column, mask: (mask, "sum"),
+}
+
+
+# Window functions which pandas can compute per group, given the grouped
+# input column and the node of the function.
+WINDOW_FUNCTIONS: dict[str, Callable[[Any, ExprNode], Any]] = {
+    "cum_sum": lambda grouped, _node: grouped.cumsum(),
+    "diff": lambda grouped, _node: grouped.diff(),
+    "shift": lambda grouped, node: grouped.shift(node.kwargs["n"]),
+}
+
 
 class PandasGroupBy:
     def __init__(self, df: PandasDataFrame, keys: list[str]) -> None:
@@ -34,6 +71,7 @@ class PandasGroupBy:
             as_index=True,
         )
 
+    @profiled("group_by.agg")
     def agg(
         self,
         *aggs: IntoPandasExpr | Iterable[IntoPandasExpr],
@@ -63,7 +101,7 @@ class PandasGroupBy:
             self._keys,
             output_names,
             self._from_native_dataframe,
-            dataframe_is_empty=self._df._native_dataframe.empty,
+            df=self._df,
             implementation=implementation,
             backend_version=self._df._backend_version,
         )
@@ -99,9 +137,9 @@ def agg_pandas(  # noqa: PLR0913
     output_names: list[str],
     from_dataframe: Callable[[Any], PandasDataFrame],
     *,
+    df: PandasDataFrame,
     implementation: Any,
     backend_version: tuple[int, ...],
-    dataframe_is_empty: bool,
 ) -> PandasDataFrame:
     """
     This should be the fastpath, but cuDF is too far behind to use it.
@@ -109,52 +147,28 @@ def agg_pandas(  # noqa: PLR0913
     - https://github.com/rapidsai/cudf/issues/15118
     - https://github.com/rapidsai/cudf/issues/15084
     """
-    all_simple_aggs = True
-    for expr in exprs:
-        if not is_simple_aggregation(expr):
-            all_simple_aggs = False
-            break
-
-    if all_simple_aggs:
-        simple_aggregations: dict[str, tuple[str, str]] = {}
-        for expr in exprs:
-            if expr._depth == 0:
-                # e.g. agg(nw.len())
-                assert expr._output_names is not None
-                function_name = POLARS_TO_PANDAS_AGGREGATIONS.get(
-                    expr._function_name, expr._function_name
-                )
-                for output_name in expr._output_names:
-                    simple_aggregations[output_name] = (keys[0], function_name)
-                continue
-
-            # e.g. agg(nw.mean('a'))
-            assert expr._depth == 1
-            assert expr._root_names is not None
-            assert expr._output_names is not None
-            function_name = remove_prefix(expr._function_name, "col->")
-            function_name = POLARS_TO_PANDAS_AGGREGATIONS.get(
-                function_name, function_name
+    if any(expr._is_elementwise for expr in exprs):
+        # e.g. agg(nw.col('a')), which has one value per row rather than per group.
+        msg = "Failed to aggregated - does your aggregation function return a scalar?"
+        raise RuntimeError(msg)
+
+    plans = [plan_pandas_aggregation(expr) for expr in exprs]
+    if all(plan is not None for plan in plans):
+        if (n := n_partitions(df)) > 1 and can_agg_partitioned(plans):  # type: ignore[arg-type]
+            return from_dataframe(
+                agg_partitioned(df, exprs, plans, keys, output_names, n)  # type: ignore[arg-type]
             )
-            for root_name, output_name in zip(expr._root_names, expr._output_names):
-                simple_aggregations[output_name] = (root_name, function_name)
-
-        aggs = collections.defaultdict(list)
-        name_mapping = {}
-        for output_name, named_agg in simple_aggregations.items():
-            aggs[named_agg[0]].append(named_agg[1])
-            name_mapping[f"{named_agg[0]}_{named_agg[1]}"] = output_name
-        try:
-            result_simple = grouped.agg(aggs)
-        except AttributeError as exc:
-            raise RuntimeError(
-                "Failed to aggregated - does your aggregation function return a scalar?"
-            ) from exc
-        result_simple.columns = [f"{a}_{b}" for a, b in result_simple.columns]
-        result_simple = result_simple.rename(columns=name_mapping).reset_index()
-        return from_dataframe(result_simple.loc[:, output_names])
-
-    if dataframe_is_empty:
+        result = agg_planned(
+            grouped,
+            exprs,
+            plans,  # type: ignore[arg-type]
+            keys,
+            output_names,
+            df=df,
+        )
+        return from_dataframe(result)
+
+    if df._native_dataframe.empty:
         # Don't even attempt this, it's way too inconsistent across pandas versions.
         msg = (
             "No results for group-by aggregation.\n\n"
@@ -179,11 +193,9 @@ def agg_pandas(  # noqa: PLR0913
     def func(df: Any) -> Any:
         out_group = []
         out_names = []
-        for expr in exprs:
-            results_keys = expr._call(from_dataframe(df))
-            for result_keys in results_keys:
-                out_group.append(result_keys._native_series.iloc[0])
-                out_names.append(result_keys.name)
+        for result_keys in evaluate_into_exprs(from_dataframe(df), *exprs):
+            out_group.append(result_keys._native_series.iloc[0])
+            out_names.append(result_keys.name)
         return native_series_from_iterable(
             out_group,
             index=out_names,
@@ -199,3 +211,170 @@ def agg_pandas(  # noqa: PLR0913
     result = result_complex.reset_index()
 
     return from_dataframe(result.loc[:, output_names])
+
+
+def agg_planned(  # noqa: PLR0913
+    grouped: Any,
+    exprs: list[PandasExpr],
+    plans: list[tuple[PandasExpr | None, PandasExpr | None, ExprNode]],
+    keys: list[str],
+    output_names: list[str],
+    *,
+    df: PandasDataFrame,
+) -> Any:
+    """
+    Aggregate by pre-projecting columns and then using pandas' own aggregations.
+
+    See `narwhals._pandas_like.expr_node.plan_aggregation` for what each plan
+    means. Columns which get
+    aggregated as they are don't need pre-projecting. Returns the native
+    result.
+    """
+    native = df._native_dataframe
+    # Everything gets pre-projected in one go, so that common subexpressions
+    # only get evaluated once.
+    to_evaluate: list[PandasExpr] = []
+    for input_expr, mask, _ in plans:
+        if input_expr is not None and (mask is not None or input_expr._node.op != "col"):
+            to_evaluate.append(input_expr)
+        if mask is not None:
+            to_evaluate.append(mask)
+    evaluated = iter(evaluate_into_exprs(df, *to_evaluate))
+
+    aggs: dict[str, list[str]] = collections.defaultdict(list)
+    # Which column, aggregated how, each output comes from.
+    sources: list[tuple[str, str]] = []
+    new_columns: list[Any] = []
+    for expr, (input_expr, mask, node) in zip(exprs, plans):
+        assert expr._output_names is not None
+        function_name = node.op
+        if input_expr is None:
+            # e.g. agg(nw.len()): any column will do to count the rows.
+            columns = [(keys[0], function_name)] * len(expr._output_names)
+        elif mask is not None or input_expr._node.op != "col":
+            inputs = [next(evaluated) for _ in expr._output_names]
+            native_mask = None if mask is None else _aligned(next(evaluated), df)
+            columns = []
+            for series in inputs:
+                column = _aligned(series, df)
+                column_function_name = function_name
+                if native_mask is not None:
+                    column, column_function_name = MASKED_AGGREGATIONS[function_name](
+                        column, native_mask
+                    )
+                name = generate_unique_token(
+                    8, [*native.columns, *(c.name for c in new_columns)]
+                )
+                new_columns.append(column.rename(name))
+                columns.append((name, column_function_name))
+        else:
+            columns = [(name, function_name) for name in input_expr._node.args]
+        for column_name, column_function_name in columns:
+            pandas_name = POLARS_TO_PANDAS_AGGREGATIONS[column_function_name]
+            if pandas_name not in aggs[column_name]:
+                aggs[column_name].append(pandas_name)
+            sources.append((column_name, pandas_name))
+
+    if new_columns:
+        grouped = horizontal_concat(
+            [native, *new_columns],
+            implementation=df._implementation,
+            backend_version=df._backend_version,
+        ).groupby(keys, sort=False, as_index=True)
+    result = grouped.agg(aggs).loc[:, sources]
+    result.columns = output_names[len(keys) :]
+    return result.reset_index().loc[:, output_names]
+
+
+def window_pandas(
+    df: PandasDataFrame, expr: PandasExpr, keys: list[str]
+) -> list[PandasSeries] | None:
+    """
+    Evaluate `expr.over(keys)` without joining the aggregated frame back.
+
+    Aggregations become `groupby(...).transform`, and window functions such as
+    `cum_sum` use their grouped versions, so the result keeps the rows (and
+    index) of `df`. Their inputs get pre-projected just like in `agg_pandas`.
+    Returns `None` if `expr` can't be evaluated like this.
+    """
+    assert expr._output_names is not None
+    plan = plan_pandas_window(expr)
+    if plan is None:
+        return None
+    input_expr, mask, node = plan
+    codes = _group_codes(df, keys)
+    if input_expr is None:
+        # e.g. nw.len().over('a')
+        columns = [codes] * len(expr._output_names)
+    else:
+        columns = [_aligned(series, df) for series in evaluate_into_exprs(df, input_expr)]
+    native_mask = None if mask is None else _aligned(evaluate_expr(df, mask)[0], df)
+
+    result = []
+    for column, name in zip(columns, expr._output_names):
+        function_name = node.op
+        if native_mask is not None:
+            column, function_name = MASKED_AGGREGATIONS[function_name](  # noqa: PLW2901
+                column, native_mask
+            )
+        grouped = column.groupby(codes, sort=False)
+        if function_name in WINDOW_FUNCTIONS:
+            native_result = WINDOW_FUNCTIONS[function_name](grouped, node)
+        else:
+            native_result = grouped.transform(
+                POLARS_TO_PANDAS_AGGREGATIONS[function_name], **node.kwargs
+            )
+        result.append(
+            PandasSeries(
+                native_result,
+                implementation=df._implementation,
+                backend_version=df._backend_version,
+            ).alias(name)
+        )
+    return result
+
+
+def _group_codes(df: PandasDataFrame, keys: list[str]) -> Any:
+    """
+    Group number of each row of `df`, when grouping by `keys`.
+
+    While `df` has an expression cache, window expressions over the same keys
+    share these, so that the keys only get factorized once.
+    """
+    cache: dict[Any, Any] = {} if df._expr_cache is None else df._expr_cache
+    cache_key = ("group_codes", tuple(keys))
+    if cache_key not in cache:
+        cache[cache_key] = df._native_dataframe.groupby(
+            list(keys), sort=False, dropna=False
+        ).ngroup()
+    return cache[cache_key]
+
+
+def plan_pandas_aggregation(
+    expr: PandasExpr,
+) -> tuple[PandasExpr | None, PandasExpr | None, ExprNode] | None:
+    plan = plan_aggregation(expr, POLARS_TO_PANDAS_AGGREGATIONS, MASKED_AGGREGATIONS)
+    if plan is not None and plan[2].kwargs.get("ddof", 1) != 1:
+        # pandas' named aggregation can't take arguments.
+        return None
+    return plan
+
+
+def plan_pandas_window(
+    expr: PandasExpr,
+) -> tuple[PandasExpr | None, PandasExpr | None, ExprNode] | None:
+    return plan_aggregation(
+        expr,
+        [*POLARS_TO_PANDAS_AGGREGATIONS, *WINDOW_FUNCTIONS],
+        MASKED_AGGREGATIONS,
+    )
+
+
+def _aligned(series: PandasSeries, df: PandasDataFrame) -> Any:
+    """Native version of `series`, with the same index as `df`."""
+    return set_axis(
+        series._native_series,
+        df._native_dataframe.index,
+        implementation=df._implementation,
+        backend_version=df._backend_version,
+    )
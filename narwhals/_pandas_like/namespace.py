@@ -9,6 +9,7 @@ from typing import Iterable
 from narwhals import dtypes
 from narwhals._pandas_like.dataframe import PandasDataFrame
 from narwhals._pandas_like.expr import PandasExpr
+from narwhals._pandas_like.expr_node import ExprNode
 from narwhals._pandas_like.selectors import PandasSelectorNamespace
 from narwhals._pandas_like.series import PandasSeries
 from narwhals._pandas_like.utils import horizontal_concat
@@ -60,6 +61,8 @@ class PandasNamespace:
         function_name: str,
         root_names: list[str] | None,
         output_names: list[str] | None,
+        is_elementwise: bool,
+        node: ExprNode,
     ) -> PandasExpr:
         return PandasExpr(
             func,
@@ -67,6 +70,8 @@ class PandasNamespace:
             function_name=function_name,
             root_names=root_names,
             output_names=output_names,
+            is_elementwise=is_elementwise,
+            node=node,
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -77,7 +82,8 @@ class PandasNamespace:
         return PandasSeries._from_iterable(
             [value],
             name=series._native_series.name,
-            index=series._native_series.index[0:1],
+            # An empty series has no index to take the first value of.
+            index=series._native_series.index[0:1] if len(series) else None,
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -89,6 +95,8 @@ class PandasNamespace:
             function_name="series",
             root_names=None,
             output_names=None,
+            is_elementwise=False,
+            node=ExprNode("series", series),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -115,6 +123,8 @@ class PandasNamespace:
             function_name="all",
             root_names=None,
             output_names=None,
+            is_elementwise=True,
+            node=ExprNode("all"),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -138,6 +148,8 @@ class PandasNamespace:
             function_name="lit",
             root_names=None,
             output_names=["lit"],
+            is_elementwise=True,
+            node=ExprNode("lit", value, dtype),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -186,6 +198,8 @@ class PandasNamespace:
             function_name="len",
             root_names=None,
             output_names=["len"],
+            is_elementwise=False,
+            node=ExprNode("len"),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -218,6 +232,12 @@ class PandasNamespace:
         *,
         how: str = "vertical",
     ) -> PandasDataFrame:
+        from narwhals._lazy.dataframe import LazyPlanFrame
+
+        items = list(items)
+        if isinstance(items[0], LazyPlanFrame):
+            # Lazy frames record the concatenation in their plan instead.
+            return items[0]._concat(items[1:], how=how)
         dfs: list[Any] = [item._native_dataframe for item in items]
         if how == "horizontal":
             return PandasDataFrame(
@@ -0,0 +1,137 @@
+"""Parquet files which lazy plans read into pandas-like frames.
+
+A `ParquetSource` only reads its file when a plan which scans it gets
+collected, by which point the plan knows which columns it needs and which
+predicates it filters by. These get passed on to the library's own
+`read_parquet`, so that other columns don't get decoded, and the row groups
+which can't match get skipped.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from narwhals._lazy.filters import parquet_filters
+from narwhals._pandas_like.dataframe import PandasDataFrame
+
+if TYPE_CHECKING:
+    from narwhals._lazy.dataframe import LazyPlanFrame
+    from narwhals._lazy.filters import ParquetFilter
+    from narwhals._pandas_like.expr import PandasExpr
+
+
+class ParquetSource:
+    """A Parquet file, which a pandas-like library reads when needed."""
+
+    def __init__(
+        self,
+        source: str | Path,
+        *,
+        native_namespace: Any,
+        implementation: str,
+        backend_version: tuple[int, ...],
+    ) -> None:
+        self._source = source
+        self._native_namespace = native_namespace
+        self._implementation = implementation
+        self._backend_version = backend_version
+        # pandas-like libraries read Parquet files with PyArrow too. `source`
+        # may also be the directory of a hive-partitioned dataset.
+        self._dataset = import_module("pyarrow.dataset").dataset(
+            source, format="parquet", partitioning="hive"
+        )
+        self.schema = self._dataset.schema
+        # Whether each column has missing values, once it's been needed.
+        self._has_nulls: dict[str, bool] = {}
+
+    def __narwhals_lazyframe__(self) -> LazyPlanFrame:
+        from narwhals._lazy.dataframe import LazyPlanFrame
+        from narwhals._lazy.plan import ParquetScan
+
+        return LazyPlanFrame(
+            ParquetScan(self),
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+        )
+
+    @property
+    def name(self) -> str:
+        return Path(self._source).name
+
+    @property
+    def columns(self) -> list[str]:
+        # Files written by pandas may store the index as columns too.
+        metadata = self.schema.pandas_metadata or {}
+        index_columns = [
+            column
+            for column in metadata.get("index_columns", [])
+            if isinstance(column, str)
+        ]
+        return [name for name in self.schema.names if name not in index_columns]
+
+    def parquet_filters(self, predicate: PandasExpr) -> list[ParquetFilter] | None:
+        filters = parquet_filters(predicate._node, self.schema)
+        if filters is not None and any(op == "!=" for _, op, _ in filters):
+            # Missing values are unequal to everything in pandas, but the
+            # filters of Parquet readers never keep them.
+            return None
+        return filters
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        filters: list[ParquetFilter] | None = None,
+    ) -> PandasDataFrame:
+        native_dataframe = self._native_namespace.read_parquet(
+            self._source, columns=columns, filters=filters or None
+        )
+        if filters and self._implementation != "cudf":
+            native_dataframe = self._as_unfiltered(native_dataframe)
+        return PandasDataFrame(
+            native_dataframe,
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+        )
+
+    def _as_unfiltered(self, native_dataframe: Any) -> Any:
+        """Cast `native_dataframe` to the dtypes of an unfiltered read.
+
+        Integer and boolean columns with missing values become float and
+        object columns in pandas, but only if the rows which get read
+        include missing values, so filters can change the dtypes otherwise.
+        """
+        dtypes = {
+            name: "float64" if dtype.kind in "iu" else object
+            for name, dtype in native_dataframe.dtypes.items()
+            if getattr(dtype, "kind", None) in ("i", "u", "b")
+            and name in self.schema.names
+            and self._column_has_nulls(name)
+        }
+        if not dtypes:
+            return native_dataframe
+        return native_dataframe.astype(dtypes)
+
+    def _column_has_nulls(self, name: str) -> bool:
+        if name not in self._has_nulls:
+            self._has_nulls[name] = self._count_nulls(name) > 0
+        return self._has_nulls[name]
+
+    def _count_nulls(self, name: str) -> int:
+        # Statistics say how many values are missing without reading them.
+        count = 0
+        for fragment in self._dataset.get_fragments():
+            metadata = fragment.metadata
+            names = metadata.schema.names
+            statistics = [
+                metadata.row_group(i).column(names.index(name)).statistics
+                if name in names
+                else None  # e.g. partition columns, whose values are in the paths
+                for i in range(metadata.num_row_groups)
+            ]
+            if any(stats is None or not stats.has_null_count for stats in statistics):
+                return int(self._dataset.to_table(columns=[name])[name].null_count)
+            count += sum(stats.null_count for stats in statistics)
+        return count
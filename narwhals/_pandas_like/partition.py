@@ -0,0 +1,230 @@
+"""Partitioned execution for pandas frames.
+
+With `narwhals.Config(partitions=N)`, large pandas frames get split into row
+partitions, and operations which work row by row (e.g. filtering by, or
+selecting, elementwise expressions) run on each of them separately, in the
+thread pool. Group-by aggregations get computed per partition too, and the
+partial results combined afterwards.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
+from narwhals import dtypes
+from narwhals._pandas_like.utils import evaluate_into_exprs
+from narwhals._pandas_like.utils import generate_unique_token
+from narwhals._pandas_like.utils import horizontal_concat
+from narwhals._pandas_like.utils import parse_into_exprs
+from narwhals._pandas_like.utils import set_axis
+from narwhals._pandas_like.utils import vertical_concat
+from narwhals.config import Config
+from narwhals.config import parallel_map
+from narwhals.utils import isinstance_or_issubclass
+
+if TYPE_CHECKING:
+    from narwhals._pandas_like.dataframe import PandasDataFrame
+    from narwhals._pandas_like.expr import PandasExpr
+    from narwhals._pandas_like.expr_node import ExprNode
+
+# Partitions smaller than this aren't worth the overhead.
+MIN_ROWS_PER_PARTITION = 50_000
+
+# Aggregations which can be computed per partition and combined afterwards:
+# `op -> [(pandas aggregation per partition, pandas aggregation to combine)]`.
+PARTIAL_AGGREGATIONS = {
+    "sum": [("sum", "sum")],
+    "min": [("min", "min")],
+    "max": [("max", "max")],
+    "any": [("any", "any")],
+    "all": [("all", "all")],
+    "len": [("size", "sum")],
+    # The sum of the sums, divided by the sum of the (non-null) counts.
+    "mean": [("sum", "sum"), ("count", "sum")],
+}
+
+
+def n_partitions(df: PandasDataFrame) -> int:
+    """Number of partitions to split `df` into (1 means not to split it)."""
+    if df._implementation != "pandas":
+        # Modin partitions frames itself, and cuDF runs on the GPU.
+        return 1
+    return max(1, min(Config.partitions(), len(df) // MIN_ROWS_PER_PARTITION))
+
+
+def split(df: PandasDataFrame, n: int) -> list[PandasDataFrame]:
+    """Split `df` into `n` partitions of consecutive rows, of (nearly) equal sizes."""
+    native = df._native_dataframe
+    bounds = [len(native) * i // n for i in range(n + 1)]
+    return [
+        df._from_native_dataframe(native.iloc[start:stop])
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def row_partitions(
+    df: PandasDataFrame, *exprs: Any, **named_exprs: Any
+) -> list[PandasDataFrame] | None:
+    """Partitions of `df` to evaluate `exprs` on separately, or `None` if `df`
+    shouldn't be partitioned.
+
+    Only elementwise expressions give the same results when evaluated on
+    partitions, and only if their dtypes don't depend on the values (see
+    `infers_dtype`). At least one of them also needs to read a column:
+    literals on their own have a single row, rather than one per row of the
+    partition.
+    """
+    if (n := n_partitions(df)) == 1:
+        return None
+    parsed = parse_into_exprs(
+        df._implementation,
+        *exprs,
+        backend_version=df._backend_version,
+        **named_exprs,
+    )
+    if (
+        not all(expr._is_elementwise for expr in parsed)
+        or not any(expr._node.reads_columns for expr in parsed)
+        or any(infers_dtype(node) for expr in parsed for node in expr._node.walk())
+    ):
+        return None
+    return split(df, n)
+
+
+def infers_dtype(node: ExprNode) -> bool:
+    """Whether the dtype of `node` gets inferred from the values it sees.
+
+    Each partition would infer its own, e.g. its own categories, and
+    concatenating partitions with different dtypes falls back to `object`.
+    """
+    if node.op == "cast":
+        return isinstance_or_issubclass(
+            node.kwargs["dtype"], (dtypes.Categorical, dtypes.Enum)
+        )
+    # Without a format, pandas infers it from the values.
+    return node.op == "str.to_datetime" and node.args[1] is None
+
+
+def concat_partitions(
+    df: PandasDataFrame, partitions: Iterable[PandasDataFrame]
+) -> PandasDataFrame:
+    return df._from_native_dataframe(
+        vertical_concat(
+            [partition._native_dataframe for partition in partitions],
+            implementation=df._implementation,
+            backend_version=df._backend_version,
+        )
+    )
+
+
+def map_partitions(
+    df: PandasDataFrame,
+    partitions: list[PandasDataFrame],
+    function: Callable[[PandasDataFrame], PandasDataFrame],
+) -> PandasDataFrame:
+    """Apply `function` to each partition, and concatenate the results in order."""
+    return concat_partitions(df, parallel_map(function, partitions))
+
+
+def can_agg_partitioned(
+    plans: list[tuple[PandasExpr | None, PandasExpr | None, ExprNode]],
+) -> bool:
+    return all(
+        mask is None and node.op in PARTIAL_AGGREGATIONS for _, mask, node in plans
+    )
+
+
+def agg_partitioned(  # noqa: PLR0913
+    df: PandasDataFrame,
+    exprs: list[PandasExpr],
+    plans: list[tuple[PandasExpr | None, PandasExpr | None, ExprNode]],
+    keys: list[str],
+    output_names: list[str],
+    n: int,
+) -> Any:
+    """
+    Aggregate each of `n` partitions of `df`, and combine the partial results.
+
+    `plans` are those of `narwhals._pandas_like.group_by.agg_planned`, and
+    each of their aggregations needs to be in `PARTIAL_AGGREGATIONS`. Returns
+    the native result.
+    """
+    input_exprs = [input_expr for input_expr, _, _ in plans if input_expr is not None]
+    # Names of the partial results of each output, and how to combine them.
+    partial_columns: list[list[tuple[str, str, str]]] = []
+    taken = [*df.columns, *keys]
+    for expr, (_, _, node) in zip(exprs, plans):
+        assert expr._output_names is not None
+        for _ in expr._output_names:
+            columns = []
+            for partial_function, combine_function in PARTIAL_AGGREGATIONS[node.op]:
+                name = generate_unique_token(8, taken)
+                taken.append(name)
+                columns.append((name, partial_function, combine_function))
+            partial_columns.append(columns)
+
+    def aggregate_partition(partition: PandasDataFrame) -> Any:
+        native = partition._native_dataframe
+        evaluated = iter(evaluate_into_exprs(partition, *input_exprs))
+        columns = [native.loc[:, key] for key in keys]
+        aggs = {}
+        outputs = iter(partial_columns)
+        for expr, (input_expr, _, _) in zip(exprs, plans):
+            for _ in expr._output_names:  # type: ignore[union-attr]
+                if input_expr is None:
+                    # e.g. agg(nw.len()): any column will do to count the rows.
+                    column = native.loc[:, keys[0]]
+                else:
+                    column = set_axis(
+                        next(evaluated)._native_series,
+                        native.index,
+                        implementation=df._implementation,
+                        backend_version=df._backend_version,
+                    )
+                for name, partial_function, _ in next(outputs):
+                    columns.append(column.rename(name))
+                    aggs[name] = partial_function
+        return (
+            horizontal_concat(
+                columns,
+                implementation=df._implementation,
+                backend_version=df._backend_version,
+            )
+            .groupby(keys, sort=False)
+            .agg(aggs)
+            .reset_index()
+        )
+
+    partials = parallel_map(aggregate_partition, split(df, n))
+    combined = (
+        vertical_concat(
+            partials,
+            implementation=df._implementation,
+            backend_version=df._backend_version,
+        )
+        .groupby(keys, sort=False)
+        .agg(
+            {
+                name: combine_function
+                for columns in partial_columns
+                for name, _, combine_function in columns
+            }
+        )
+        .reset_index()
+    )
+    result = [combined.loc[:, key] for key in keys]
+    for columns, output_name in zip(partial_columns, output_names[len(keys) :]):
+        if len(columns) == 1:
+            column = combined.loc[:, columns[0][0]]
+        else:
+            # mean
+            column = combined.loc[:, columns[0][0]] / combined.loc[:, columns[1][0]]
+        result.append(column.rename(output_name))
+    return horizontal_concat(
+        result,
+        implementation=df._implementation,
+        backend_version=df._backend_version,
+    )
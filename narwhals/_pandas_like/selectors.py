@@ -6,6 +6,7 @@ from typing import NoReturn
 
 from narwhals import dtypes
 from narwhals._pandas_like.expr import PandasExpr
+from narwhals._pandas_like.expr_node import ExprNode
 
 if TYPE_CHECKING:
     from narwhals._pandas_like.dataframe import PandasDataFrame
@@ -20,7 +21,8 @@ class PandasSelectorNamespace:
 
     def by_dtype(self, dtypes: list[DType | type[DType]]) -> PandasSelector:
         def func(df: PandasDataFrame) -> list[PandasSeries]:
-            return [df[col] for col in df.columns if df.schema[col] in dtypes]
+            schema = df.schema
+            return [df[col] for col in df.columns if schema[col] in dtypes]
 
         return PandasSelector(
             func,
@@ -28,6 +30,8 @@ class PandasSelectorNamespace:
             function_name="type_selector",
             root_names=None,
             output_names=None,
+            is_elementwise=True,
+            node=ExprNode("selector", "by_dtype", *dtypes),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -67,6 +71,8 @@ class PandasSelectorNamespace:
             function_name="type_selector",
             root_names=None,
             output_names=None,
+            is_elementwise=True,
+            node=ExprNode("selector", "all"),
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -89,6 +95,8 @@ class PandasSelector(PandasExpr):
             function_name=self._function_name,
             root_names=self._root_names,
             output_names=self._output_names,
+            is_elementwise=self._is_elementwise,
+            node=self._node,
             implementation=self._implementation,
             backend_version=self._backend_version,
         )
@@ -107,6 +115,8 @@ class PandasSelector(PandasExpr):
                 function_name="type_selector",
                 root_names=None,
                 output_names=None,
+                is_elementwise=True,
+                node=ExprNode("selector", "__sub__", self._node, other._node),
                 implementation=self._implementation,
                 backend_version=self._backend_version,
             )
@@ -127,6 +137,8 @@ class PandasSelector(PandasExpr):
                 function_name="type_selector",
                 root_names=None,
                 output_names=None,
+                is_elementwise=True,
+                node=ExprNode("selector", "__or__", self._node, other._node),
                 implementation=self._implementation,
                 backend_version=self._backend_version,
             )
@@ -147,6 +159,8 @@ class PandasSelector(PandasExpr):
                 function_name="type_selector",
                 root_names=None,
                 output_names=None,
+                is_elementwise=True,
+                node=ExprNode("selector", "__and__", self._node, other._node),
                 implementation=self._implementation,
                 backend_version=self._backend_version,
             )
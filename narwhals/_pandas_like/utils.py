@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import secrets
 from copy import copy
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Iterable
 from typing import TypeVar
 
+from narwhals._pandas_like.expr_node import ExprNode
+from narwhals._pandas_like.expr_node import returns_scalar
+from narwhals.config import parallel_map
 from narwhals.dependencies import get_cudf
 from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pandas
 from narwhals.dependencies import get_pyarrow
+from narwhals.profiling import profile_expression
 from narwhals.utils import flatten
 from narwhals.utils import isinstance_or_issubclass
 
@@ -96,10 +101,26 @@ def maybe_evaluate_expr(df: PandasDataFrame, expr: Any) -> Any:
     from narwhals._pandas_like.expr import PandasExpr
 
     if isinstance(expr, (PandasExpr, ArrowExpr)):
-        return expr._call(df)  # type: ignore[arg-type]
+        return evaluate_expr(df, expr)  # type: ignore[arg-type]
     return expr
 
 
+def evaluate_expr(df: PandasDataFrame, expr: PandasExpr) -> list[PandasSeries]:
+    """Evaluate `expr` on `df`.
+
+    While `df` has an expression cache (see `evaluate_into_exprs`), results
+    are reused for structurally identical (sub)expressions, so that each of
+    them only gets computed once.
+    """
+    cache = df._expr_cache
+    key = expr._node.key
+    if cache is None or key is None:
+        return profile_expression(df, expr)
+    if key not in cache:
+        cache[key] = profile_expression(df, expr)
+    return cache[key]
+
+
 def parse_into_exprs(
     implementation: str,
     *exprs: IntoPandasExpr | Iterable[IntoPandasExpr],
@@ -193,31 +214,47 @@ def create_native_series(
     )
 
 
-def evaluate_into_expr(
-    df: PandasDataFrame, into_expr: IntoPandasExpr
-) -> list[PandasSeries]:
-    """
-    Return list of raw columns.
-    """
-    expr = parse_into_expr(
-        into_expr, implementation=df._implementation, backend_version=df._backend_version
-    )
-    return expr._call(df)
-
-
 def evaluate_into_exprs(
     df: PandasDataFrame,
     *exprs: IntoPandasExpr,
     **named_exprs: IntoPandasExpr,
 ) -> list[PandasSeries]:
-    """Evaluate each expr into Series."""
+    """Evaluate each expr into Series.
+
+    Common subexpressions only get evaluated once. Independent expressions get
+    evaluated concurrently if `narwhals.Config(threads=...)` allows it.
+    """
+    parsed = [
+        parse_into_expr(
+            into_expr,
+            implementation=df._implementation,
+            backend_version=df._backend_version,
+        )
+        for into_expr in flatten(exprs)
+    ]
+    n_positional = len(parsed)
+    parsed.extend(
+        parse_into_expr(
+            expr, implementation=df._implementation, backend_version=df._backend_version
+        )
+        for expr in named_exprs.values()
+    )
+    # Whoever creates the cache clears it, so that results don't outlive
+    # the evaluation (and nested evaluations on `df` share it).
+    owns_cache = df._expr_cache is None
+    if owns_cache:
+        df._expr_cache = {}
+    try:
+        # Threads may race to compute a shared subexpression, in which case
+        # it gets computed more than once, but with the same result.
+        evaluated = parallel_map(partial(evaluate_expr, df), parsed)
+    finally:
+        if owns_cache:
+            df._expr_cache = None
     series: list[PandasSeries] = [
-        item
-        for sublist in [evaluate_into_expr(df, into_expr) for into_expr in flatten(exprs)]
-        for item in sublist
+        item for sublist in evaluated[:n_positional] for item in sublist
     ]
-    for name, expr in named_exprs.items():
-        evaluated_expr = evaluate_into_expr(df, expr)
+    for name, evaluated_expr in zip(named_exprs, evaluated[n_positional:]):
         if len(evaluated_expr) > 1:
             msg = "Named expressions must return a single column"  # pragma: no cover
             raise AssertionError(msg)
@@ -226,7 +263,12 @@ def evaluate_into_exprs(
 
 
 def reuse_series_implementation(
-    expr: ExprT, attr: str, *args: Any, returns_scalar: bool = False, **kwargs: Any
+    expr: ExprT,
+    attr: str,
+    *args: Any,
+    returns_scalar: bool = False,
+    is_elementwise: bool = True,
+    **kwargs: Any,
 ) -> ExprT:
     """Reuse Series implementation for expression.
 
@@ -238,13 +280,15 @@ def reuse_series_implementation(
         attr: name of method.
         returns_scalar: whether the Series version returns a scalar. In this case,
             the expression version should return a 1-row Series.
+        is_elementwise: whether each output row only depends on the same row of the
+            input (as opposed to, say, `cum_sum` or `sort`). Reductions never are.
         args, kwargs: arguments and keyword arguments to pass to function.
     """
     plx = expr.__narwhals_namespace__()
 
     def func(df: PandasDataFrame) -> list[PandasSeries]:
         out: list[PandasSeries] = []
-        for column in expr._call(df):
+        for column in evaluate_expr(df, expr):
             _out = getattr(column, attr)(
                 *[maybe_evaluate_expr(df, arg) for arg in args],
                 **{
@@ -260,6 +304,20 @@ def reuse_series_implementation(
             assert [s.name for s in out] == expr._output_names
         return out
 
+    # The result is only elementwise if all of its inputs are: Series in
+    # particular are tied to the rows of the frame they came from.
+    is_elementwise = (
+        is_elementwise
+        and not returns_scalar
+        and expr._is_elementwise
+        and all(
+            arg._is_elementwise
+            if isinstance(arg, expr.__class__)
+            else not hasattr(arg, "__narwhals_series__")
+            for arg in list(args) + list(kwargs.values())
+        )
+    )
+
     # Try tracking root and output names by combining them from all
     # expressions appearing in args and kwargs. If any anonymous
     # expression appears (e.g. nw.all()), then give up on tracking root names
@@ -288,11 +346,23 @@ def reuse_series_implementation(
         function_name=f"{expr._function_name}->{attr}",
         root_names=root_names,
         output_names=output_names,
+        is_elementwise=is_elementwise,
+        node=ExprNode(
+            attr,
+            expr._node,
+            *(_to_node(arg) for arg in args),
+            **{name: _to_node(value) for name, value in kwargs.items()},
+        ),
     )
 
 
 def reuse_series_namespace_implementation(
-    expr: ExprT, namespace: str, attr: str, *args: Any, **kwargs: Any
+    expr: ExprT,
+    namespace: str,
+    attr: str,
+    *args: Any,
+    is_elementwise: bool = True,
+    **kwargs: Any,
 ) -> PandasExpr:
     """Just like `reuse_series_implementation`, but for e.g. `Expr.dt.foo` instead
     of `Expr.foo`.
@@ -302,32 +372,32 @@ def reuse_series_namespace_implementation(
     return PandasExpr(
         lambda df: [
             getattr(getattr(series, namespace), attr)(*args, **kwargs)
-            for series in expr._call(df)
+            for series in evaluate_expr(df, expr)
         ],
         depth=expr._depth + 1,
         function_name=f"{expr._function_name}->{namespace}.{attr}",
         root_names=expr._root_names,
         output_names=expr._output_names,
+        is_elementwise=is_elementwise and expr._is_elementwise,
+        node=ExprNode(
+            f"{namespace}.{attr}",
+            expr._node,
+            *(_to_node(arg) for arg in args),
+            **{name: _to_node(value) for name, value in kwargs.items()},
+        ),
         implementation=expr._implementation,
         backend_version=expr._backend_version,
     )
 
 
-def is_simple_aggregation(expr: PandasExpr) -> bool:
-    """
-    Check if expr is a very simple one, such as:
-
-    - nw.col('a').mean()  # depth 1
-    - nw.mean('a')  # depth 1
-    - nw.len()  # depth 0
-
-    as opposed to, say
-
-    - nw.col('a').filter(nw.col('b')>nw.col('c')).max()
+def _to_node(value: Any) -> Any:
+    """Node of `value` if it's an expression, otherwise `value` itself."""
+    from narwhals._arrow.expr import ArrowExpr
+    from narwhals._pandas_like.expr import PandasExpr
 
-    because then, we can use a fastpath in pandas.
-    """
-    return expr._depth < 2
+    if isinstance(value, (PandasExpr, ArrowExpr)):
+        return value._node
+    return value
 
 
 def horizontal_concat(
@@ -431,27 +501,103 @@ def set_axis(
     return obj.set_axis(index, axis=0, **kwargs)  # type: ignore[no-any-return, attr-defined]
 
 
+def supports_cross_join(implementation: str, backend_version: tuple[int, ...]) -> bool:
+    """Whether `merge(how="cross")` is available.
+
+    It isn't in modin or cuDF, nor in pandas before 1.4, which instead need to
+    merge on a constant key column.
+    """
+    return implementation == "pandas" and backend_version >= (1, 4)
+
+
+def with_columns_slow_path(inputs: Iterable[Any]) -> str | None:
+    """Why `PandasDataFrame.with_columns` has to `assign` the columns computed
+    from `inputs`, or `None` if it can concatenate them onto the frame.
+
+    Concatenating is faster, but needs full columns. Results which only turn
+    out to have a single row when evaluated (e.g. on a frame with a single
+    row) still get assigned.
+    """
+    from narwhals._pandas_like.expr import PandasExpr
+
+    inputs = list(inputs)
+    if not all(isinstance(x, PandasExpr) for x in inputs):
+        # We might be changing the flags of Series inputs otherwise. See
+        # `test_memmap` for an example of where this is necessary.
+        return "Series inputs can't be concatenated"
+    for expr in inputs:
+        if returns_scalar(expr._node):
+            return f"{expr._node} returns a single value which needs broadcasting"
+    return None
+
+
+# Narwhals dtype of each native dtype translated so far, so that translating
+# a dtype which has been seen before is a single dict lookup. Object dtypes
+# never get in here, as they're translated based on the values of a column,
+# and neither do dtypes with parameters (see `_is_parameter_free`).
+_TRANSLATED_DTYPES: dict[Any, type[DType]] = {}
+
+
+def _is_parameter_free(dtype: Any) -> bool:
+    """Whether `dtype` is one of a fixed set of dtypes, so it's safe to cache.
+
+    That's numpy's dtypes and pandas' nullable ones. Dtypes with parameters,
+    e.g. categoricals (with their categories), time zone aware datetimes or
+    PyArrow dtypes, can take any number of values, which a cache would keep
+    alive for as long as the process runs.
+    """
+    if isinstance(dtype, get_numpy().dtype):
+        return True
+    if (pd := get_pandas()) is not None and isinstance(dtype, pd.StringDtype):
+        # Its only parameter is the storage, e.g. "python" or "pyarrow".
+        return True
+    # Extension dtypes list their parameters in `_metadata`.
+    return getattr(dtype, "_metadata", None) == ()
+
+
 def translate_dtype(column: Any) -> DType:
     from narwhals import dtypes
 
     dtype = column.dtype
-    if str(dtype) in ("int64", "Int64", "Int64[pyarrow]", "int64[pyarrow]"):
+    cacheable = _is_parameter_free(dtype)
+    if cacheable and (translated := _TRANSLATED_DTYPES.get(dtype)) is not None:
+        return translated()
+    if str(dtype) == "object":
+        if (idx := column.first_valid_index()) is not None and isinstance(
+            column.loc[idx], str
+        ):
+            # Infer based on first non-missing value.
+            # For pandas pre 3.0, this isn't perfect.
+            # After pandas 3.0, pandas has a dedicated string dtype
+            # which is inferred by default.
+            return dtypes.String()
+        return dtypes.Object()
+    result = _translate_native_dtype(str(dtype))
+    if cacheable:
+        _TRANSLATED_DTYPES[dtype] = type(result)
+    return result
+
+
+def _translate_native_dtype(dtype: str) -> DType:
+    from narwhals import dtypes
+
+    if dtype in ("int64", "Int64", "Int64[pyarrow]", "int64[pyarrow]"):
         return dtypes.Int64()
-    if str(dtype) in ("int32", "Int32", "Int32[pyarrow]", "int32[pyarrow]"):
+    if dtype in ("int32", "Int32", "Int32[pyarrow]", "int32[pyarrow]"):
         return dtypes.Int32()
-    if str(dtype) in ("int16", "Int16", "Int16[pyarrow]", "int16[pyarrow]"):
+    if dtype in ("int16", "Int16", "Int16[pyarrow]", "int16[pyarrow]"):
         return dtypes.Int16()
-    if str(dtype) in ("int8", "Int8", "Int8[pyarrow]", "int8[pyarrow]"):
+    if dtype in ("int8", "Int8", "Int8[pyarrow]", "int8[pyarrow]"):
         return dtypes.Int8()
-    if str(dtype) in ("uint64", "UInt64", "UInt64[pyarrow]", "uint64[pyarrow]"):
+    if dtype in ("uint64", "UInt64", "UInt64[pyarrow]", "uint64[pyarrow]"):
         return dtypes.UInt64()
-    if str(dtype) in ("uint32", "UInt32", "UInt32[pyarrow]", "uint32[pyarrow]"):
+    if dtype in ("uint32", "UInt32", "UInt32[pyarrow]", "uint32[pyarrow]"):
         return dtypes.UInt32()
-    if str(dtype) in ("uint16", "UInt16", "UInt16[pyarrow]", "uint16[pyarrow]"):
+    if dtype in ("uint16", "UInt16", "UInt16[pyarrow]", "uint16[pyarrow]"):
         return dtypes.UInt16()
-    if str(dtype) in ("uint8", "UInt8", "UInt8[pyarrow]", "uint8[pyarrow]"):
+    if dtype in ("uint8", "UInt8", "UInt8[pyarrow]", "uint8[pyarrow]"):
         return dtypes.UInt8()
-    if str(dtype) in (
+    if dtype in (
         "float64",
         "Float64",
         "Float64[pyarrow]",
@@ -459,7 +605,7 @@ def translate_dtype(column: Any) -> DType:
         "double[pyarrow]",
     ):
         return dtypes.Float64()
-    if str(dtype) in (
+    if dtype in (
         "float32",
         "Float32",
         "Float32[pyarrow]",
@@ -467,39 +613,29 @@ def translate_dtype(column: Any) -> DType:
         "float[pyarrow]",
     ):
         return dtypes.Float32()
-    if str(dtype) in (
+    if dtype in (
         "string",
         "string[python]",
         "string[pyarrow]",
         "large_string[pyarrow]",
     ):
         return dtypes.String()
-    if str(dtype) in ("bool", "boolean", "boolean[pyarrow]", "bool[pyarrow]"):
+    if dtype in ("bool", "boolean", "boolean[pyarrow]", "bool[pyarrow]"):
         return dtypes.Boolean()
-    if str(dtype) in ("category",) or str(dtype).startswith("dictionary<"):
+    if dtype in ("category",) or dtype.startswith("dictionary<"):
         return dtypes.Categorical()
-    if str(dtype).startswith("datetime64"):
+    if dtype.startswith("datetime64"):
         # todo: different time units and time zones
         return dtypes.Datetime()
-    if str(dtype).startswith("timedelta64") or str(dtype).startswith("duration"):
+    if dtype.startswith(("timedelta64", "duration")):
         # todo: different time units
         return dtypes.Duration()
-    if str(dtype).startswith("timestamp["):
+    if dtype.startswith("timestamp["):
         # pyarrow-backed datetime
         # todo: different time units and time zones
         return dtypes.Datetime()
-    if str(dtype) == "date32[day][pyarrow]":
+    if dtype == "date32[day][pyarrow]":
         return dtypes.Date()
-    if str(dtype) == "object":
-        if (idx := column.first_valid_index()) is not None and isinstance(
-            column.loc[idx], str
-        ):
-            # Infer based on first non-missing value.
-            # For pandas pre 3.0, this isn't perfect.
-            # After pandas 3.0, pandas has a dedicated string dtype
-            # which is inferred by default.
-            return dtypes.String()
-        return dtypes.Object()
     return dtypes.Unknown()
 
 
@@ -634,6 +770,19 @@ def reverse_translate_dtype(  # noqa: PLR0915
     raise AssertionError(msg)
 
 
+def numpy_result_type(dtypes: list[Any]) -> Any:
+    """The NumPy dtype which values of each of `dtypes` can be stored in together.
+
+    Like pandas and Polars, dtypes which NumPy can't promote to a common one
+    (e.g. numbers and datetimes) get stored as objects.
+    """
+    np = get_numpy()
+    try:
+        return np.result_type(*dtypes)
+    except TypeError:
+        return np.dtype("object")
+
+
 def validate_indices(series: list[PandasSeries]) -> list[Any]:
     idx = series[0]._native_series.index
     reindexed = [series[0]._native_series]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Iterator
+
+    from typing_extensions import Self
+
+# Number of threads which independent expressions get evaluated in.
+_THREADS = 1
+# Number of row partitions which pandas frames get split into.
+_PARTITIONS = 1
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+# Number of `parallel_map` calls using each pool. Pools which got replaced
+# (by `set_threads`) get shut down once they're no longer used.
+_EXECUTOR_USERS: dict[ThreadPoolExecutor, int] = {}
+# Set in the pool's threads, so that expressions evaluated within them (e.g.
+# by `over`) don't wait on the pool they're occupying.
+_WORKER = threading.local()
+
+
+class Config:
+    """
+    Configure how Narwhals evaluates expressions on pandas-like and PyArrow frames.
+
+    Settings apply as soon as a `Config` is created, and stay in place until
+    they're changed again. When used as a context manager, the previous
+    settings get restored on exit. Settings are process-wide rather than
+    per-thread: they apply to every thread, and a `Config` used as a context
+    manager in one thread changes them in the others too. Changing the number
+    of threads while other threads are evaluating expressions is safe though,
+    as those finish with the pool they started with. Polars manages its own
+    thread pool, so these settings don't affect Polars objects.
+
+    Arguments:
+        threads: Number of threads to evaluate independent expressions in, e.g.
+            the expressions passed to `select`, `with_columns` or
+            `group_by(...).agg`. Most pandas, NumPy and PyArrow kernels release
+            the GIL, so wide projections can use several cores. Results come
+            back in the same order as with a single thread, which is the
+            default.
+        partitions: Number of row partitions to split (large) pandas frames into.
+            `filter`, `select` and `with_columns` of elementwise expressions
+            then run on each partition separately, in the thread pool, and so
+            do `group_by(...).agg` of aggregations which can be combined
+            afterwards (e.g. a sum of sums, or a count-weighted mean). Frames
+            with fewer than 50,000 rows per partition aren't worth splitting.
+            The default is not to partition.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 2, 3]}))
+        >>> with nw.Config(threads=4):
+        ...     result = df.select(*(nw.col("a").alias(f"a_{i}") * i for i in range(200)))
+        >>> result.columns[:3]
+        ['a_0', 'a_1', 'a_2']
+        >>> nw.Config.threads()
+        1
+    """
+
+    def __init__(
+        self, *, threads: int | None = None, partitions: int | None = None
+    ) -> None:
+        self._previous_threads = _THREADS
+        self._previous_partitions = _PARTITIONS
+        if threads is not None:
+            self.set_threads(threads)
+        if partitions is not None:
+            self.set_partitions(partitions)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.set_threads(self._previous_threads)
+        self.set_partitions(self._previous_partitions)
+
+    @staticmethod
+    def set_threads(threads: int) -> None:
+        """Set the number of threads to evaluate independent expressions in."""
+        global _THREADS, _EXECUTOR  # noqa: PLW0603
+        if threads < 1:
+            msg = f"Expected a positive number of threads, got: {threads}"
+            raise ValueError(msg)
+        with _EXECUTOR_LOCK:
+            _THREADS = threads
+            if _EXECUTOR is not None:
+                if _EXECUTOR not in _EXECUTOR_USERS:
+                    # Tasks which were already submitted still get to finish.
+                    _EXECUTOR.shutdown(wait=False)
+                # Otherwise, the last `parallel_map` using it shuts it down.
+                _EXECUTOR = None
+
+    @staticmethod
+    def threads() -> int:
+        """Number of threads which independent expressions get evaluated in."""
+        return _THREADS
+
+    @staticmethod
+    def set_partitions(partitions: int) -> None:
+        """Set the number of row partitions to split pandas frames into."""
+        global _PARTITIONS  # noqa: PLW0603
+        if partitions < 1:
+            msg = f"Expected a positive number of partitions, got: {partitions}"
+            raise ValueError(msg)
+        _PARTITIONS = partitions
+
+    @staticmethod
+    def partitions() -> int:
+        """Number of row partitions which pandas frames get split into."""
+        return _PARTITIONS
+
+
+def get_executor() -> ThreadPoolExecutor | None:
+    """Pool to evaluate independent expressions in, or `None` to evaluate them
+    one after the other."""
+    if _THREADS == 1 or getattr(_WORKER, "active", False):
+        return None
+    with _EXECUTOR_LOCK:
+        return _get_executor_locked()
+
+
+def _get_executor_locked() -> ThreadPoolExecutor | None:
+    global _EXECUTOR  # noqa: PLW0603
+    if _THREADS == 1:
+        return None
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=_THREADS,
+            thread_name_prefix="narwhals",
+            initializer=_mark_worker,
+        )
+    return _EXECUTOR
+
+
+@contextmanager
+def _use_executor() -> Iterator[ThreadPoolExecutor | None]:
+    """The pool, which doesn't get shut down until it's no longer used."""
+    if getattr(_WORKER, "active", False):
+        yield None
+        return
+    with _EXECUTOR_LOCK:
+        executor = _get_executor_locked()
+        if executor is not None:
+            _EXECUTOR_USERS[executor] = _EXECUTOR_USERS.get(executor, 0) + 1
+    try:
+        yield executor
+    finally:
+        if executor is not None:
+            with _EXECUTOR_LOCK:
+                _EXECUTOR_USERS[executor] -= 1
+                if not _EXECUTOR_USERS[executor]:
+                    del _EXECUTOR_USERS[executor]
+                    if executor is not _EXECUTOR:
+                        # It got replaced while in use.
+                        executor.shutdown(wait=False)
+
+
+def _mark_worker() -> None:
+    _WORKER.active = True
+
+
+def parallel_map(function: Any, items: list[Any]) -> list[Any]:
+    """Apply `function` to each of `items`, in the pool if there is one.
+
+    Results are in the same order as `items`.
+    """
+    if len(items) > 1:
+        with _use_executor() as executor:
+            if executor is not None:
+                return list(executor.map(function, items))
+    return [function(item) for item in items]
@@ -174,11 +174,11 @@ class BaseFrame(Generic[FrameT]):
         self,
         other: Self,
         *,
-        how: Literal["inner", "cross", "anti"] = "inner",
+        how: Literal["inner", "cross", "anti", "semi"] = "inner",
         left_on: str | list[str] | None = None,
         right_on: str | list[str] | None = None,
     ) -> Self:
-        _supported_joins = {"inner", "cross", "anti"}
+        _supported_joins = {"inner", "cross", "anti", "semi"}
         if how not in _supported_joins:
             msg = f"Only the following join stragies are supported: {_supported_joins}"
             raise NotImplementedError(msg)
@@ -267,7 +267,8 @@ class DataFrame(BaseFrame[FrameT]):
             ... def func(df_any):
             ...     return df_any.lazy()
 
-            Note that then, pandas dataframe stay eager, but Polars DataFrame becomes a Polars LazyFrame:
+            Note that then, operations on the pandas dataframe get recorded in a logical plan
+            (which runs when converting back to native), and Polars DataFrame becomes a Polars LazyFrame:
 
             >>> func(df_pd)
                foo  bar ham
@@ -315,10 +316,42 @@ class DataFrame(BaseFrame[FrameT]):
         """
         return self._dataframe.to_pandas()
 
-    def write_parquet(self, file: str | Path | BytesIO) -> Any:
+    def write_parquet(  # noqa: PLR0913
+        self,
+        file: str | Path | BytesIO,
+        *,
+        compression: str = "zstd",
+        compression_level: int | None = None,
+        statistics: bool = True,
+        row_group_size: int | None = None,
+        partition_by: str | list[str] | None = None,
+        use_dictionary: bool = True,
+    ) -> Any:
         """
         Write dataframe to parquet file.
 
+        Readers which filter rows (such as `narwhals.scan_parquet`) skip the row
+        groups whose statistics show that none of their rows can match, and the
+        partitions whose values don't match. Smaller row groups can be skipped
+        more precisely, at the cost of larger files.
+
+        Arguments:
+            file: File path, or buffer, to write to. If `partition_by` is given,
+                this is the directory of the dataset instead.
+            compression: Compression codec: one of "lz4", "uncompressed",
+                "snappy", "gzip", "brotli" or "zstd".
+            compression_level: Compression level, whose meaning depends on the
+                codec. The default is the codec's.
+            statistics: Whether to write the minimum, maximum and null count of
+                each column, for each row group.
+            row_group_size: Maximum number of rows per row group. The default is
+                the backend's.
+            partition_by: Columns to write a hive-partitioned dataset by, with one
+                directory per value (e.g. `year=2024/`) and without these columns
+                in the files.
+            use_dictionary: Whether to dictionary-encode columns, which makes
+                columns with few distinct values smaller.
+
         Examples:
             Construct pandas and Polars DataFrames:
 
@@ -339,8 +372,76 @@ class DataFrame(BaseFrame[FrameT]):
 
             >>> func(df_pd)  # doctest:+SKIP
             >>> func(df_pl)  # doctest:+SKIP
+
+            To write a dataset with one directory per value of "ham", and row
+            groups of at most 100,000 rows:
+
+            >>> nw.from_native(df_pd).write_parquet(
+            ...     "dataset", partition_by="ham", row_group_size=100_000
+            ... )  # doctest:+SKIP
         """
-        self._dataframe.write_parquet(file)
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        if self._is_polars:
+            self._dataframe.write_parquet(
+                file,
+                **_polars_parquet_options(
+                    compression=compression,
+                    compression_level=compression_level,
+                    statistics=statistics,
+                    row_group_size=row_group_size,
+                    partition_by=partition_by,
+                    use_dictionary=use_dictionary,
+                ),
+            )
+            return
+        self._dataframe.write_parquet(
+            file,
+            compression=compression,
+            compression_level=compression_level,
+            statistics=statistics,
+            row_group_size=row_group_size,
+            partition_by=partition_by,
+            use_dictionary=use_dictionary,
+        )
+
+    def write_ipc(
+        self, file: str | Path | BytesIO, *, compression: str = "uncompressed"
+    ) -> Any:
+        """
+        Write dataframe to an Arrow IPC (Feather v2) file.
+
+        Uncompressed files can be memory-mapped by `narwhals.read_ipc`, without
+        copying their data into memory.
+
+        Arguments:
+            file: File path, or buffer, to write to.
+            compression: Compression codec: one of "uncompressed", "lz4" or
+                "zstd". Compressed files are smaller, but have to be
+                decompressed into memory when read.
+
+        Examples:
+            Construct pandas and Polars DataFrames:
+
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import narwhals as nw
+            >>> df = {"foo": [1, 2, 3], "bar": [6.0, 7.0, 8.0], "ham": ["a", "b", "c"]}
+            >>> df_pd = pd.DataFrame(df)
+            >>> df_pl = pl.DataFrame(df)
+
+            We define a library agnostic function:
+
+            >>> def func(df_any):
+            ...     df = nw.from_native(df_any)
+            ...     df.write_ipc("foo.arrow")
+
+            We can then pass either pandas or Polars to `func`:
+
+            >>> func(df_pd)  # doctest:+SKIP
+            >>> func(df_pl)  # doctest:+SKIP
+        """
+        self._dataframe.write_ipc(file, compression=compression)
 
     def to_numpy(self) -> Any:
         """
@@ -797,6 +898,9 @@ class DataFrame(BaseFrame[FrameT]):
             >>> [row for row in func(df_pl, named=True)]
             [{'foo': 1, 'bar': 6.0, 'ham': 'a'}, {'foo': 2, 'bar': 7.0, 'ham': 'b'}, {'foo': 3, 'bar': 8.0, 'ham': 'c'}]
         """
+        if buffer_size < 1:
+            msg = f"Expected a positive `buffer_size`, got: {buffer_size}"
+            raise ValueError(msg)
         return self._dataframe.iter_rows(named=named, buffer_size=buffer_size)  # type: ignore[no-any-return]
 
     def with_columns(
@@ -1475,7 +1579,7 @@ class DataFrame(BaseFrame[FrameT]):
         self,
         other: Self,
         *,
-        how: Literal["inner", "cross", "anti"] = "inner",
+        how: Literal["inner", "cross", "anti", "semi"] = "inner",
         left_on: str | list[str] | None = None,
         right_on: str | list[str] | None = None,
     ) -> Self:
@@ -1490,6 +1594,7 @@ class DataFrame(BaseFrame[FrameT]):
                   * *inner*: Returns rows that have matching values in both tables
                   * *cross*: Returns the Cartesian product of rows from both tables
                   * *anti*: Filter rows that do not have a match in the right table.
+                  * *semi*: Filter rows that have a match in the right table.
 
             left_on: Name(s) of the left join column(s).
 
@@ -1897,6 +2002,126 @@ class LazyFrame(BaseFrame[FrameT]):
             backend_version=self._backend_version,
         )
 
+    def explain(self, *, optimized: bool = True) -> str:
+        r"""
+        Describe how this LazyFrame will be computed.
+
+        For Polars, this is Polars' own query plan. For pandas-like and PyArrow
+        frames, this is the plan which Narwhals executes on `collect`, along with
+        the strategy which will be used wherever there's a choice between a fast
+        and a slow path - for example, whether a group-by aggregation maps onto
+        pandas' own aggregations or needs a (slow) per-group `apply`.
+
+        Arguments:
+            optimized: Whether to describe the plan after optimizations, such as
+                predicate and projection pushdown.
+
+        Returns:
+            A string describing the plan, one node per line, with each node's
+            inputs indented below it.
+
+        Examples:
+            >>> import narwhals as nw
+            >>> import pandas as pd
+            >>> df_pd = pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]})
+            >>> lf = nw.from_native(df_pd).lazy()
+            >>> result = lf.filter(nw.col("b") > 4).group_by("a").agg(nw.col("b").sum())
+            >>> print(result.explain())
+            AGGREGATE [col('b').sum()] BY [a]
+              strategy: groupby(...).agg with pandas' own aggregations
+              FILTER [(col('b') > 4)]
+                SCAN pandas [a, b]
+
+            Aggregations which can't be done by pandas directly get computed
+            group by group, which is much slower:
+
+            >>> result = lf.group_by("a").agg((nw.col("b") - nw.col("b").mean()).abs().max())
+            >>> print(result.explain())
+            AGGREGATE [(col('b') - col('b').mean()).abs().max()] BY [a]
+              strategy: complex aggregation (col('b') - col('b').mean()).abs().max() at depth 3 -> per-group apply (slow)
+              SCAN pandas [a, b]
+        """
+        return self._dataframe.explain(optimized=optimized)  # type: ignore[no-any-return]
+
+    def sink_parquet(  # noqa: PLR0913
+        self,
+        path: str | Path,
+        *,
+        compression: str = "zstd",
+        compression_level: int | None = None,
+        statistics: bool = True,
+        row_group_size: int | None = None,
+        partition_by: str | list[str] | None = None,
+        use_dictionary: bool = True,
+    ) -> None:
+        """
+        Compute this LazyFrame and write the result to a Parquet file.
+
+        Polars streams the result to the file where it can. So does PyArrow,
+        for queries over record batches (see `narwhals.from_native`) made of
+        filters and elementwise projections: each batch then gets written
+        once it's been computed, so that the whole result never needs to be
+        in memory. Otherwise, this is `collect().write_parquet(...)`.
+
+        Arguments:
+            path: File path to write to. If `partition_by` is given, this is the
+                directory of the dataset instead.
+            compression: Compression codec: one of "lz4", "uncompressed",
+                "snappy", "gzip", "brotli" or "zstd".
+            compression_level: Compression level, whose meaning depends on the
+                codec. The default is the codec's.
+            statistics: Whether to write the minimum, maximum and null count of
+                each column, for each row group.
+            row_group_size: Maximum number of rows per row group. The default is
+                the backend's.
+            partition_by: Columns to write a hive-partitioned dataset by, with one
+                directory per value (e.g. `year=2024/`) and without these columns
+                in the files.
+            use_dictionary: Whether to dictionary-encode columns, which makes
+                columns with few distinct values smaller.
+
+        Examples:
+            >>> import pyarrow.dataset as ds
+            >>> import narwhals as nw
+            >>> lf = nw.from_native(ds.dataset("events/", format="parquet"))  # doctest:+SKIP
+            >>> lf.filter(nw.col("amount") > 0).sink_parquet(
+            ...     "positive/", partition_by="day"
+            ... )  # doctest:+SKIP
+        """
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        if self._is_polars:
+            if partition_by or not use_dictionary:
+                # Only Polars' PyArrow writer supports these, and it needs the
+                # whole frame.
+                self.collect().write_parquet(
+                    path,
+                    compression=compression,
+                    compression_level=compression_level,
+                    statistics=statistics,
+                    row_group_size=row_group_size,
+                    partition_by=partition_by,
+                    use_dictionary=use_dictionary,
+                )
+                return
+            self._dataframe.sink_parquet(
+                path,
+                compression=compression,
+                compression_level=compression_level,
+                statistics=statistics,
+                row_group_size=row_group_size,
+            )
+            return
+        self._dataframe.sink_parquet(
+            path,
+            compression=compression,
+            compression_level=compression_level,
+            statistics=statistics,
+            row_group_size=row_group_size,
+            partition_by=partition_by,
+            use_dictionary=use_dictionary,
+        )
+
     # inherited
     def pipe(self, function: Callable[[Any], Self], *args: Any, **kwargs: Any) -> Self:
         """
@@ -2900,7 +3125,7 @@ class LazyFrame(BaseFrame[FrameT]):
         self,
         other: Self,
         *,
-        how: Literal["inner", "cross", "anti"] = "inner",
+        how: Literal["inner", "cross", "anti", "semi"] = "inner",
         left_on: str | list[str] | None = None,
         right_on: str | list[str] | None = None,
     ) -> Self:
@@ -2915,6 +3140,7 @@ class LazyFrame(BaseFrame[FrameT]):
                   * *inner*: Returns rows that have matching values in both tables
                   * *cross*: Returns the Cartesian product of rows from both tables
                   * *anti*: Filter rows that do not have a match in the right table.
+                  * *semi*: Filter rows that have a match in the right table.
 
             left_on: Join column of the left DataFrame.
 
@@ -3026,7 +3252,8 @@ class LazyFrame(BaseFrame[FrameT]):
             ... def func(df_any):
             ...     return df_any.lazy()
 
-            Note that then, pandas dataframe stay eager, and the Polars LazyFrame stays lazy:
+            Note that then, operations on the pandas dataframe get recorded in a logical plan
+            (which runs when converting back to native), and the Polars LazyFrame stays lazy:
 
             >>> func(df_pd)
                foo  bar ham
@@ -3037,3 +3264,28 @@ class LazyFrame(BaseFrame[FrameT]):
             <LazyFrame ...>
         """
         return super().lazy()  # type: ignore[return-value]
+
+
+def _polars_parquet_options(  # noqa: PLR0913
+    *,
+    compression: str,
+    compression_level: int | None,
+    statistics: bool,
+    row_group_size: int | None,
+    partition_by: list[str] | None,
+    use_dictionary: bool,
+) -> dict[str, Any]:
+    """Arguments for Polars' `write_parquet`."""
+    options: dict[str, Any] = {
+        "compression": compression,
+        "compression_level": compression_level,
+        "statistics": statistics,
+        "row_group_size": row_group_size,
+    }
+    if partition_by or not use_dictionary:
+        # Polars only supports these through PyArrow.
+        options["use_pyarrow"] = True
+        options["pyarrow_options"] = {"use_dictionary": use_dictionary}
+        if partition_by:
+            options["pyarrow_options"]["partition_cols"] = partition_by
+    return options
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import sys
+from importlib import import_module
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -51,6 +52,18 @@ def get_pyarrow_compute() -> Any:  # pragma: no cover
     return None
 
 
+def get_pyarrow_dataset() -> Any:
+    """Get pyarrow.dataset module (if already imported - else return None)."""
+    return sys.modules.get("pyarrow.dataset", None)
+
+
+def get_pyarrow_parquet() -> Any:  # pragma: no cover
+    """Get pyarrow.parquet module (if pyarrow has already been imported - else return None)."""
+    if "pyarrow" in sys.modules:
+        return import_module("pyarrow.parquet")
+    return None
+
+
 def get_numpy() -> Any:
     """Get numpy module (if already imported - else return None)."""
     return sys.modules.get("numpy", None)
@@ -70,6 +83,8 @@ __all__ = [
     "get_cudf",
     "get_pyarrow",
     "get_pyarrow_compute",
+    "get_pyarrow_dataset",
+    "get_pyarrow_parquet",
     "get_numpy",
     "is_pandas_dataframe",
 ]
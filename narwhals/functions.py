@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import platform
 import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import Iterable
 from typing import Literal
 from typing import TypeVar
@@ -9,9 +12,20 @@ from typing import Union
 
 from narwhals.dataframe import DataFrame
 from narwhals.dataframe import LazyFrame
+from narwhals.dependencies import get_cudf
+from narwhals.dependencies import get_modin
+from narwhals.dependencies import get_pandas
+from narwhals.dependencies import get_polars
+from narwhals.dependencies import get_pyarrow
+from narwhals.translate import from_native
+from narwhals.utils import parse_version
 from narwhals.utils import validate_laziness
 from narwhals.utils import validate_same_library
 
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
 # Missing type parameters for generic type "DataFrame"
 # However, trying to provide one results in mypy still complaining...
 # The rest of the annotations seem to work fine with this anyway
@@ -39,6 +53,253 @@ def concat(
     )
 
 
+def scan_parquet(source: str | Path, *, backend: ModuleType) -> LazyFrame[Any]:
+    """
+    Lazily read a Parquet file into a LazyFrame of the given backend.
+
+    Nothing gets read until the LazyFrame gets collected. At that point, only
+    the columns which the query needs get read, and predicates which compare
+    a column with a literal (e.g. `nw.col("a") > 1`, `nw.col("b").is_in([...])`,
+    or several of them combined with `&`) filter the rows as they get read,
+    skipping whole row groups whose statistics show that they can't match.
+    Other predicates get evaluated after reading.
+
+    Arguments:
+        source: Path to the Parquet file, or to the directory of a
+            hive-partitioned dataset (see `DataFrame.write_parquet`), whose
+            partitions get skipped if they don't match the filters.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with. pandas-like libraries read
+            it with their `read_parquet` (which needs PyArrow), PyArrow with
+            `pyarrow.dataset` (streaming it batch by batch, see
+            `LazyFrame.explain`), and Polars with `polars.scan_parquet`.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_parquet(
+        ...     "data.parquet"
+        ... )  # doctest:+SKIP
+        >>> lf = nw.scan_parquet("data.parquet", backend=pd)  # doctest:+SKIP
+        >>> lf = lf.filter(nw.col("a") > 1).select("b")  # doctest:+SKIP
+
+        Only column "b" gets read, and only the rows where "a" is greater than 1:
+
+        >>> print(lf.explain())  # doctest:+SKIP
+        SELECT [col('b')]
+          SCAN data.parquet [b] (1 of 2 columns) WHERE a > 1
+        >>> nw.to_native(lf.collect())  # doctest:+SKIP
+           b
+        0  5
+        1  6
+    """
+    if backend is get_polars():
+        return from_native(backend.scan_parquet(source))  # type: ignore[return-value]
+    if backend is get_pyarrow():
+        dataset = import_module("pyarrow.dataset").dataset(
+            source, format="parquet", partitioning="hive"
+        )
+        return from_native(dataset)  # type: ignore[return-value]
+    from narwhals._pandas_like.parquet import ParquetSource
+
+    implementation = _pandas_like_implementation(backend)
+    backend_version = parse_version(backend.__version__)
+    return LazyFrame(
+        ParquetSource(
+            source,
+            native_namespace=backend,
+            implementation=implementation,
+            backend_version=backend_version,
+        ),
+        is_polars=False,
+        backend_version=backend_version,
+    )
+
+
+def scan_csv(
+    source: str | Path, *, backend: ModuleType, batch_size: int | None = None
+) -> LazyFrame[Any]:
+    """
+    Lazily read a CSV file into a LazyFrame of the given backend, in batches.
+
+    Nothing gets read until the LazyFrame gets collected. At that point, only
+    the columns which the query needs get parsed, and the file gets read one
+    batch of rows at a time: filters and elementwise projections (and, with
+    PyArrow, `group_by(...).agg` of sums, means, minimums, maximums, counts and
+    `any`/`all`) run on each batch as it gets read, and `head` stops reading
+    once it has enough rows, so that files larger than memory can be queried.
+    See `LazyFrame.explain` for which steps get streamed.
+
+    Arguments:
+        source: Path to the CSV file.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with. pandas-like libraries read
+            it with `read_csv(..., chunksize=batch_size)`, PyArrow with
+            `pyarrow.dataset` (which can also filter rows as it reads them),
+            and Polars with `polars.scan_csv`.
+        batch_size: Maximum number of rows per batch. The default is PyArrow's
+            (131,072 rows). Polars sizes its batches itself.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_csv(
+        ...     "data.csv", index=False
+        ... )  # doctest:+SKIP
+        >>> lf = nw.scan_csv("data.csv", backend=pd, batch_size=100_000)  # doctest:+SKIP
+        >>> lf = lf.filter(nw.col("a") > 1).select("b")  # doctest:+SKIP
+
+        Only column "b" gets parsed, and only the rows where "a" is greater
+        than 1 are kept from each batch:
+
+        >>> print(lf.explain())  # doctest:+SKIP
+        SELECT [col('b')]
+          strategy: streamed batch by batch
+          FILTER [(col('a') > 1)]
+            SCAN data.csv [a, b] (streaming)
+        >>> nw.to_native(lf.collect())  # doctest:+SKIP
+           b
+        1  5
+        2  6
+    """
+    if backend is get_polars():
+        return from_native(backend.scan_csv(source))  # type: ignore[return-value]
+    if backend is get_pyarrow():
+        from narwhals._arrow.batches import ArrowBatchSource
+
+        dataset = import_module("pyarrow.dataset").dataset(source, format="csv")
+        return LazyFrame(
+            ArrowBatchSource(
+                dataset,
+                backend_version=parse_version(backend.__version__),
+                batch_size=batch_size,
+            ),
+            is_polars=False,
+            backend_version=parse_version(backend.__version__),
+        )
+    from narwhals._pandas_like.csv import CsvSource
+
+    implementation = _pandas_like_implementation(backend)
+    backend_version = parse_version(backend.__version__)
+    return LazyFrame(
+        CsvSource(
+            source,
+            batch_size=batch_size,
+            native_namespace=backend,
+            implementation=implementation,
+            backend_version=backend_version,
+        ),
+        is_polars=False,
+        backend_version=backend_version,
+    )
+
+
+def read_parquet(source: str | Path, *, backend: ModuleType) -> DataFrame[Any]:
+    """
+    Read a Parquet file into a DataFrame of the given backend.
+
+    To only read some of the columns or rows, use `scan_parquet` instead.
+
+    Arguments:
+        source: Path to the Parquet file.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with.
+
+    Examples:
+        >>> import polars as pl
+        >>> import narwhals as nw
+        >>> pl.DataFrame({"a": [1, 2, 3]}).write_parquet("data.parquet")  # doctest:+SKIP
+        >>> df = nw.read_parquet("data.parquet", backend=pl)  # doctest:+SKIP
+        >>> nw.to_native(df)  # doctest:+SKIP
+        shape: (3, 1)
+        ┌─────┐
+        │ a   │
+        │ --- │
+        │ i64 │
+        ╞═════╡
+        │ 1   │
+        │ 2   │
+        │ 3   │
+        └─────┘
+    """
+    if backend is get_pyarrow():
+        native_dataframe = import_module("pyarrow.parquet").read_table(source)
+    else:
+        if backend is not get_polars():
+            # Raises if `backend` isn't supported.
+            _pandas_like_implementation(backend)
+        native_dataframe = backend.read_parquet(source)
+    return from_native(native_dataframe, eager_only=True)
+
+
+def read_ipc(
+    source: str | Path, *, backend: ModuleType, memory_map: bool = True
+) -> DataFrame[Any]:
+    """
+    Read an Arrow IPC (Feather v2) file into a DataFrame of the given backend.
+
+    With `memory_map=True`, the file gets memory-mapped rather than read into
+    memory: if it isn't compressed (see `DataFrame.write_ipc`), the columns of
+    the result point into the mapping, and the operating system only loads
+    the pages which get used. Processes on the same host which read the same
+    file then share a single copy of it, in the page cache.
+
+    Arguments:
+        source: Path to the IPC file.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with.
+        memory_map: Whether to memory-map the file. pandas then gets columns
+            with `pd.ArrowDtype` dtypes, which wrap the Arrow data without
+            copying it (with pandas older than 1.5, or Modin or cuDF, the
+            file gets read with `read_feather`, which copies it).
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> import narwhals as nw
+        >>> df = nw.from_native(pa.table({"a": [1, 2, 3]}), eager_only=True)
+        >>> df.write_ipc("data.arrow")  # doctest:+SKIP
+        >>> df = nw.read_ipc("data.arrow", backend=pa)  # doctest:+SKIP
+        >>> nw.to_native(df)  # doctest:+SKIP
+        pyarrow.Table
+        a: int64
+        ----
+        a: [[1,2,3]]
+    """
+    if backend is get_pyarrow():
+        native_dataframe = import_module("pyarrow.feather").read_table(
+            source, memory_map=memory_map
+        )
+    elif backend is get_polars():
+        native_dataframe = backend.read_ipc(source, memory_map=memory_map)
+    elif (
+        memory_map
+        and _pandas_like_implementation(backend) == "pandas"
+        and parse_version(backend.__version__) >= (1, 5)
+    ):
+        table = import_module("pyarrow.feather").read_table(source, memory_map=True)
+        native_dataframe = table.to_pandas(types_mapper=backend.ArrowDtype)
+    else:
+        # Raises if `backend` isn't supported.
+        _pandas_like_implementation(backend)
+        native_dataframe = backend.read_feather(source)
+    return from_native(native_dataframe, eager_only=True)
+
+
+def _pandas_like_implementation(backend: ModuleType) -> str:
+    for implementation, get_module in (
+        ("pandas", get_pandas),
+        ("modin", get_modin),
+        ("cudf", get_cudf),
+    ):
+        if backend is get_module():
+            return implementation
+    msg = (
+        f"Expected `backend` to be one of the pandas, Modin, cuDF, PyArrow or "
+        f"Polars modules, got: {backend!r}"
+    )
+    raise TypeError(msg)
+
+
 def _get_sys_info() -> dict[str, str]:
     """System information
 
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import TypeVar
+
+from narwhals.dependencies import get_pyarrow
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The profile being recorded, if any. Checking it is all that profiled
+# operations cost while nothing is being profiled.
+_ACTIVE: Profile | None = None
+
+
+class ProfileEvent:
+    """One operation (or expression) which ran while profiling."""
+
+    def __init__(self, name: str, category: str, depth: int, rows_in: int | None) -> None:
+        self.name = name
+        # "operation" for DataFrame methods, "expression" for expressions.
+        self.category = category
+        # How many events this one is nested in.
+        self.depth = depth
+        self.thread_id = threading.get_ident()
+        self.rows_in = rows_in
+        self.rows_out: int | None = None
+        # Nanoseconds since the start of the profile.
+        self.start = 0
+        self.duration = 0
+        # How much more memory is in use after the event than before it, i.e.
+        # what it allocated and didn't free (temporaries don't count).
+        self.bytes_retained: int | None = None
+
+    def __repr__(self) -> str:
+        return f"ProfileEvent({self.name!r}, duration={self.duration / 1e6:.3f}ms)"
+
+
+class Profile:
+    """Timings of the operations which ran within `narwhals.profile()`.
+
+    Events are in the order in which they started. An event's time includes
+    that of the events nested in it (those which follow it with a greater
+    `depth`), such as an expression evaluated as part of `select`.
+    """
+
+    def __init__(self, *, memory: bool) -> None:
+        self.events: list[ProfileEvent] = []
+        self._memory = memory
+        self._start = time.perf_counter_ns()
+        self._depth = threading.local()
+        self._lock = threading.Lock()
+
+    def _in_use(self) -> int:
+        in_use = tracemalloc.get_traced_memory()[0]
+        if (pa := get_pyarrow()) is not None:  # pragma: no branch
+            # Arrow allocates its buffers without Python knowing.
+            in_use += pa.total_allocated_bytes()
+        return in_use
+
+    @contextmanager
+    def _record(
+        self, name: str, category: str, rows_in: int | None = None
+    ) -> Iterator[ProfileEvent]:
+        depth = getattr(self._depth, "value", 0)
+        event = ProfileEvent(name, category, depth, rows_in)
+        with self._lock:
+            self.events.append(event)
+        self._depth.value = depth + 1
+        in_use = self._in_use() if self._memory else 0
+        start = time.perf_counter_ns()
+        try:
+            yield event
+        finally:
+            end = time.perf_counter_ns()
+            self._depth.value = depth
+            event.start = start - self._start
+            event.duration = end - start
+            if self._memory:
+                event.bytes_retained = self._in_use() - in_use
+
+    def table(self) -> str:
+        """Return the events as a table, with nested events indented.
+
+        Times are in milliseconds.
+        """
+        header = ("operation", "time (ms)", "rows in", "rows out", "retained")
+        rows = [header] + [
+            (
+                "  " * event.depth + event.name,
+                f"{event.duration / 1e6:.3f}",
+                _format_optional(event.rows_in),
+                _format_optional(event.rows_out),
+                _format_bytes(event.bytes_retained),
+            )
+            for event in self.events
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [value.rjust(width) for value, width in zip(row[1:], widths[1:])]
+            ).rstrip()
+            for row in rows
+        )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the events in Chrome's trace event format.
+
+        The result can be saved as JSON (see `write_chrome_trace`), and opened
+        in `chrome://tracing` or https://ui.perfetto.dev.
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    # Microseconds.
+                    "ts": event.start / 1e3,
+                    "dur": event.duration / 1e3,
+                    "pid": 0,
+                    "tid": event.thread_id,
+                    "args": {
+                        "rows_in": event.rows_in,
+                        "rows_out": event.rows_out,
+                        "bytes_retained": event.bytes_retained,
+                    },
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, file: str | Path) -> None:
+        """Write the events to `file`, in Chrome's trace event format."""
+        with open(file, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def __str__(self) -> str:
+        return self.table()
+
+
+def _format_optional(value: int | None) -> str:
+    return "" if value is None else str(value)
+
+
+def _format_bytes(value: int | None) -> str:
+    if value is None:
+        return ""
+    size = float(value)
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@contextmanager
+def profile(*, memory: bool = True) -> Iterator[Profile]:
+    """
+    Record how long each operation takes, for the code within the `with` block.
+
+    Operations on pandas-like and PyArrow dataframes get recorded (e.g.
+    `select`, `filter`, `group_by(...).agg` or `join`), as well as each of the
+    expressions they evaluate, along with the numbers of rows in and out.
+    Lazy frames record the operations which `collect` runs. Polars does its own
+    thing, so operations on Polars objects don't get recorded.
+
+    Arguments:
+        memory: Whether to also record how much memory each operation retains,
+            i.e. how much more is in use after it than before it. Temporary
+            allocations which get freed before the operation ends don't count.
+            This uses `tracemalloc`, which slows Python code down, so turn it off
+            to get more accurate timings.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+        >>> with nw.profile() as p:
+        ...     result = df.filter(nw.col("a") > 1).select(nw.col("b") * 2)
+        >>> [event.name for event in p.events]
+        ['filter', 'expr __gt__', 'expr col', 'select', 'expr __mul__', 'expr col']
+        >>> print(p.table())  # doctest:+SKIP
+        operation       time (ms)  rows in  rows out  retained
+        filter              0.571        3         2    3.9 KB
+          expr __gt__       0.187        3         3    1.6 KB
+            expr col        0.006        3         3     320 B
+        select              0.390        2         2    2.7 KB
+          expr __mul__      0.160        2         2    1.5 KB
+            expr col        0.006        2         2     280 B
+
+        The events can also be saved for `chrome://tracing` or Perfetto:
+
+        >>> p.write_chrome_trace("trace.json")  # doctest:+SKIP
+    """
+    global _ACTIVE  # noqa: PLW0603
+    previous = _ACTIVE
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _ACTIVE = Profile(memory=memory)
+    try:
+        yield _ACTIVE
+    finally:
+        _ACTIVE = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _n_rows(obj: Any) -> int | None:
+    """Number of rows of a (compliant) dataframe, series or group-by."""
+    obj = getattr(obj, "_df", obj)
+    native = getattr(obj, "_native_dataframe", None)
+    if native is None:
+        native = getattr(obj, "_native_series", None)
+    return None if native is None else len(native)
+
+
+def profiled(name: str, *, count_rows_in: bool = True) -> Callable[[F], F]:
+    """Record calls to the decorated method while profiling.
+
+    Counting the rows of lazy frames would mean collecting them, so methods of
+    those should pass `count_rows_in=False`.
+    """
+
+    def decorator(method: F) -> F:
+        @wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            profile = _ACTIVE
+            if profile is None:
+                return method(self, *args, **kwargs)
+            rows_in = _n_rows(self) if count_rows_in else None
+            with profile._record(name, "operation", rows_in) as event:
+                result = method(self, *args, **kwargs)
+                event.rows_out = _n_rows(result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def profile_expression(df: Any, expr: Any) -> list[Any]:
+    """Evaluate `expr` on `df`, recording it if profiling."""
+    profile = _ACTIVE
+    if profile is None:
+        return expr._call(df)  # type: ignore[no-any-return]
+    with profile._record(f"expr {expr._node.op}", "expression", _n_rows(df)) as event:
+        result: list[Any] = expr._call(df)
+        event.rows_out = _n_rows(result[0]) if result else None
+    return result
@@ -1,3 +1,19 @@
-from narwhals.stable import v1
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from narwhals.stable import v1  # noqa: TCH004
+
+
+def __getattr__(name: str) -> Any:
+    if name == "v1":
+        from narwhals.stable import v1
+
+        return v1
+    msg = f"module 'narwhals.stable' has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = ["v1"]
@@ -11,7 +11,7 @@ from typing import TypeVar
 from typing import overload
 
 import narwhals as nw
-from narwhals import selectors
+from narwhals.config import Config as NwConfig
 from narwhals.dataframe import DataFrame as NwDataFrame
 from narwhals.dataframe import LazyFrame as NwLazyFrame
 from narwhals.dtypes import Boolean
@@ -34,8 +34,7 @@ from narwhals.dtypes import UInt32
 from narwhals.dtypes import UInt64
 from narwhals.dtypes import Unknown
 from narwhals.expression import Expr as NwExpr
-from narwhals.functions import concat
-from narwhals.functions import show_versions
+from narwhals.profiling import profile as nw_profile
 from narwhals.series import Series as NwSeries
 from narwhals.translate import get_native_namespace as nw_get_native_namespace
 from narwhals.translate import to_native
@@ -47,9 +46,17 @@ from narwhals.utils import maybe_convert_dtypes as nw_maybe_convert_dtypes
 from narwhals.utils import maybe_set_index as nw_maybe_set_index
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+    from typing import ContextManager
+
     from typing_extensions import Self
 
+    from narwhals import selectors  # noqa: TCH004
     from narwhals.dtypes import DType
+    from narwhals.functions import concat  # noqa: TCH004
+    from narwhals.functions import show_versions  # noqa: TCH004
+    from narwhals.profiling import Profile
     from narwhals.typing import IntoDataFrame
     from narwhals.typing import IntoExpr
 
@@ -100,7 +107,8 @@ class DataFrame(NwDataFrame[IntoDataFrameT]):
             ... def func(df_any):
             ...     return df_any.lazy()
 
-            Note that then, pandas dataframe stay eager, but Polars DataFrame becomes a Polars LazyFrame:
+            Note that then, operations on the pandas dataframe get recorded in a logical plan
+            (which runs when converting back to native), and Polars DataFrame becomes a Polars LazyFrame:
 
             >>> func(df_pd)
                foo  bar ham
@@ -595,6 +603,10 @@ def from_native(
             - pandas.DataFrame
             - polars.DataFrame
             - polars.LazyFrame
+            - pyarrow.Table
+            - pyarrow.RecordBatchReader, pyarrow.dataset.Dataset or
+              pyarrow.dataset.Scanner, which become lazy frames which get
+              streamed batch by batch where possible
             - anything with a `__narwhals_dataframe__` or `__narwhals_lazyframe__` method
             - pandas.Series
             - polars.Series
@@ -1214,6 +1226,273 @@ def maybe_set_index(df: T, column_names: str | list[str]) -> T:
     return nw_maybe_set_index(df, column_names)
 
 
+def profile(*, memory: bool = True) -> ContextManager[Profile]:
+    """
+    Record how long each operation takes, for the code within the `with` block.
+
+    Operations on pandas-like and PyArrow dataframes get recorded (e.g.
+    `select`, `filter`, `group_by(...).agg` or `join`), as well as each of the
+    expressions they evaluate, along with the numbers of rows in and out.
+    Lazy frames record the operations which `collect` runs. Polars does its own
+    thing, so operations on Polars objects don't get recorded.
+
+    Arguments:
+        memory: Whether to also record how much memory each operation retains,
+            i.e. how much more is in use after it than before it. Temporary
+            allocations which get freed before the operation ends don't count.
+            This uses `tracemalloc`, which slows Python code down, so turn it off
+            to get more accurate timings.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+        >>> with nw.profile() as p:
+        ...     result = df.filter(nw.col("a") > 1).select(nw.col("b") * 2)
+        >>> [event.name for event in p.events]
+        ['filter', 'expr __gt__', 'expr col', 'select', 'expr __mul__', 'expr col']
+        >>> print(p.table())  # doctest:+SKIP
+        operation       time (ms)  rows in  rows out  retained
+        filter              0.571        3         2    3.9 KB
+          expr __gt__       0.187        3         3    1.6 KB
+            expr col        0.006        3         3     320 B
+        select              0.390        2         2    2.7 KB
+          expr __mul__      0.160        2         2    1.5 KB
+            expr col        0.006        2         2     280 B
+
+        The events can also be saved for `chrome://tracing` or Perfetto:
+
+        >>> p.write_chrome_trace("trace.json")  # doctest:+SKIP
+    """
+    return nw_profile(memory=memory)
+
+
+def scan_parquet(source: str | Path, *, backend: ModuleType) -> LazyFrame[Any]:
+    """
+    Lazily read a Parquet file into a LazyFrame of the given backend.
+
+    Nothing gets read until the LazyFrame gets collected. At that point, only
+    the columns which the query needs get read, and predicates which compare
+    a column with a literal (e.g. `nw.col("a") > 1`, `nw.col("b").is_in([...])`,
+    or several of them combined with `&`) filter the rows as they get read,
+    skipping whole row groups whose statistics show that they can't match.
+    Other predicates get evaluated after reading.
+
+    Arguments:
+        source: Path to the Parquet file, or to the directory of a
+            hive-partitioned dataset (see `DataFrame.write_parquet`), whose
+            partitions get skipped if they don't match the filters.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with. pandas-like libraries read
+            it with their `read_parquet` (which needs PyArrow), PyArrow with
+            `pyarrow.dataset` (streaming it batch by batch, see
+            `LazyFrame.explain`), and Polars with `polars.scan_parquet`.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_parquet(
+        ...     "data.parquet"
+        ... )  # doctest:+SKIP
+        >>> lf = nw.scan_parquet("data.parquet", backend=pd)  # doctest:+SKIP
+        >>> lf = lf.filter(nw.col("a") > 1).select("b")  # doctest:+SKIP
+
+        Only column "b" gets read, and only the rows where "a" is greater than 1:
+
+        >>> print(lf.explain())  # doctest:+SKIP
+        SELECT [col('b')]
+          SCAN data.parquet [b] (1 of 2 columns) WHERE a > 1
+        >>> nw.to_native(lf.collect())  # doctest:+SKIP
+           b
+        0  5
+        1  6
+    """
+    from narwhals.functions import scan_parquet as nw_scan_parquet
+
+    return _stableify(nw_scan_parquet(source, backend=backend))  # type: ignore[no-any-return]
+
+
+def scan_csv(
+    source: str | Path, *, backend: ModuleType, batch_size: int | None = None
+) -> LazyFrame[Any]:
+    """
+    Lazily read a CSV file into a LazyFrame of the given backend, in batches.
+
+    Nothing gets read until the LazyFrame gets collected. At that point, only
+    the columns which the query needs get parsed, and the file gets read one
+    batch of rows at a time: filters and elementwise projections (and, with
+    PyArrow, `group_by(...).agg` of sums, means, minimums, maximums, counts and
+    `any`/`all`) run on each batch as it gets read, and `head` stops reading
+    once it has enough rows, so that files larger than memory can be queried.
+    See `LazyFrame.explain` for which steps get streamed.
+
+    Arguments:
+        source: Path to the CSV file.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with. pandas-like libraries read
+            it with `read_csv(..., chunksize=batch_size)`, PyArrow with
+            `pyarrow.dataset` (which can also filter rows as it reads them),
+            and Polars with `polars.scan_csv`.
+        batch_size: Maximum number of rows per batch. The default is PyArrow's
+            (131,072 rows). Polars sizes its batches itself.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_csv(
+        ...     "data.csv", index=False
+        ... )  # doctest:+SKIP
+        >>> lf = nw.scan_csv("data.csv", backend=pd, batch_size=100_000)  # doctest:+SKIP
+        >>> lf = lf.filter(nw.col("a") > 1).select("b")  # doctest:+SKIP
+
+        Only column "b" gets parsed, and only the rows where "a" is greater
+        than 1 are kept from each batch:
+
+        >>> print(lf.explain())  # doctest:+SKIP
+        SELECT [col('b')]
+          strategy: streamed batch by batch
+          FILTER [(col('a') > 1)]
+            SCAN data.csv [a, b] (streaming)
+        >>> nw.to_native(lf.collect())  # doctest:+SKIP
+           b
+        1  5
+        2  6
+    """
+    from narwhals.functions import scan_csv as nw_scan_csv
+
+    return _stableify(  # type: ignore[no-any-return]
+        nw_scan_csv(source, backend=backend, batch_size=batch_size)
+    )
+
+
+def read_parquet(source: str | Path, *, backend: ModuleType) -> DataFrame[Any]:
+    """
+    Read a Parquet file into a DataFrame of the given backend.
+
+    To only read some of the columns or rows, use `scan_parquet` instead.
+
+    Arguments:
+        source: Path to the Parquet file.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with.
+
+    Examples:
+        >>> import polars as pl
+        >>> import narwhals.stable.v1 as nw
+        >>> pl.DataFrame({"a": [1, 2, 3]}).write_parquet("data.parquet")  # doctest:+SKIP
+        >>> df = nw.read_parquet("data.parquet", backend=pl)  # doctest:+SKIP
+        >>> nw.to_native(df)  # doctest:+SKIP
+        shape: (3, 1)
+        ┌─────┐
+        │ a   │
+        │ --- │
+        │ i64 │
+        ╞═════╡
+        │ 1   │
+        │ 2   │
+        │ 3   │
+        └─────┘
+    """
+    from narwhals.functions import read_parquet as nw_read_parquet
+
+    return _stableify(nw_read_parquet(source, backend=backend))  # type: ignore[no-any-return]
+
+
+def read_ipc(
+    source: str | Path, *, backend: ModuleType, memory_map: bool = True
+) -> DataFrame[Any]:
+    """
+    Read an Arrow IPC (Feather v2) file into a DataFrame of the given backend.
+
+    With `memory_map=True`, the file gets memory-mapped rather than read into
+    memory: if it isn't compressed (see `DataFrame.write_ipc`), the columns of
+    the result point into the mapping, and the operating system only loads
+    the pages which get used. Processes on the same host which read the same
+    file then share a single copy of it, in the page cache.
+
+    Arguments:
+        source: Path to the IPC file.
+        backend: The native namespace (e.g. `pandas`, `pyarrow` or `polars`)
+            of the library to read the file with.
+        memory_map: Whether to memory-map the file. pandas then gets columns
+            with `pd.ArrowDtype` dtypes, which wrap the Arrow data without
+            copying it (with pandas older than 1.5, or Modin or cuDF, the
+            file gets read with `read_feather`, which copies it).
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> import narwhals.stable.v1 as nw
+        >>> df = nw.from_native(pa.table({"a": [1, 2, 3]}), eager_only=True)
+        >>> df.write_ipc("data.arrow")  # doctest:+SKIP
+        >>> df = nw.read_ipc("data.arrow", backend=pa)  # doctest:+SKIP
+        >>> nw.to_native(df)  # doctest:+SKIP
+        pyarrow.Table
+        a: int64
+        ----
+        a: [[1,2,3]]
+    """
+    from narwhals.functions import read_ipc as nw_read_ipc
+
+    return _stableify(  # type: ignore[no-any-return]
+        nw_read_ipc(source, backend=backend, memory_map=memory_map)
+    )
+
+
+class Config(NwConfig):
+    """
+    Configure how Narwhals evaluates expressions on pandas-like and PyArrow frames.
+
+    Settings apply as soon as a `Config` is created, and stay in place until
+    they're changed again. When used as a context manager, the previous
+    settings get restored on exit. Settings are process-wide rather than
+    per-thread: they apply to every thread, and a `Config` used as a context
+    manager in one thread changes them in the others too. Changing the number
+    of threads while other threads are evaluating expressions is safe though,
+    as those finish with the pool they started with. Polars manages its own
+    thread pool, so these settings don't affect Polars objects.
+
+    Arguments:
+        threads: Number of threads to evaluate independent expressions in, e.g.
+            the expressions passed to `select`, `with_columns` or
+            `group_by(...).agg`. Most pandas, NumPy and PyArrow kernels release
+            the GIL, so wide projections can use several cores. Results come
+            back in the same order as with a single thread, which is the
+            default.
+        partitions: Number of row partitions to split (large) pandas frames into.
+            `filter`, `select` and `with_columns` of elementwise expressions
+            then run on each partition separately, in the thread pool, and so
+            do `group_by(...).agg` of aggregations which can be combined
+            afterwards (e.g. a sum of sums, or a count-weighted mean). Frames
+            with fewer than 50,000 rows per partition aren't worth splitting.
+            The default is not to partition.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 2, 3]}))
+        >>> with nw.Config(threads=4):
+        ...     result = df.select(*(nw.col("a").alias(f"a_{i}") * i for i in range(200)))
+        >>> result.columns[:3]
+        ['a_0', 'a_1', 'a_2']
+        >>> nw.Config.threads()
+        1
+    """
+
+
+def __getattr__(name: str) -> Any:
+    # Re-exports which nothing here depends on only get imported when used.
+    if name == "selectors":
+        from narwhals import selectors
+
+        return selectors
+    if name in {"concat", "show_versions"}:
+        from narwhals import functions
+
+        return getattr(functions, name)
+    msg = f"module 'narwhals.stable.v1' has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 def get_native_namespace(obj: Any) -> Any:
     """
     Get native namespace from object.
@@ -1234,6 +1513,7 @@ def get_native_namespace(obj: Any) -> Any:
 
 __all__ = [
     "selectors",
+    "Config",
     "concat",
     "to_native",
     "from_native",
@@ -1276,4 +1556,9 @@ __all__ = [
     "Date",
     "narwhalify",
     "show_versions",
+    "profile",
+    "scan_parquet",
+    "read_parquet",
+    "read_ipc",
+    "scan_csv",
 ]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from functools import partial
 from functools import wraps
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import Iterator
 from typing import Literal
+from typing import Tuple
 from typing import TypeVar
 from typing import overload
 
@@ -13,6 +17,7 @@ from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_pandas
 from narwhals.dependencies import get_polars
 from narwhals.dependencies import get_pyarrow
+from narwhals.dependencies import get_pyarrow_dataset
 
 if TYPE_CHECKING:
     from narwhals.dataframe import DataFrame
@@ -208,7 +213,7 @@ def from_native(
 ) -> Any: ...
 
 
-def from_native(  # noqa: PLR0915
+def from_native(
     native_dataframe: Any,
     *,
     strict: bool = True,
@@ -226,6 +231,10 @@ def from_native(  # noqa: PLR0915
             - pandas.DataFrame
             - polars.DataFrame
             - polars.LazyFrame
+            - pyarrow.Table
+            - pyarrow.RecordBatchReader, pyarrow.dataset.Dataset or
+              pyarrow.dataset.Scanner, which become lazy frames which get
+              streamed batch by batch where possible
             - anything with a `__narwhals_dataframe__` or `__narwhals_lazyframe__` method
             - pandas.Series
             - polars.Series
@@ -239,87 +248,31 @@ def from_native(  # noqa: PLR0915
     Returns:
         narwhals.DataFrame or narwhals.LazyFrame or narwhals.Series
     """
-    from narwhals._arrow.dataframe import ArrowDataFrame
-    from narwhals._arrow.series import ArrowSeries
-    from narwhals._pandas_like.dataframe import PandasDataFrame
-    from narwhals._pandas_like.series import PandasSeries
     from narwhals.dataframe import DataFrame
     from narwhals.dataframe import LazyFrame
     from narwhals.series import Series
-    from narwhals.utils import parse_version
 
     if series_only:
         allow_series = True
     # todo: raise on invalid combinations
 
-    if (pl := get_polars()) is not None and isinstance(native_dataframe, pl.DataFrame):
+    handler = _get_handler(type(native_dataframe))
+    if handler is not None:
+        kind, convert = handler
+        if kind == "series":
+            if not allow_series:  # pragma: no cover (todo)
+                raise TypeError("Please set `allow_series=True`")
+            obj, is_polars, backend_version = convert(native_dataframe)
+            return Series(obj, is_polars=is_polars, backend_version=backend_version)
         if series_only:  # pragma: no cover (todo)
-            raise TypeError("Cannot only use `series_only` with polars.DataFrame")
-        return DataFrame(
-            native_dataframe,
-            is_polars=True,
-            backend_version=parse_version(pl.__version__),
-        )
-    elif (pl := get_polars()) is not None and isinstance(native_dataframe, pl.LazyFrame):
-        if series_only:  # pragma: no cover (todo)
-            raise TypeError("Cannot only use `series_only` with polars.LazyFrame")
-        if eager_only:  # pragma: no cover (todo)
-            raise TypeError("Cannot only use `eager_only` with polars.LazyFrame")
-        return LazyFrame(
-            native_dataframe,
-            is_polars=True,
-            backend_version=parse_version(pl.__version__),
-        )
-    elif (pd := get_pandas()) is not None and isinstance(native_dataframe, pd.DataFrame):
-        if series_only:  # pragma: no cover (todo)
-            raise TypeError("Cannot only use `series_only` with dataframe")
-        return DataFrame(
-            PandasDataFrame(
-                native_dataframe,
-                backend_version=parse_version(pd.__version__),
-                implementation="pandas",
-            ),
-            is_polars=False,
-            backend_version=parse_version(pd.__version__),
-        )
-    elif (mpd := get_modin()) is not None and isinstance(
-        native_dataframe, mpd.DataFrame
-    ):  # pragma: no cover
-        if series_only:
-            raise TypeError("Cannot only use `series_only` with modin.DataFrame")
-        return DataFrame(
-            PandasDataFrame(
-                native_dataframe,
-                implementation="modin",
-                backend_version=parse_version(mpd.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(mpd.__version__),
-        )
-    elif (cudf := get_cudf()) is not None and isinstance(  # pragma: no cover
-        native_dataframe, cudf.DataFrame
-    ):
-        if series_only:
-            raise TypeError("Cannot only use `series_only` with modin.DataFrame")
-        return DataFrame(
-            PandasDataFrame(
-                native_dataframe,
-                implementation="cudf",
-                backend_version=parse_version(cudf.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(cudf.__version__),
-        )
-    elif (pa := get_pyarrow()) is not None and isinstance(native_dataframe, pa.Table):
-        if series_only:  # pragma: no cover (todo)
-            raise TypeError("Cannot only use `series_only` with arrow table")
-        return DataFrame(
-            ArrowDataFrame(
-                native_dataframe, backend_version=parse_version(pa.__version__)
-            ),
-            is_polars=False,
-            backend_version=parse_version(pa.__version__),
-        )
+            msg = f"Cannot only use `series_only` with {kind}"
+            raise TypeError(msg)
+        obj, is_polars, backend_version = convert(native_dataframe)
+        if kind == "lazyframe":
+            if eager_only:  # pragma: no cover (todo)
+                raise TypeError("Cannot only use `eager_only` with lazyframe")
+            return LazyFrame(obj, is_polars=is_polars, backend_version=backend_version)
+        return DataFrame(obj, is_polars=is_polars, backend_version=backend_version)
     elif hasattr(native_dataframe, "__narwhals_dataframe__"):  # pragma: no cover
         if series_only:  # pragma: no cover (todo)
             raise TypeError("Cannot only use `series_only` with dataframe")
@@ -340,66 +293,6 @@ def from_native(  # noqa: PLR0915
             is_polars=False,
             backend_version=(0,),
         )
-    elif (pl := get_polars()) is not None and isinstance(native_dataframe, pl.Series):
-        if not allow_series:  # pragma: no cover (todo)
-            raise TypeError("Please set `allow_series=True`")
-        return Series(
-            native_dataframe,
-            is_polars=True,
-            backend_version=parse_version(pl.__version__),
-        )
-    elif (pd := get_pandas()) is not None and isinstance(native_dataframe, pd.Series):
-        if not allow_series:  # pragma: no cover (todo)
-            raise TypeError("Please set `allow_series=True`")
-        return Series(
-            PandasSeries(
-                native_dataframe,
-                implementation="pandas",
-                backend_version=parse_version(pd.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(pd.__version__),
-        )
-    elif (mpd := get_modin()) is not None and isinstance(
-        native_dataframe, mpd.Series
-    ):  # pragma: no cover
-        if not allow_series:  # pragma: no cover (todo)
-            raise TypeError("Please set `allow_series=True`")
-        return Series(
-            PandasSeries(
-                native_dataframe,
-                implementation="modin",
-                backend_version=parse_version(mpd.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(mpd.__version__),
-        )
-    elif (cudf := get_cudf()) is not None and isinstance(
-        native_dataframe, cudf.Series
-    ):  # pragma: no cover
-        if not allow_series:  # pragma: no cover (todo)
-            raise TypeError("Please set `allow_series=True`")
-        return Series(
-            PandasSeries(
-                native_dataframe,
-                implementation="cudf",
-                backend_version=parse_version(cudf.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(cudf.__version__),
-        )
-    elif (pa := get_pyarrow()) is not None and isinstance(
-        native_dataframe, pa.ChunkedArray
-    ):
-        if not allow_series:  # pragma: no cover (todo)
-            raise TypeError("Please set `allow_series=True`")
-        return Series(
-            ArrowSeries(
-                native_dataframe, backend_version=parse_version(pa.__version__), name=""
-            ),
-            is_polars=False,
-            backend_version=parse_version(pa.__version__),
-        )
     elif hasattr(native_dataframe, "__narwhals_series__"):  # pragma: no cover
         if not allow_series:  # pragma: no cover (todo)
             raise TypeError("Please set `allow_series=True`")
@@ -413,6 +306,164 @@ def from_native(  # noqa: PLR0915
     return native_dataframe  # pragma: no cover (todo)
 
 
+# A handler says what kind of object ("dataframe", "lazyframe" or "series") a
+# native type becomes, and how to convert it: given the native object, return
+# the arguments for the Narwhals class, i.e. `(obj, is_polars, backend_version)`.
+Handler = Tuple[str, Callable[[Any], Tuple[Any, bool, Tuple[int, ...]]]]
+
+# Types registered with `register_native`, which take precedence over the
+# built-in ones.
+_REGISTERED: list[tuple[type, Handler]] = []
+# Handler of each type passed to `from_native` so far (`None` if it has none),
+# so that the lookup is a single dict access after the first time.
+_HANDLERS: dict[type, Handler | None] = {}
+
+
+def register_native(
+    native_type: type,
+    kind: Literal["dataframe", "lazyframe", "series"],
+    to_narwhals: Callable[[Any], Any],
+) -> None:
+    """
+    Let `from_native` convert instances of `native_type` (and of its subclasses).
+
+    Arguments:
+        native_type: Type of the native objects.
+        kind: Whether they should become a DataFrame, LazyFrame, or Series.
+        to_narwhals: Function which takes a native object and returns an object
+            implementing the corresponding Narwhals API, just like
+            `__narwhals_dataframe__`, `__narwhals_lazyframe__` or
+            `__narwhals_series__` would.
+    """
+
+    def convert(native_object: Any) -> tuple[Any, bool, tuple[int, ...]]:
+        # placeholder (0,) version here, as we wouldn't use it in this case anyway.
+        return to_narwhals(native_object), False, (0,)
+
+    _REGISTERED.insert(0, (native_type, (kind, convert)))
+    _HANDLERS.clear()
+
+
+def _get_handler(native_type: type) -> Handler | None:
+    try:
+        return _HANDLERS[native_type]
+    except KeyError:
+        pass
+    # Types which aren't from a library which has been imported can't be
+    # subclasses of its types either, so it's fine to remember misses too.
+    handler = next(
+        (
+            handler
+            for cls, handler in (*_REGISTERED, *_builtin_handlers())
+            if issubclass(native_type, cls)
+        ),
+        None,
+    )
+    _HANDLERS[native_type] = handler
+    return handler
+
+
+def _builtin_handlers() -> Iterator[tuple[type, Handler]]:
+    from narwhals._arrow.batches import ArrowBatchSource
+    from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._arrow.series import ArrowSeries
+
+    if (pl := get_polars()) is not None:  # pragma: no branch
+        polars_handler = partial(_polars_object, pl)
+        yield pl.DataFrame, ("dataframe", polars_handler)
+        yield pl.LazyFrame, ("lazyframe", polars_handler)
+        yield pl.Series, ("series", polars_handler)
+    for implementation, get_module in (
+        ("pandas", get_pandas),
+        ("modin", get_modin),
+        ("cudf", get_cudf),
+    ):
+        if (module := get_module()) is not None:
+            yield (
+                module.DataFrame,
+                ("dataframe", partial(_pandas_like_dataframe, implementation, module)),
+            )
+            yield (
+                module.Series,
+                ("series", partial(_pandas_like_series, implementation, module)),
+            )
+    if (pa := get_pyarrow()) is not None:  # pragma: no branch
+        yield (
+            pa.Table,
+            ("dataframe", partial(_arrow_object, pa, ArrowDataFrame)),
+        )
+        yield (
+            pa.ChunkedArray,
+            ("series", partial(_arrow_object, pa, ArrowSeries, name="")),
+        )
+        yield (
+            pa.RecordBatchReader,
+            ("lazyframe", partial(_arrow_object, pa, ArrowBatchSource)),
+        )
+    if (ds := get_pyarrow_dataset()) is not None:  # pragma: no branch
+        for dataset_type in (ds.Dataset, ds.Scanner):
+            yield (
+                dataset_type,
+                ("lazyframe", partial(_arrow_object, pa, ArrowBatchSource)),
+            )
+
+
+@lru_cache(maxsize=None)
+def _backend_version(module: Any) -> tuple[int, ...]:
+    from narwhals.utils import parse_version
+
+    return parse_version(module.__version__)
+
+
+def _polars_object(pl: Any, native_object: Any) -> tuple[Any, bool, tuple[int, ...]]:
+    return native_object, True, _backend_version(pl)
+
+
+def _pandas_like_dataframe(
+    implementation: str, module: Any, native_dataframe: Any
+) -> tuple[Any, bool, tuple[int, ...]]:
+    from narwhals._pandas_like.dataframe import PandasDataFrame
+
+    backend_version = _backend_version(module)
+    return (
+        PandasDataFrame(
+            native_dataframe,
+            implementation=implementation,
+            backend_version=backend_version,
+        ),
+        False,
+        backend_version,
+    )
+
+
+def _pandas_like_series(
+    implementation: str, module: Any, native_series: Any
+) -> tuple[Any, bool, tuple[int, ...]]:
+    from narwhals._pandas_like.series import PandasSeries
+
+    backend_version = _backend_version(module)
+    return (
+        PandasSeries(
+            native_series,
+            implementation=implementation,
+            backend_version=backend_version,
+        ),
+        False,
+        backend_version,
+    )
+
+
+def _arrow_object(
+    pa: Any, compliant_class: Any, native_object: Any, **kwargs: Any
+) -> tuple[Any, bool, tuple[int, ...]]:
+    backend_version = _backend_version(pa)
+    return (
+        compliant_class(native_object, backend_version=backend_version, **kwargs),
+        False,
+        backend_version,
+    )
+
+
 def get_native_namespace(obj: Any) -> Any:
     """
     Get native namespace from object.
@@ -542,6 +593,7 @@ def narwhalify(
 
 __all__ = [
     "get_native_namespace",
+    "register_native",
     "to_native",
     "narwhalify",
 ]
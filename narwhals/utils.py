@@ -8,7 +8,6 @@ from typing import Sequence
 from typing import TypeVar
 from typing import cast
 
-from narwhals import dtypes
 from narwhals.dependencies import get_cudf
 from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_pandas
@@ -23,7 +22,7 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-def remove_prefix(text: str, prefix: str) -> str:
+def remove_prefix(text: str, prefix: str) -> str:  # pragma: no cover
     if text.startswith(prefix):
         return text[len(prefix) :]
     return text  # pragma: no cover
@@ -303,6 +302,8 @@ def is_ordered_categorical(series: Series) -> bool:
         >>> func(s_pl)
         True
     """
+    from narwhals import dtypes
+
     if series.dtype == dtypes.Enum:
         return True
     if series.dtype != dtypes.Categorical:
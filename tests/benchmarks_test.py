@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+import narwhals.stable.v1 as nw
+from benchmarks import expressions
+from benchmarks import run as run_module
+from benchmarks.expressions import BACKENDS
+from benchmarks.expressions import BENCHMARKS
+from benchmarks.run import main
+from benchmarks.run import run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmarks_agree(name: str, backend: str) -> None:
+    benchmark = BENCHMARKS[name]()
+    benchmark.setup(backend, 10)
+    result = nw.to_native(
+        benchmark.narwhals(nw.from_native(benchmark.df, eager_only=True))
+    )
+    expected = benchmark.native(benchmark.df)
+    assert type(result) is type(expected)
+    assert result.shape == expected.shape
+
+
+def test_only_concrete_benchmarks_are_collected() -> None:
+    # asv collects every public class with `time_*` methods in the benchmark
+    # modules, so the base class mustn't be one of them.
+    collected = {
+        name: value
+        for module in (expressions, run_module)
+        for name, value in vars(module).items()
+        if isinstance(value, type)
+        and not name.startswith("_")
+        and hasattr(value, "time_narwhals")
+    }
+    assert collected == BENCHMARKS
+
+
+def test_run() -> None:
+    results = run(["Sum", "Filter"], BACKENDS, [10], repeat=1)
+    # Each benchmark runs on each backend, in order.
+    assert [(record["benchmark"], record["backend"]) for record in results] == [
+        ("Sum", "pandas"),
+        ("Sum", "pyarrow"),
+        ("Filter", "pandas"),
+        ("Filter", "pyarrow"),
+    ]
+    record = results[0]
+    assert record["overhead_ratio"] == pytest.approx(
+        record["narwhals_s"] / record["native_s"]
+    )
+    assert record["overhead_s"] == pytest.approx(
+        record["narwhals_s"] - record["native_s"]
+    )
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = tmp_path / "overhead.json"
+    main(
+        [
+            "--benchmarks",
+            "FromNative",
+            "--backends",
+            "pandas",
+            "--sizes",
+            "10",
+            "--repeat",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+    (record,) = json.loads(output.read_text())
+    assert record["n_rows"] == 10
+    assert "FromNative" in capsys.readouterr().out
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._arrow.series import ArrowSeries
+from narwhals._pandas_like.series import PandasSeries
+from tests.utils import compare_dicts
+
+data = {"price": [10.0, 20.0], "discount": [0.1, 0.5], "tax": [0.0, 0.1]}
+
+
+@pytest.mark.parametrize(
+    ("constructor", "series_class"),
+    [(pd.DataFrame, PandasSeries), (pa.table, ArrowSeries)],
+)
+def test_common_subexpressions_evaluated_once(
+    constructor: Any, series_class: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    mul = series_class.__mul__
+
+    def counting_mul(self: Any, other: Any) -> Any:
+        calls.append(other)
+        return mul(self, other)
+
+    monkeypatch.setattr(series_class, "__mul__", counting_mul)
+    df = nw.from_native(constructor(data), eager_only=True)
+    disc_price = nw.col("price") * (nw.col("discount") * -1 + 1)
+    result = df.select(
+        disc_price=disc_price,
+        charge=nw.col("price") * (nw.col("discount") * -1 + 1) * (nw.col("tax") + 1),
+    )
+    compare_dicts(result, {"disc_price": [9.0, 10.0], "charge": [9.0, 11.0]})
+    # `discount * -1`, `price * (...)` and `(...) * (tax + 1)`.
+    assert len(calls) == 3
+    assert df._dataframe._expr_cache is None
+
+
+def test_structural_keys() -> None:
+    plx = nw.from_native(pd.DataFrame(data))._dataframe.__narwhals_namespace__()
+
+    def key(expr: Any) -> Any:
+        return expr._call(plx)._node.key
+
+    assert key(nw.col("price") + 1) == key(nw.col("price") + 1)
+    assert key(nw.col("price") + 1) != key(nw.col("price") + 2)
+    assert key(nw.col("price") + 1) != key(nw.col("price") + True)
+    assert key(nw.col("price") + 1) != key(nw.col("price").alias("p") + 1)
+    assert key(nw.lit(1)) != key(nw.lit(1, nw.Float64))
+    assert key(nw.col("price").sample(n=1)) is None
+    assert key(nw.col("price") + nw.col("price").sample(n=1)) is None
+    assert key(nw.col("price").str.starts_with("a")) == key(
+        nw.col("price").str.starts_with("a")
+    )
+    values = [1, 2]
+    assert key(nw.col("price").is_in(values)) == key(nw.col("price").is_in(values))
+    assert key(nw.col("price").is_in(values)) != key(nw.col("price").is_in([1, 2]))
+    assert key(nw.selectors.numeric()) is None
+    assert key(nw.selectors.numeric().str.starts_with("a")) is None
+
+
+def test_cse_filter_and_group_by() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    expr = nw.col("price") * 2
+    result = df.filter(expr > 15, expr < 30)
+    compare_dicts(result, {"price": [10.0], "discount": [0.1], "tax": [0.0]})
+    result = (
+        df.with_columns(g=nw.lit(1))
+        .group_by("g")
+        .agg(
+            a=(nw.col("price") * 2).sum(),
+            b=(nw.col("price") * 2).max(),
+        )
+    )
+    compare_dicts(result, {"g": [1], "a": [60.0], "b": [40.0]})
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+
+import narwhals.stable.v1 as nw
+from narwhals._pandas_like.expr_node import ExprNode
+
+data = {"a": [1, 1, 2], "b": [4.0, None, 6.0], "c": [1.0, 2.0, 3.0]}
+
+
+def compliant(expr: Any) -> Any:
+    plx = nw.from_native(pd.DataFrame(data))._dataframe.__narwhals_namespace__()
+    return expr._call(plx)
+
+
+def test_expr_tree() -> None:
+    node = compliant((nw.col("a") * nw.col("b")).sum().alias("ab"))._node
+    assert node.op == "alias"
+    assert node.literals == ["ab"]
+    (total,) = node.inputs
+    assert total.op == "sum"
+    (product,) = total.inputs
+    assert product.op == "__mul__"
+    assert [n.args for n in product.inputs] == [("a",), ("b",)]
+    assert [n.op for n in node.walk()] == ["alias", "sum", "__mul__", "col", "col"]
+    assert repr(product) == (
+        "ExprNode('__mul__', ExprNode('col', 'a'), other=ExprNode('col', 'b'))"
+    )
+    node = compliant(nw.col("a").str.slice(1, 2).over(["c"]))._node
+    assert node.op == "over"
+    assert node.literals == ["c"]
+    assert node.inputs[0].op == "str.slice"
+    assert node.inputs[0].literals == [1, 2]
+
+
+def test_expr_tree_leaves() -> None:
+    assert compliant(nw.lit(1))._node.literals == [1, None]
+    assert compliant(nw.len())._node.args == ()
+    assert compliant(nw.all())._node.args == ()
+    node = compliant(nw.selectors.numeric() - nw.selectors.boolean())._node
+    assert node.op == "selector"
+    assert [n.args[0] for n in node.inputs] == ["by_dtype", "by_dtype"]
+
+
+def test_node_keys() -> None:
+    assert ExprNode("col", "a").key == ExprNode("col", "a").key
+    assert ExprNode("sample", ExprNode("col", "a")).key is None
+    assert ExprNode("abs", ExprNode("sample", ExprNode("col", "a"))).key is None
+
+
+def test_node_str() -> None:
+    assert str(compliant((nw.col("a") * 2).sum().alias("x"))._node) == (
+        "(col('a') * 2).sum().alias('x')"
+    )
+    assert str(compliant(1 - nw.col("a"))._node) == "(1 - col('a'))"
+    assert str(compliant(~(nw.col("a") > nw.lit(1)))._node) == "~(col('a') > lit(1))"
+    assert str(compliant(nw.lit(1, nw.Int64))._node) == "lit(1, Int64)"
+    assert str(compliant(nw.col("a").is_in([1, 2]))._node) == "col('a').is_in([1, 2])"
+    assert str(compliant(nw.col("a").std(ddof=0))._node) == "col('a').std(ddof=0)"
+    series = nw.from_native(pd.DataFrame(data), eager_only=True)["a"]
+    assert str(compliant(nw.col("a") + series)._node) == "(col('a') + series)"
@@ -1,5 +1,7 @@
 from typing import Any
 
+import pyarrow as pa
+
 import narwhals.stable.v1 as nw
 from tests.utils import compare_dicts
 
@@ -20,3 +22,13 @@ def test_n_unique(constructor: Any) -> None:
     assert df["a"].n_unique() == 3
     assert df["b"].n_unique() == 4
     compare_dicts(result, expected)
+
+
+def test_n_unique_pyarrow() -> None:
+    df = nw.from_native(pa.table(data), eager_only=True)
+    result = df.select(
+        nw.col("a", "b").n_unique(),
+        a_min=nw.col("a").min(),
+        b_len=nw.col("b").len(),
+    )
+    compare_dicts(result, {"a": [3], "b": [4], "a_min": [1.0], "b_len": [4]})
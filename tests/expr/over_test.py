@@ -41,3 +41,83 @@ def test_over_invalid() -> None:
     df = nw.from_native(pd.DataFrame(data))
     with pytest.raises(ValueError, match="Anonymous expressions"):
         df.with_columns(c_min=nw.all().min().over("a", "b"))
+
+
+def test_over_transform(constructor: Any) -> None:
+    df = nw.from_native(constructor(data))
+    result = df.select(
+        "a",
+        b_sum=(nw.col("b") * 2).sum().over("a"),
+        c_mean=nw.col("c").mean().over("a"),
+        c_std=nw.col("c").std().over("a"),
+        b_filtered=nw.col("b").filter(nw.col("c") > 1).sum().over("a"),
+        n=nw.len().over("a"),
+        c_len=nw.col("c").len().over("a"),
+    )
+    expected = {
+        "a": ["a", "a", "b", "b", "b"],
+        "b_sum": [6, 6, 22, 22, 22],
+        "c_mean": [4.5, 4.5, 2, 2, 2],
+        "c_std": [0.707107, 0.707107, 1, 1, 1],
+        "b_filtered": [3, 3, 8, 8, 8],
+        "n": [2, 2, 3, 3, 3],
+        "c_len": [2, 2, 3, 3, 3],
+    }
+    compare_dicts(result, expected)
+
+
+def test_over_window_functions(constructor: Any) -> None:
+    df = nw.from_native(constructor(data))
+    result = df.select("a", b_cum_sum=nw.col("b").cum_sum().over("a"))
+    expected = {"a": ["a", "a", "b", "b", "b"], "b_cum_sum": [1, 3, 3, 8, 11]}
+    compare_dicts(result, expected)
+    df = nw.from_native(pd.DataFrame(data))
+    result = df.select(
+        nw.col("c", "b").shift(1).over("a"),
+        b_diff=nw.col("b").diff().over("a"),
+    )
+    expected = {
+        "c": [float("nan"), 5, float("nan"), 3, 2],
+        "b": [float("nan"), 1, float("nan"), 3, 5],
+        "b_diff": [float("nan"), 1, float("nan"), 2, -2],
+    }
+    compare_dicts(result, expected)
+
+
+def test_over_shares_group_codes(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    ngroup = pd.core.groupby.DataFrameGroupBy.ngroup
+
+    def counting_ngroup(self: Any, *args: Any, **kwargs: Any) -> Any:
+        calls.append(self)
+        return ngroup(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.core.groupby.DataFrameGroupBy, "ngroup", counting_ngroup)
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    result = df.select(
+        b_max=nw.col("b").max().over("a"),
+        c_cum_sum=nw.col("c").cum_sum().over("a"),
+    )
+    expected = {"b_max": [2, 2, 5, 5, 5], "c_cum_sum": [5, 9, 3, 5, 6]}
+    compare_dicts(result, expected)
+    assert len(calls) == 1
+
+
+def test_over_index_and_nulls() -> None:
+    native = pd.DataFrame(
+        {"a": ["x", None, "x", None], "b": [1, 2, 3, 4]}, index=[3, 1, 2, 0]
+    )
+    df = nw.from_native(native, eager_only=True)
+    result = df.with_columns(b_sum=nw.col("b").sum().over("a"))
+    expected = {"a": ["x", None, "x", None], "b": [1, 2, 3, 4], "b_sum": [4, 6, 4, 6]}
+    compare_dicts(result, expected)
+    assert list(nw.to_native(result).index) == [3, 1, 2, 0]
+    # This isn't a transform, so it gets aggregated and joined back.
+    df = nw.from_native(native.fillna("y"), eager_only=True)
+    with pytest.warns(UserWarning, match="complex group-by"):
+        result = df.with_columns(
+            b_range=(nw.col("b").max() - nw.col("b").min()).over("a")
+        )
+    expected = {"a": ["x", "y", "x", "y"], "b": [1, 2, 3, 4], "b_range": [2, 2, 2, 2]}
+    compare_dicts(result, expected)
+    assert list(nw.to_native(result).index) == [3, 1, 2, 0]
@@ -4,19 +4,47 @@ import narwhals.stable.v1 as nw
 from tests.utils import compare_dicts
 
 
-def test_filter(constructor: Any) -> None:
+def test_filter(constructor_with_pyarrow: Any) -> None:
     data = {"a": [1, 3, 2], "b": [4, 4, 6], "z": [7.0, 8, 9]}
-    df = nw.from_native(constructor(data), eager_only=True)
+    df = nw.from_native(constructor_with_pyarrow(data), eager_only=True)
     result = df.filter(nw.col("a") > 1)
     expected = {"a": [3, 2], "b": [4, 6], "z": [8.0, 9.0]}
     compare_dicts(result, expected)
 
 
-def test_filter_series(constructor: Any) -> None:
+def test_filter_series(constructor_with_pyarrow: Any) -> None:
     data = {"a": [1, 3, 2], "b": [4, 4, 6], "z": [7.0, 8, 9]}
-    df = nw.from_native(constructor(data), eager_only=True).with_columns(
+    df = nw.from_native(constructor_with_pyarrow(data), eager_only=True).with_columns(
         mask=nw.col("a") > 1
     )
     result = df.filter(df["mask"]).drop("mask")
     expected = {"a": [3, 2], "b": [4, 6], "z": [8.0, 9.0]}
     compare_dicts(result, expected)
+
+
+def test_filter_single_row(constructor_with_pyarrow: Any) -> None:
+    data = {"a": [1, 3, 2], "b": [4, 4, 6]}
+    df = nw.from_native(constructor_with_pyarrow(data), eager_only=True)
+    result = df.filter(nw.col("a") == 3).filter(nw.col("b") == nw.col("b").max())
+    compare_dicts(result, {"a": [3], "b": [4]})
+    result = df.filter(nw.col("a") == 3).filter(nw.col("b") > 4)
+    compare_dicts(result, {"a": [], "b": []})
+
+
+def test_filter_comparisons(constructor_with_pyarrow: Any) -> None:
+    data = {"a": [1, 3, 2], "b": [4, 4, 6]}
+    df = nw.from_native(constructor_with_pyarrow(data), eager_only=True)
+    result = df.filter(
+        (nw.col("a") > 1) & (nw.col("a") >= 2) & (nw.col("a") < 3),
+        (nw.col("a") <= 2) & (nw.col("a") != 3) & (nw.col("a") == 2),
+    )
+    compare_dicts(result, {"a": [2], "b": [6]})
+    result = df.filter((nw.col("a") == 1) | ~(nw.col("b") <= 4))
+    compare_dicts(result, {"a": [1, 2], "b": [4, 6]})
+
+
+def test_filter_is_null(constructor_with_pyarrow: Any) -> None:
+    data = {"a": [1, None, 2], "b": [4, 4, 6]}
+    df = nw.from_native(constructor_with_pyarrow(data), eager_only=True)
+    result = df.filter(~nw.col("a").is_null())
+    compare_dicts(result, {"a": [1, 2], "b": [4, 6]})
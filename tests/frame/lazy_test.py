@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._lazy.dataframe import LazyPlanFrame
+from narwhals._lazy.plan import Filter
+from narwhals._lazy.plan import PlanNode
+from narwhals._lazy.plan import Scan
+from narwhals._lazy.plan import Select
+from narwhals._lazy.plan import execute
+from tests.utils import compare_dicts
+
+data = {"a": [1, 3, 2], "b": [4, 4, 6], "z": [7.0, 8, 9]}
+
+
+def test_lazy_records_plan() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    assert isinstance(df._dataframe, LazyPlanFrame)
+    result = df.select("a", "b").filter(nw.col("a") > 1)
+    plan = result._dataframe._plan
+    assert isinstance(plan, Filter)
+    assert isinstance(plan.input, Select)
+    assert isinstance(plan.input.input, Scan)
+    assert result.columns == ["a", "b"]
+    assert result._dataframe._collected is None
+    compare_dicts(result, {"a": [3, 2], "b": [4, 6]})
+
+
+def test_lazy_pyarrow_select() -> None:
+    df = nw.from_native(pa.table(data)).lazy()
+    result = df.with_columns(c=nw.col("a") + nw.col("b")).select("a", "c")
+    assert result.columns == ["a", "c"]
+    compare_dicts(result, {"a": [1, 3, 2], "c": [5, 7, 8]})
+    assert nw.to_native(result).column_names == ["a", "c"]
+    assert nw.get_native_namespace(result) is pa
+
+
+def test_lazy_collect_is_cached() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy().with_columns(nw.col("a") * 2)
+    assert df._dataframe.collect() is df._dataframe.collect()
+    compare_dicts(df.collect(), {"a": [2, 6, 4], "b": [4, 4, 6], "z": [7.0, 8, 9]})
+    assert df.lazy()._dataframe is df._dataframe
+    assert nw.get_native_namespace(df) is pd
+
+
+def test_lazy_columns() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    assert df.with_row_index("idx").rename({"a": "x"}).drop("b").columns == [
+        "idx",
+        "x",
+        "z",
+    ]
+    assert df.with_columns(d=nw.lit(1)).columns == ["a", "b", "z", "d"]
+    # Anonymous expressions need the plan to run to know their output names.
+    result = df.select(nw.all())
+    assert result.columns == ["a", "b", "z"]
+    assert result._dataframe._collected is not None
+    result = df.with_columns(nw.all() * 2)
+    assert result.columns == ["a", "b", "z"]
+    with pytest.raises(ValueError, match="Anonymous expressions"):
+        _ = df.group_by("a").agg(nw.all().sum()).columns
+    assert df.select(nw.all()).with_columns(c=nw.lit(1)).columns == [
+        "a",
+        "b",
+        "z",
+        "c",
+    ]
+    assert df.group_by("a").agg(nw.col("b").sum()).columns == ["a", "b"]
+    assert df.select(nw.all()).with_row_index("idx").rename({"a": "x"}).drop(
+        "b"
+    ).columns == ["idx", "x", "z"]
+    assert df.schema == {"a": nw.Int64, "b": nw.Int64, "z": nw.Float64}
+
+
+def test_lazy_chained_ops() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = (
+        df.sort("a", descending=True)
+        .drop_nulls()
+        .unique(subset=["b"])
+        .clone()
+        .head(2)
+        .tail(1)
+    )
+    assert result.columns == ["a", "b", "z"]
+    compare_dicts(result, {"a": [2], "b": [6], "z": [9.0]})
+
+
+@pytest.mark.parametrize(
+    ("how", "expected_columns"),
+    [
+        ("inner", ["a", "b", "z", "b_right", "z_right"]),
+        ("anti", ["a", "b", "z"]),
+        ("semi", ["a", "b", "z"]),
+        ("cross", ["a", "b", "z", "a_right", "b_right", "z_right"]),
+    ],
+)
+def test_lazy_join(how: Any, expected_columns: list[str]) -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    kwargs = {} if how == "cross" else {"left_on": "a", "right_on": "a"}
+    other = df.filter(nw.col("a") > 1)
+    result = df.join(other, how=how, **kwargs)
+    assert result.columns == expected_columns
+    assert nw.to_native(result).columns.tolist() == expected_columns
+    # Columns which depend on the plan being executed.
+    result = df.select(nw.all()).join(other, how=how, **kwargs)
+    assert result.columns == expected_columns
+
+
+def test_lazy_join_eager_other() -> None:
+    df = nw.from_native(pd.DataFrame(data))
+    result = df.lazy()._dataframe.join(
+        df._dataframe, how="inner", left_on="a", right_on="a"
+    )
+    assert result.columns == ["a", "b", "z", "b_right", "z_right"]
+
+
+@pytest.mark.parametrize("how", ["vertical", "horizontal"])
+def test_lazy_concat(how: Any) -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    other = df.select(nw.col("a").alias("c")) if how == "horizontal" else df
+    result = nw.concat([df, other], how=how)
+    assert isinstance(result._dataframe, LazyPlanFrame)
+    if how == "horizontal":
+        assert result.columns == ["a", "b", "z", "c"]
+        expected = {**data, "c": [1, 3, 2]}
+    else:
+        assert result.columns == ["a", "b", "z"]
+        expected = {k: [*v, *v] for k, v in data.items()}
+    compare_dicts(result, expected)
+    result = nw.concat([df.select(nw.all()), other], how=how)
+    assert result.columns == list(expected)
+
+
+def test_execute_shared_subplan() -> None:
+    calls: list[int] = []
+
+    class Counted(PlanNode):
+        def execute(self, *frames: Any) -> Any:
+            calls.append(1)
+            return frames[0]
+
+    df = nw.from_native(pd.DataFrame(data))
+    counted = Counted().with_inputs(Scan(df._dataframe))
+    assert counted.output_names() is None
+    plan = LazyPlanFrame(
+        counted,
+        implementation="pandas",
+        backend_version=df._dataframe._backend_version,
+    )
+    result = plan.join(plan, how="inner", left_on=["a"], right_on=["a"])
+    execute(result._plan)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("constructor", [pd.DataFrame, pa.table])
+def test_eager_narwhals_lazyframe(constructor: Any) -> None:
+    df = nw.from_native(constructor(data), eager_only=True)
+    assert isinstance(df._dataframe.__narwhals_lazyframe__(), LazyPlanFrame)
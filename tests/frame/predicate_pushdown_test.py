@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._lazy.optimize import pushdown_predicates
+from narwhals._lazy.plan import Aggregate
+from narwhals._lazy.plan import Filter
+from narwhals._lazy.plan import Head
+from narwhals._lazy.plan import Join
+from narwhals._lazy.plan import PlanNode
+from narwhals._lazy.plan import Scan
+from narwhals._lazy.plan import WithColumns
+from tests.utils import compare_dicts
+
+data = {"a": [1, 3, 2, 4], "b": [4, 4, 6, 6], "c": [7.0, 8, 9, 10]}
+
+
+def optimized(df: Any) -> PlanNode:
+    return pushdown_predicates(df._dataframe._plan)
+
+
+def n_predicates(node: PlanNode) -> int:
+    assert isinstance(node, Filter)
+    return len(node.predicates)
+
+
+def test_filter_fusion() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = (
+        df.filter(nw.col("a") > 1)
+        .with_columns(d=nw.col("a") * 2)
+        .filter(nw.col("b") == 4)
+    )
+    plan = optimized(result)
+    assert isinstance(plan, WithColumns)
+    assert n_predicates(plan.input) == 2
+    assert isinstance(plan.input.input, Scan)
+    compare_dicts(result, {"a": [3], "b": [4], "c": [8.0], "d": [6]})
+
+
+def test_non_elementwise_predicates() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.filter(nw.col("a") > 1).filter(nw.col("a") > nw.col("a").mean())
+    plan = optimized(result)
+    assert n_predicates(plan) == 1
+    assert n_predicates(plan.input) == 1
+    compare_dicts(result, {"a": [4], "b": [6], "c": [10.0]})
+    # Elementwise predicates can't go below non-elementwise ones either.
+    result = df.filter(nw.col("a") > nw.col("a").mean()).filter(nw.col("b") == 6)
+    plan = optimized(result)
+    assert n_predicates(plan) == 1
+    assert n_predicates(plan.input) == 1
+    compare_dicts(result, {"a": [4], "b": [6], "c": [10.0]})
+    # Order-dependent expressions block predicates.
+    result = df.with_columns(d=nw.col("a").cum_sum()).filter(nw.col("a") > 2)
+    assert isinstance(optimized(result), Filter)
+    compare_dicts(result, {"a": [3, 4], "b": [4, 6], "c": [8.0, 10], "d": [4, 10]})
+    result = df.filter(nw.col("a").is_duplicated())
+    assert isinstance(optimized(result), Filter)
+
+
+def test_pushdown_with_columns() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    # Predicates on new columns stay where they are.
+    result = df.with_columns(d=nw.col("a") * 2).filter(nw.col("d") > 4)
+    assert isinstance(optimized(result), Filter)
+    compare_dicts(result, {"a": [3, 4], "b": [4, 6], "c": [8.0, 10], "d": [6, 8]})
+    result = df.with_columns(nw.all() * 2).filter(nw.col("a") > 4)
+    assert isinstance(optimized(result), Filter)
+    # As do predicates whose inputs aren't known.
+    result = df.with_columns(d=nw.lit(1)).filter(nw.all() > 1)
+    assert isinstance(optimized(result), Filter)
+
+
+def test_pushdown_select() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.select("a", nw.col("b") * 2).filter(nw.col("a") > 2)
+    assert isinstance(optimized(result).input, Filter)
+    compare_dicts(result, {"a": [3, 4], "b": [8, 12]})
+    result = df.select("a", nw.col("b") * 2).filter(nw.col("b") > 10)
+    assert isinstance(optimized(result), Filter)
+    compare_dicts(result, {"a": [2, 4], "b": [12, 12]})
+    result = df.select(nw.col("b").alias("a")).filter(nw.col("a") > 4)
+    assert isinstance(optimized(result), Filter)
+    compare_dicts(result, {"a": [6, 6]})
+    result = df.select("a", nw.col("b").mean()).filter(nw.col("a") > 2)
+    assert isinstance(optimized(result), Filter)
+
+
+def test_pushdown_join() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    other = nw.from_native(
+        pd.DataFrame({"a": [1, 2, 3], "b": [0, 0, 1], "d": [5, 6, 7]})
+    ).lazy()
+    joined = df.join(other, left_on="a", right_on="a")
+
+    result = joined.filter(nw.col("c") > 7, nw.col("d") > 5)
+    plan = optimized(result)
+    assert isinstance(plan, Join)
+    assert n_predicates(plan.inputs[0]) == 1
+    assert n_predicates(plan.inputs[1]) == 1
+    compare_dicts(
+        result, {"a": [3, 2], "b": [4, 6], "c": [8.0, 9], "b_right": [1, 0], "d": [7, 6]}
+    )
+
+    # Filters on keys with the same name go to both sides.
+    result = joined.filter(nw.col("a") > 1)
+    plan = optimized(result)
+    assert n_predicates(plan.inputs[0]) == 1
+    assert n_predicates(plan.inputs[1]) == 1
+    compare_dicts(
+        result, {"a": [3, 2], "b": [4, 6], "c": [8.0, 9], "b_right": [1, 0], "d": [7, 6]}
+    )
+
+    # Suffixed columns, or predicates reading both sides, stay after the join.
+    result = joined.filter(nw.col("b_right") == 1)
+    assert isinstance(optimized(result), Filter)
+    result = joined.filter(nw.col("c") > nw.col("d"))
+    assert isinstance(optimized(result), Filter)
+    compare_dicts(
+        result,
+        {
+            "a": [1, 3, 2],
+            "b": [4, 4, 6],
+            "c": [7.0, 8, 9],
+            "b_right": [0, 1, 0],
+            "d": [5, 7, 6],
+        },
+    )
+
+    result = df.join(other, how="cross").filter(nw.col("d") > 6)
+    plan = optimized(result)
+    assert isinstance(plan, Join)
+    assert n_predicates(plan.inputs[1]) == 1
+    assert len(nw.to_native(result)) == 4
+
+    result = df.join(other, how="anti", left_on="a", right_on="a").filter(nw.col("b") > 4)
+    plan = optimized(result)
+    assert n_predicates(plan.inputs[0]) == 1
+    compare_dicts(result, {"a": [4], "b": [6], "c": [10.0]})
+
+
+@pytest.mark.parametrize(
+    ("how", "root_names", "expected"),
+    [
+        ("left", {"c"}, [0]),
+        ("left", {"a"}, [0]),
+        ("left", {"d"}, []),
+        ("outer", {"c"}, []),
+    ],
+)
+def test_pushdown_join_targets(
+    how: str, root_names: set[str], expected: list[int]
+) -> None:
+    df = nw.from_native(pd.DataFrame(data))._dataframe
+    other = nw.from_native(pd.DataFrame({"a": [1], "d": [5]}))._dataframe
+    node = Join(Scan(df), Scan(other), how=how, left_on=["a"], right_on=["a"])
+    assert node.pushdown_targets(root_names) == expected
+
+
+def test_pushdown_join_unknown_names() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = (
+        df.select(nw.all()).join(df, left_on="a", right_on="a").filter(nw.col("c") > 7)
+    )
+    assert isinstance(optimized(result), Filter)
+
+
+def test_pushdown_group_by() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    agg = df.group_by("b").agg(nw.col("a").sum())
+    result = agg.filter(nw.col("b") > 4)
+    plan = optimized(result)
+    assert isinstance(plan, Aggregate)
+    assert isinstance(plan.input, Filter)
+    compare_dicts(result, {"b": [6], "a": [6]})
+    result = agg.filter(nw.col("a") > 4)
+    assert isinstance(optimized(result), Filter)
+    compare_dicts(result, {"b": [6], "a": [6]})
+
+
+def test_pushdown_row_ops() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.sort("a").drop("c").drop_nulls().clone().filter(nw.col("b") == 4)
+    plan = optimized(result)
+    while not isinstance(plan, Scan):
+        assert not isinstance(plan, Filter) or isinstance(plan.input, Scan)
+        plan = plan.input
+    compare_dicts(result, {"a": [1, 3], "b": [4, 4]})
+    result = df.head(2).filter(nw.col("b") == 4)
+    plan = optimized(result)
+    assert isinstance(plan, Filter)
+    assert isinstance(plan.input, Head)
+    result = nw.concat([df, df]).filter(nw.col("a") > 3)
+    plan = optimized(result)
+    assert all(isinstance(node, Filter) for node in plan.inputs)
+    compare_dicts(result, {"a": [4, 4], "b": [6, 6], "c": [10.0, 10]})
+    result = nw.concat([df, df.select("a")], how="horizontal").filter(nw.col("b") > 4)
+    assert isinstance(optimized(result), Filter)
+
+
+def test_pushdown_keeps_shared_subplans() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy().with_columns(d=nw.col("a") + 1)
+    result = df.join(df, left_on="a", right_on="a").filter(nw.col("d_right") > 3)
+    plan = optimized(result)
+    assert isinstance(plan, Filter)
+    left, right = plan.input.inputs
+    assert left is right
+    compare_dicts(
+        result,
+        {
+            "a": [3, 4],
+            "b": [4, 6],
+            "c": [8.0, 10],
+            "d": [4, 5],
+            "b_right": [4, 6],
+            "c_right": [8.0, 10],
+            "d_right": [4, 5],
+        },
+    )
+
+
+def test_series_predicate() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    mask = df["a"] > 2
+    result = df.lazy().drop("c").filter(mask)
+    plan = optimized(result)
+    assert isinstance(plan, Filter)
+    compare_dicts(result, {"a": [3, 4], "b": [4, 6]})
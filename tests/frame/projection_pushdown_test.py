@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._lazy.optimize import pushdown_projections
+from narwhals._lazy.plan import Aggregate
+from narwhals._lazy.plan import Drop
+from narwhals._lazy.plan import PlanNode
+from narwhals._lazy.plan import Scan
+from narwhals._lazy.plan import WithColumns
+from tests.utils import compare_dicts
+
+data = {
+    "a": [1, 3, 2],
+    "b": [4, 4, 6],
+    "c": [7.0, 8, 9],
+    "d": ["x", "y", "z"],
+    "e": [0, 0, 1],
+}
+
+
+def optimized_nodes(df: Any) -> list[PlanNode]:
+    nodes: list[PlanNode] = []
+    stack = [pushdown_projections(df._dataframe._plan)]
+    while stack:
+        node = stack.pop()
+        if all(node is not n for n in nodes):
+            nodes.append(node)
+            stack.extend(node.inputs)
+    return nodes
+
+
+def scanned_columns(df: Any) -> list[list[str] | None]:
+    return [node.columns for node in optimized_nodes(df) if isinstance(node, Scan)]
+
+
+@pytest.mark.parametrize("constructor", [pd.DataFrame, pa.table])
+def test_scan_projection(constructor: Any) -> None:
+    df = nw.from_native(constructor(data)).lazy()
+    result = df.with_columns(f=nw.col("a") + nw.col("b")).select("f", "b")
+    assert scanned_columns(result) == [["a", "b"]]
+    compare_dicts(result, {"f": [5, 7, 8], "b": [4, 4, 6]})
+
+
+def test_unused_with_columns_dropped() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.with_columns(nw.col("c") * 2, f=nw.col("d"), g=nw.col("e") + 1).select(
+        "a", "g"
+    )
+    nodes = optimized_nodes(result)
+    (with_columns,) = (node for node in nodes if isinstance(node, WithColumns))
+    assert list(with_columns.named_exprs) == ["g"]
+    assert not with_columns.exprs
+    assert scanned_columns(result) == [["a", "e"]]
+    compare_dicts(result, {"a": [1, 3, 2], "g": [1, 1, 2]})
+    # None of the new columns are used.
+    result = df.with_columns(nw.col("c") * 2, f=nw.col("d")).select("a")
+    assert not any(isinstance(node, WithColumns) for node in optimized_nodes(result))
+    compare_dicts(result, {"a": [1, 3, 2]})
+    # Overwritten columns don't need reading.
+    result = df.with_columns(a=nw.col("b") * 2).select("a", "b")
+    assert scanned_columns(result) == [["b"]]
+    compare_dicts(result, {"a": [8, 8, 12], "b": [4, 4, 6]})
+    # Anonymous expressions need everything.
+    result = df.with_columns(nw.all() * 2).select("a")
+    assert scanned_columns(result) == [None]
+    compare_dicts(result, {"a": [2, 6, 4]})
+
+
+def test_group_by_projection() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = (
+        df.group_by("b")
+        .agg(nw.col("a").sum(), nw.col("c").mean(), e_max=nw.col("e").max())
+        .select("b", "e_max")
+        .sort("b")
+    )
+    (aggregate,) = (
+        node for node in optimized_nodes(result) if isinstance(node, Aggregate)
+    )
+    assert not aggregate.aggs
+    assert list(aggregate.named_aggs) == ["e_max"]
+    assert scanned_columns(result) == [["b", "e"]]
+    compare_dicts(result, {"b": [4, 6], "e_max": [0, 1]})
+    # Only the keys are used: the aggregation is kept as it is.
+    result = df.group_by("b").agg(nw.col("a").sum()).select("b").sort("b")
+    assert scanned_columns(result) == [["a", "b"]]
+    compare_dicts(result, {"b": [4, 6]})
+
+
+def test_join_projection() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    other = nw.from_native(pd.DataFrame({"a": [1, 2], "b": [0, 1], "f": [5, 6]})).lazy()
+    result = df.join(other, left_on="a", right_on="a").select("a", "c", "f")
+    assert scanned_columns(result) == [["a", "f"], ["a", "c"]]
+    compare_dicts(result, {"a": [1, 2], "c": [7.0, 9], "f": [5, 6]})
+    # The suffix only gets added if both sides have the column.
+    result = df.join(other, left_on="a", right_on="a").select("a", "b_right")
+    assert scanned_columns(result) == [["a", "b"], ["a", "b"]]
+    compare_dicts(result, {"a": [1, 2], "b_right": [0, 1]})
+    result = df.join(other, how="anti", left_on="a", right_on="a").select("c")
+    assert scanned_columns(result) == [["a"], ["a", "c"]]
+    compare_dicts(result, {"c": [8.0]})
+    result = df.join(other, how="cross").select("d", "f")
+    assert scanned_columns(result) == [["f"], ["d"]]
+    assert len(nw.to_native(result)) == 6
+    # Without a projection on top, everything is needed.
+    result = df.join(other, left_on="a", right_on="a")
+    assert scanned_columns(result) == [None, None]
+
+
+def test_self_join_projection() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy().filter(nw.col("e") == 0)
+    result = df.join(df.select("a", "c"), left_on="a", right_on="a").select(
+        "b", "c_right"
+    )
+    assert scanned_columns(result) == [["a", "b", "c", "e"]]
+    compare_dicts(result, {"b": [4, 4], "c_right": [7.0, 8]})
+
+
+def test_drop_projection() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.drop("c", "d")
+    assert scanned_columns(result) == [["a", "b", "e"]]
+    assert not any(isinstance(node, Drop) for node in optimized_nodes(result))
+    compare_dicts(result, {"a": [1, 3, 2], "b": [4, 4, 6], "e": [0, 0, 1]})
+    result = df.with_columns(f=nw.col("a") + 1).drop("c", "f")
+    assert scanned_columns(result) == [["a", "b", "d", "e"]]
+    assert not any(isinstance(node, Drop) for node in optimized_nodes(result))
+    compare_dicts(
+        result, {"a": [1, 3, 2], "b": [4, 4, 6], "d": ["x", "y", "z"], "e": [0, 0, 1]}
+    )
+    result = df.with_columns(nw.col("a").alias("f")).select(nw.all()).drop("b", "f")
+    (drop,) = (node for node in optimized_nodes(result) if isinstance(node, Drop))
+    assert drop.columns == ["b", "f"]
+    assert scanned_columns(result) == [None]
+    result = df.select("a", "b", "c").with_columns(f=nw.col("a") + 1).drop("c", "f")
+    (drop,) = (node for node in optimized_nodes(result) if isinstance(node, Drop))
+    assert drop.columns == ["c"]
+    compare_dicts(result, {"a": [1, 3, 2], "b": [4, 4, 6]})
+    result = df.select("a", "c").drop("c")
+    compare_dicts(result, {"a": [1, 3, 2]})
+    result = df.drop("c").select("a")
+    assert scanned_columns(result) == [["a"]]
+
+
+def test_projection_through_row_ops() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = (
+        df.rename({"a": "x"})
+        .filter(nw.col("e") == 0)
+        .sort("c", descending=True)
+        .unique(subset=["c"])
+        .head(2)
+        .tail(2)
+        .clone()
+        .select("x")
+    )
+    assert scanned_columns(result) == [["a", "c", "e"]]
+    compare_dicts(result, {"x": [3, 1]})
+    result = df.drop_nulls().select("a")
+    assert scanned_columns(result) == [None]
+    result = nw.concat([df, df.head(1)]).select("a")
+    assert scanned_columns(result) == [None]
+    result = df.filter(nw.all() == nw.all()).select("a")
+    assert scanned_columns(result) == [None]
+
+
+def test_projection_keeps_a_column() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.with_row_index("idx").select("idx")
+    assert scanned_columns(result) == [["a"]]
+    compare_dicts(result, {"idx": [0, 1, 2]})
+
+
+def test_over_root_names() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.select(nw.col("a").sum().over("b"))
+    assert scanned_columns(result) == [["a", "b"]]
+    compare_dicts(result, {"a": [4, 4, 2]})
@@ -41,8 +41,9 @@ df_polars_na = pl.DataFrame({"a": [None, 3, 2], "b": [4, 4, 6], "z": [7.0, None,
 
 
 @pytest.mark.parametrize(
-    "df_raw", [df_pandas, df_pandas_nullable, df_pandas_pyarrow, df_polars]
+    "df_raw", [df_pandas, df_pandas_nullable, df_pandas_pyarrow, df_polars, df_pa]
 )
+@pytest.mark.parametrize("buffer_size", [1, 2, 512])
 @pytest.mark.parametrize(
     ("named", "expected"),
     [
@@ -59,14 +60,41 @@ df_polars_na = pl.DataFrame({"a": [None, 3, 2], "b": [4, 4, 6], "z": [7.0, None,
 )
 def test_iter_rows(
     df_raw: Any,
+    buffer_size: int,
     named: bool,  # noqa: FBT001
     expected: list[tuple[Any, ...]] | list[dict[str, Any]],
 ) -> None:
     df = nw.from_native(df_raw, eager_only=True)
-    result = list(df.iter_rows(named=named))
+    result = list(df.iter_rows(named=named, buffer_size=buffer_size))
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "df_raw", [df_pandas, df_pandas_nullable, df_pandas_pyarrow, df_polars, df_pa]
+)
+@pytest.mark.parametrize("buffer_size", [0, -1])
+def test_iter_rows_invalid_buffer_size(df_raw: Any, buffer_size: int) -> None:
+    df = nw.from_native(df_raw, eager_only=True)
+    with pytest.raises(ValueError, match="Expected a positive `buffer_size`"):
+        df.iter_rows(buffer_size=buffer_size)
+
+
+def test_iter_rows_python_values() -> None:
+    df_raw = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "b": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+            "c": pd.Categorical(["x", "y"]),
+            "d": [True, False],
+        }
+    )
+    df = nw.from_native(df_raw, eager_only=True)
+    result = list(df.iter_rows())
+    assert result == list(df_raw.itertuples(index=False, name=None))
+    assert [type(value) for value in result[0]] == [int, pd.Timestamp, str, bool]
+    assert list(df.head(0).iter_rows()) == []
+
+
 @pytest.mark.parametrize(
     "df_raw", [df_pandas, df_pandas_nullable, df_pandas_pyarrow, df_polars, df_pa]
 )
@@ -90,13 +118,6 @@ def test_rows(
     expected: list[tuple[Any, ...]] | list[dict[str, Any]],
 ) -> None:
     df = nw.from_native(df_raw, eager_only=True)
-    if isinstance(df_raw, pa.Table) and not named:
-        with pytest.raises(
-            NotImplementedError,
-            match="Unnamed rows are not yet supported on PyArrow tables",
-        ):
-            df.rows(named=named)
-        return
     result = df.rows(named=named)
     assert result == expected
 
@@ -6,6 +6,7 @@ from typing import Any
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 
 import narwhals.stable.v1 as nw
@@ -140,3 +141,62 @@ def test_unknown_dtype_polars() -> None:
 
 def test_hash() -> None:
     assert nw.Int64() in {nw.Int64, nw.Int32}
+
+
+def test_schema_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    from narwhals._pandas_like import utils
+
+    calls = []
+    translate_native_dtype = utils._translate_native_dtype
+
+    def counting_translate(dtype: str) -> Any:
+        calls.append(dtype)
+        return translate_native_dtype(dtype)
+
+    monkeypatch.setattr(utils, "_translate_native_dtype", counting_translate)
+    monkeypatch.setattr(utils, "_TRANSLATED_DTYPES", {})
+    df = nw.from_native(
+        pd.DataFrame({f"a{i}": [1, 2] for i in range(10)}).assign(b=["x", "y"]),
+        eager_only=True,
+    )
+    result = df.select(nw.selectors.numeric(), nw.selectors.string().alias("b"))
+    assert result.columns == [*(f"a{i}" for i in range(10)), "b"]
+    assert calls == ["int64"]
+    assert df.schema == {**{f"a{i}": nw.Int64 for i in range(10)}, "b": nw.String}
+    df.schema["b"] = nw.Int64
+    assert df.schema["b"] == nw.String
+
+
+@pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("2.0.0"), reason="too old"
+)
+def test_schema_cache_skips_parametrised_dtypes(monkeypatch: pytest.MonkeyPatch) -> None:
+    from narwhals._pandas_like import utils
+
+    monkeypatch.setattr(utils, "_TRANSLATED_DTYPES", {})
+    native = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "b": pd.Series([1, None], dtype="Int64"),
+            "c": pd.Series(["x", None], dtype="string"),
+            "d": pd.Series(["x", "y"], dtype="category"),
+            "e": pd.Series([0, 1], dtype="datetime64[ns]").dt.tz_localize("UTC"),
+            "f": pd.Series([1, 2], dtype=pd.ArrowDtype(pa.int64())),
+        }
+    )
+    schema = nw.from_native(native, eager_only=True).schema
+    assert list(schema.values()) == [
+        nw.Int64,
+        nw.Int64,
+        nw.String,
+        nw.Categorical,
+        nw.Datetime,
+        nw.Int64,
+    ]
+    # Only dtypes without parameters get cached, rather than e.g. each set of
+    # categories.
+    assert set(utils._TRANSLATED_DTYPES) == {
+        native["a"].dtype,
+        native["b"].dtype,
+        native["c"].dtype,
+    }
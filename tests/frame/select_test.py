@@ -10,3 +10,10 @@ def test_select(constructor_with_pyarrow: Any) -> None:
     result = df.select("a")
     expected = {"a": [1, 3, 2]}
     compare_dicts(result, expected)
+
+
+def test_select_reduction_of_empty_frame(constructor: Any) -> None:
+    data = {"a": [1, 3, 2], "b": [4, 4, 6]}
+    df = nw.from_native(constructor(data), eager_only=True)
+    result = df.filter(nw.col("a") > 5).select(nw.col("b").sum())
+    compare_dicts(result, {"b": [0]})
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.utils import parse_version
+
+data = {"g": ["x", "y", "x"], "a": [1, 2, 3]}
+
+
+@pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("2.0.0"), reason="too old for pyarrow"
+)
+def test_sink_parquet(constructor_with_lazy: Any, tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "foo.parquet")  # type: ignore[operator]
+    lf = nw.from_native(constructor_with_lazy(data)).lazy()
+    lf.filter(nw.col("a") > 1).sink_parquet(path, row_group_size=1)
+    assert pq.read_table(path)["a"].to_pylist() == [2, 3]
+    path = str(tmpdir / "dataset")  # type: ignore[operator]
+    lf.sink_parquet(path, partition_by="g", compression="snappy")
+    assert sorted(os.listdir(path)) == ["g=x", "g=y"]
+    path = str(tmpdir / "bar.parquet")  # type: ignore[operator]
+    lf.sink_parquet(path, use_dictionary=False)
+    assert pq.read_table(path).column_names == ["g", "a"]
@@ -204,6 +204,39 @@ def test_anti_join(
     compare_dicts(result, expected)
 
 
+@pytest.mark.parametrize(
+    "df_raw",
+    [df_polars, df_lazy, df_pandas, df_pandas_nullable, df_pandas_pyarrow],
+)
+@pytest.mark.parametrize(
+    ("join_key", "filter_expr", "expected"),
+    [
+        (["a", "b"], (nw.col("b") < 5), {"a": [1, 3], "b": [4, 4], "z": [7.0, 8.0]}),
+        (["b"], (nw.col("b") < 5), {"a": [1, 3], "b": [4, 4], "z": [7.0, 8.0]}),
+        (["b"], (nw.col("b") > 5), {"a": [2], "b": [6], "z": [9]}),
+    ],
+)
+def test_semi_join(
+    df_raw: Any, join_key: list[str], filter_expr: nw.Expr, expected: dict[str, list[Any]]
+) -> None:
+    df = nw.from_native(df_raw)
+    other = df.filter(filter_expr)
+    result = df.join(other, how="semi", left_on=join_key, right_on=join_key)  # type: ignore[arg-type]
+    compare_dicts(result, expected)
+
+
+def test_semi_anti_join_keys_only() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 2, 1, 3], "b": ["x", "y", "z", "x"]}))
+    other = nw.from_native(pd.DataFrame({"c": [1, 1, 3], "d": ["x", "x", "y"]}))
+    result = df.join(other, how="semi", left_on=["a", "b"], right_on=["c", "d"])
+    compare_dicts(result, {"a": [1], "b": ["x"]})
+    result = df.join(other, how="anti", left_on=["a", "b"], right_on=["c", "d"])
+    compare_dicts(result, {"a": [2, 1, 3], "b": ["y", "z", "x"]})
+    assert list(nw.to_native(result).index) == [0, 1, 2]
+    result = df.join(other, how="semi", left_on="a", right_on="c")
+    compare_dicts(result, {"a": [1, 1, 3], "b": ["x", "z", "x"]})
+
+
 @pytest.mark.parametrize(
     "df_raw", [df_pandas, df_lazy, df_pandas_nullable, df_pandas_pyarrow]
 )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.utils import parse_version
+
+data = {"a": [1, None, 3], "b": [4.5, 5.5, None], "c": [7, 8, 9]}
+
+
+@pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("1.0.0"),
+    reason="too old for nullable dtypes",
+)
+@pytest.mark.parametrize(
+    "df_raw",
+    [
+        pd.DataFrame(data).astype({"a": "Int64", "b": "Float64"}),
+        pa.Table.from_batches(
+            pa.table(data).to_batches(max_chunksize=2)  # several chunks
+        ),
+        pl.DataFrame(data),
+    ],
+)
+def test_to_numpy_with_nulls(df_raw: Any) -> None:
+    result = nw.from_native(df_raw, eager_only=True).to_numpy()
+    expected = np.array([[1, 4.5, 7], [np.nan, 5.5, 8], [3, np.nan, 9]])
+    np.testing.assert_array_equal(result, expected)
+    assert result.dtype == "float64"
+    assert result.flags.f_contiguous
+
+
+@pytest.mark.parametrize(
+    "df_raw",
+    [
+        pd.DataFrame({"a": [1, 2], "b": [True, False]}),
+        pa.table({"a": [1, 2], "b": [True, False]}),
+    ],
+)
+def test_to_numpy_without_nulls(df_raw: Any) -> None:
+    result = nw.from_native(df_raw, eager_only=True).to_numpy()
+    np.testing.assert_array_equal(result, np.array([[1, 1], [2, 0]]))
+
+
+def test_to_numpy_mixed_types() -> None:
+    dates = [datetime(2020, 1, 1), datetime(2020, 1, 2)]
+    df_pd = pd.DataFrame({"a": pd.array([1, None], dtype="Int64"), "b": dates})
+    result = nw.from_native(df_pd, eager_only=True).to_numpy()
+    assert result.dtype == object
+    assert np.isnan(result[1, 0])
+    assert result[:, 1].tolist() == [pd.Timestamp(date) for date in dates]
+    df_pa = pa.table({"a": [1, 2], "b": ["x", None], "c": dates, "d": [True, None]})
+    result = nw.from_native(df_pa, eager_only=True).to_numpy()
+    assert result.dtype == object
+    assert result.tolist() == [[1, "x", dates[0], True], [2, None, dates[1], None]]
+    assert nw.from_native(pa.table({}), eager_only=True).to_numpy().shape == (0, 0)
+
+
+@pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("2.0.0"),
+    reason="too old for pyarrow dtypes",
+)
+def test_to_numpy_mixed_types_pyarrow_dtypes() -> None:
+    dates = [datetime(2020, 1, 1), datetime(2020, 1, 2)]
+    df_pd = pd.DataFrame({"a": [1, None], "b": dates}).convert_dtypes(
+        dtype_backend="pyarrow"
+    )
+    result = nw.from_native(df_pd, eager_only=True).to_numpy()
+    assert result.dtype == object
+    assert np.isnan(result[1, 0])
+    assert result[:, 1].tolist() == [pd.Timestamp(date) for date in dates]
@@ -15,3 +15,12 @@ def test_with_columns(constructor: Any) -> None:
     result = nw.from_native(constructor(data)).with_columns(d=np.array([4, 5]))
     expected = {"a": ["foo", "bars"], "ab": ["foo", "bars"], "d": [4, 5]}
     compare_dicts(result, expected)
+
+
+def test_with_columns_broadcast(constructor_with_pyarrow: Any) -> None:
+    df = nw.from_native(constructor_with_pyarrow({"a": [1, 2, 3]}), eager_only=True)
+    result = df.with_columns(b=nw.col("a").sum())
+    compare_dicts(result, {"a": [1, 2, 3], "b": [6, 6, 6]})
+    # A single row doesn't need broadcasting.
+    result = df.head(1).with_columns(b=nw.col("a").sum())
+    compare_dicts(result, {"a": [1], "b": [1]})
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pyarrow import feather
+
+import narwhals.stable.v1 as nw
+from narwhals.utils import parse_version
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+pytestmark = pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("2.0.0"), reason="too old for pyarrow"
+)
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+def test_write_ipc(
+    constructor_with_pyarrow: Any, compression: str, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = str(tmpdir / "foo.arrow")  # type: ignore[operator]
+    df = nw.from_native(constructor_with_pyarrow(data), eager_only=True)
+    df.write_ipc(path, compression=compression)
+    compare_dicts(nw.from_native(feather.read_table(path)), data)
+    # Only uncompressed files can be read without copying them into memory.
+    allocated = pa.total_allocated_bytes()
+    table = feather.read_table(path, memory_map=True)
+    assert (pa.total_allocated_bytes() == allocated) == (compression == "uncompressed")
+    assert table.num_rows == 3
@@ -4,18 +4,82 @@ import os
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 import narwhals.stable.v1 as nw
 from narwhals.utils import parse_version
+from tests.utils import compare_dicts
 
 data = {"a": [1, 2, 3]}
+partitioned_data = {
+    "g": ["x", "y", "x", "x", "y"],
+    "a": [1, 2, 3, 4, 5],
+    "b": ["p", "p", "q", "q", "q"],
+}
 
-
-@pytest.mark.skipif(
+pytestmark = pytest.mark.skipif(
     parse_version(pd.__version__) < parse_version("2.0.0"), reason="too old for pyarrow"
 )
+
+
 def test_write_parquet(constructor: Any, tmpdir: pytest.TempdirFactory) -> None:
     path = str(tmpdir / "foo.parquet")  # type: ignore[operator]
     nw.from_native(constructor(data), eager_only=True).write_parquet(path)
     assert os.path.exists(path)
+
+
+def test_write_parquet_options(
+    constructor_with_pyarrow: Any, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = str(tmpdir / "foo.parquet")  # type: ignore[operator]
+    df = nw.from_native(constructor_with_pyarrow(partitioned_data), eager_only=True)
+    df.write_parquet(
+        path,
+        compression="gzip",
+        compression_level=9,
+        row_group_size=2,
+        use_dictionary=False,
+    )
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 3
+    column = metadata.row_group(0).column(0)
+    assert column.compression == "GZIP"
+    assert column.statistics.min == "x"
+    assert "RLE_DICTIONARY" not in column.encodings
+    df.write_parquet(path, compression="uncompressed", statistics=False)
+    column = pq.ParquetFile(path).metadata.row_group(0).column(0)
+    assert column.compression == "UNCOMPRESSED"
+    assert column.statistics is None
+
+
+def test_write_parquet_partitioned(
+    constructor_with_pyarrow: Any, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = str(tmpdir / "dataset")  # type: ignore[operator]
+    df = nw.from_native(constructor_with_pyarrow(partitioned_data), eager_only=True)
+    df.write_parquet(path, partition_by="g")
+    assert sorted(os.listdir(path)) == ["g=x", "g=y"]
+    (file,) = os.listdir(os.path.join(path, "g=x"))
+    # The partition column is in the directory names only.
+    table = pq.read_table(os.path.join(path, "g=x", file))
+    assert table.column_names == ["a", "b"]
+    assert sorted(table["a"].to_pylist()) == [1, 3, 4]
+    path = str(tmpdir / "nested")  # type: ignore[operator]
+    df.write_parquet(path, partition_by=["g", "b"], use_dictionary=False)
+    assert sorted(os.listdir(os.path.join(path, "g=y"))) == ["b=p", "b=q"]
+
+
+@pytest.mark.parametrize("backend", [pd, pa])
+def test_write_parquet_partitioned_scan(
+    backend: Any, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = str(tmpdir / "dataset")  # type: ignore[operator]
+    nw.from_native(pd.DataFrame(partitioned_data), eager_only=True).write_parquet(
+        path, partition_by="g"
+    )
+    lf = nw.scan_parquet(path, backend=backend)
+    assert sorted(lf.columns) == ["a", "b", "g"]
+    result = lf.filter(nw.col("g") == "x").select("a").sort("a").collect()
+    compare_dicts(result, {"a": [1, 3, 4]})
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.config import get_executor
+from narwhals.config import parallel_map
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 3], "b": [4.0, 5, 6]}
+
+
+@pytest.mark.parametrize("constructor", [pd.DataFrame, pa.table])
+def test_threads(constructor: Any) -> None:
+    df = nw.from_native(constructor(data), eager_only=True)
+    exprs = [(nw.col("a") * i + nw.col("b")).alias(f"c{i}") for i in range(50)]
+    expected = df.select(*exprs, d=nw.col("b") * 2)
+    with nw.Config(threads=4):
+        assert nw.Config.threads() == 4
+        result = df.select(*exprs, d=nw.col("b") * 2)
+        assert nw.to_native(result).equals(nw.to_native(expected))
+    assert nw.Config.threads() == 1
+
+
+def test_threads_nested() -> None:
+    # `over` evaluates expressions within the pool's threads, which mustn't
+    # wait on the pool themselves.
+    df = nw.from_native(pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]}))
+    with nw.Config(threads=2), pytest.warns(UserWarning, match="complex group-by"):
+        result = df.with_columns(
+            c=(nw.col("b") - nw.col("b").mean()).abs().max().over("a"),
+            d=nw.col("b").sum().over("a"),
+        )
+    compare_dicts(
+        result, {"a": [1, 1, 2], "b": [4, 5, 6], "c": [0.5, 0.5, 0.0], "d": [9, 9, 6]}
+    )
+
+
+def test_parallel_map() -> None:
+    thread_names = []
+
+    def function(item: int) -> int:
+        thread_names.append(threading.current_thread().name)
+        return item * 2
+
+    assert parallel_map(function, [1, 2, 3]) == [2, 4, 6]
+    assert all(name == threading.current_thread().name for name in thread_names)
+    nw.Config(threads=2)
+    try:
+        executor = get_executor()
+        assert executor is not None
+        assert get_executor() is executor
+        assert parallel_map(function, list(range(20))) == list(range(0, 40, 2))
+        assert any(name.startswith("narwhals") for name in thread_names)
+        # Expressions evaluated within the pool get evaluated serially.
+        assert executor.submit(get_executor).result() is None
+        nw.Config.set_threads(3)
+        assert get_executor() is not executor
+    finally:
+        nw.Config.set_threads(1)
+    assert get_executor() is None
+
+
+def test_set_threads_during_parallel_map() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    results: list[list[int]] = []
+
+    def function(item: int) -> int:
+        if item == 1:
+            # Keep one of the pool's threads busy, leaving the other free.
+            started.set()
+            release.wait(timeout=10)
+        return item * 2
+
+    nw.Config(threads=2)
+    try:
+        executor = get_executor()
+        assert executor is not None
+        thread = threading.Thread(
+            target=lambda: results.append(parallel_map(function, [1, 2, 3]))
+        )
+        thread.start()
+        started.wait(timeout=10)
+        # Other threads can use the same pool meanwhile.
+        assert parallel_map(abs, [-1, -2]) == [1, 2]
+        nw.Config.set_threads(3)
+        # The pool which is in use doesn't get shut down...
+        assert executor.submit(abs, -1).result() == 1
+        assert parallel_map(abs, [-1, -2]) == [1, 2]
+        release.set()
+        thread.join()
+        assert results == [[2, 4, 6]]
+        # ...until it's no longer used.
+        with pytest.raises(RuntimeError, match="after shutdown"):
+            executor.submit(abs, -1)
+    finally:
+        release.set()
+        nw.Config.set_threads(1)
+
+
+def test_invalid_threads() -> None:
+    with pytest.raises(ValueError, match="Expected a positive number of threads"):
+        nw.Config(threads=0)
+    with nw.Config():
+        assert nw.Config.threads() == 1
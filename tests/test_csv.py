@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._pandas_like.csv import CsvSource
+from tests.utils import compare_dicts
+
+data = {
+    "a": [1, 2, 3, 4, 5, 6, 7],
+    "b": ["x", "y", "x", "y", "x", "y", "x"],
+    "c": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5],
+}
+
+
+@pytest.fixture()
+def path(tmpdir: pytest.TempdirFactory) -> str:
+    path = str(tmpdir / "data.csv")  # type: ignore[operator]
+    pl.DataFrame(data).write_csv(path)
+    return path
+
+
+@pytest.mark.parametrize("backend", [pd, pa, pl])
+def test_scan_csv(path: str, backend: Any) -> None:
+    lf = nw.scan_csv(path, backend=backend, batch_size=2)
+    result = (
+        lf.filter(nw.col("a") > 2)
+        .with_columns(d=nw.col("c") * 2)
+        .select("b", "d")
+        .collect()
+    )
+    assert nw.get_native_namespace(result) is backend
+    compare_dicts(
+        result, {"b": ["x", "y", "x", "y", "x"], "d": [7.0, 9.0, 11.0, 13.0, 15.0]}
+    )
+    result = (
+        lf.filter(nw.col("a") > 2)
+        .group_by("b")
+        .agg(nw.col("a").sum(), nw.col("c").mean())
+        .sort("b")
+        .collect()
+    )
+    compare_dicts(result, {"b": ["x", "y"], "a": [15, 10], "c": [5.5, 5.5]})
+    compare_dicts(lf.head(3).select("a").collect(), {"a": [1, 2, 3]})
+
+
+def test_scan_csv_pandas_chunks(path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    read_csv = pd.read_csv
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        calls.append(kwargs)
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", spy)
+    lf = nw.scan_csv(path, backend=pd, batch_size=3).filter(nw.col("a") > 2)
+    result = lf.select("a").collect()
+    assert calls[-1] == {"usecols": ["a"], "chunksize": 3}
+    # The index is that of the rows in the file.
+    assert nw.to_native(result).index.tolist() == [2, 3, 4, 5, 6]
+    assert nw.scan_csv(path, backend=pd).select("c", "a").collect().columns == [
+        "c",
+        "a",
+    ]
+    # Columns get read in the order of the file, and then reordered.
+    assert calls[-1] == {"usecols": ["a", "c"], "chunksize": 2**17}
+    # Without anything to stream, the whole file gets read.
+    compare_dicts(nw.scan_csv(path, backend=pd).collect(), data)
+
+
+def test_scan_csv_pandas_streaming(path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    chunks = []
+    from_chunk = CsvSource._from_chunk
+
+    def spy(self: CsvSource, chunk: Any, columns: list[str] | None) -> Any:
+        chunks.append(len(chunk))
+        return from_chunk(self, chunk, columns)
+
+    monkeypatch.setattr(CsvSource, "_from_chunk", spy)
+    lf = nw.scan_csv(path, backend=pd, batch_size=2)
+    assert lf.columns == ["a", "b", "c"]
+    explained = lf.filter(nw.col("a") > 2).group_by("b").agg(nw.col("a").sum()).explain()
+    assert explained.splitlines()[2:4] == [
+        "  FILTER [(col('a') > 2)]",
+        "    strategy: streamed batch by batch",
+    ]
+    # `head` stops reading once it has enough rows.
+    compare_dicts(
+        lf.filter(nw.col("a") > 2).head(1).collect(), {k: [v[2]] for k, v in data.items()}
+    )
+    assert chunks == [2, 2]
+
+
+def test_scan_csv_arrow_batch_size(path: str) -> None:
+    result = nw.scan_csv(path, backend=pa, batch_size=3).select("a").collect()
+    assert [len(chunk) for chunk in nw.to_native(result)["a"].chunks] == [3, 3, 1]
+    assert "WHERE a > 2 (streaming)" in (
+        nw.scan_csv(path, backend=pa).filter(nw.col("a") > 2).explain()
+    )
+
+
+@pytest.mark.parametrize("backend", [pd, pa])
+def test_scan_csv_empty(backend: Any, tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "empty.csv")  # type: ignore[operator]
+    with open(path, "w") as file:
+        file.write("a,b\n")
+    result = nw.scan_csv(path, backend=backend).filter(nw.col("a") > 1).collect()
+    assert result.columns == ["a", "b"]
+    assert len(result) == 0
+
+
+def test_scan_csv_invalid_backend(path: str) -> None:
+    with pytest.raises(TypeError, match="Expected `backend`"):
+        nw.scan_csv(path, backend=pytest)  # type: ignore[arg-type]
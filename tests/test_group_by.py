@@ -4,6 +4,7 @@ from typing import Any
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 
 import narwhals.stable.v1 as nw
@@ -64,9 +65,12 @@ def test_group_by_iter(constructor: Any) -> None:
     assert sorted(keys) == sorted(expected_keys)
 
 
-def test_group_by_len(constructor: Any) -> None:
+def test_group_by_len(constructor_with_pyarrow: Any) -> None:
     result = (
-        nw.from_native(constructor(data)).group_by("a").agg(nw.col("b").len()).sort("a")
+        nw.from_native(constructor_with_pyarrow(data))
+        .group_by("a")
+        .agg(nw.col("b").len())
+        .sort("a")
     )
     expected = {"a": [1, 3], "b": [2, 1]}
     compare_dicts(result, expected)
@@ -79,3 +83,149 @@ def test_group_by_empty_result_pandas() -> None:
         df.filter(nw.col("a") < 0).group_by("a").agg(
             nw.col("b").sum().round(2).alias("c")
         )
+
+
+def test_group_by_pre_projection() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    result = (
+        df.group_by("a")
+        .agg(
+            (nw.col("b", "c") + 1).max(),
+            nw.len(),
+            bc=(nw.col("b") * nw.col("c")).sum(),
+            c_mean=nw.col("c").round(0).mean(),
+            b_len=nw.col("b").len(),
+            c_sum=nw.col("c").sum(),
+            c_sum_again=nw.col("c").sum(),
+        )
+        .sort("a")
+    )
+    expected = {
+        "a": [1, 3],
+        "b": [5, 7],
+        "c": [9.0, 10],
+        "len": [2, 1],
+        "bc": [60.0, 54],
+        "c_mean": [7.5, 9],
+        "b_len": [2, 1],
+        "c_sum": [15.0, 9],
+        "c_sum_again": [15.0, 9],
+    }
+    compare_dicts(result, expected)
+
+
+def test_group_by_filtered_aggregations() -> None:
+    df = nw.from_native(
+        pd.DataFrame({**data, "d": [True, False, False]}), eager_only=True
+    )
+    result = (
+        df.group_by("a")
+        .agg(
+            b_sum=nw.col("b").filter(nw.col("c") > 7).sum(),
+            c_mean=nw.col("c").filter(nw.col("c") > 7).mean(),
+            n=nw.col("b").filter(nw.col("c") < 9).len(),
+            any_d=nw.col("d").filter(nw.col("c") > 7).any(),
+            all_d=nw.col("d").filter(nw.col("c") < 8).all(),
+        )
+        .sort("a")
+    )
+    expected = {
+        "a": [1, 3],
+        "b_sum": [4, 6],
+        "c_mean": [8.0, 9],
+        "n": [2, 0],
+        "any_d": [False, False],
+        "all_d": [True, True],
+    }
+    compare_dicts(result, expected)
+    assert nw.to_native(result)["b_sum"].dtype == "int64"
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.col("b").filter(nw.col("c") > 0).max(),
+        nw.col("b").filter(nw.col("c") > nw.col("c").mean()).sum(),
+        nw.col("b").filter(nw.col("c").is_first_distinct()).sum(),
+        nw.col("b").cum_sum().sum(),
+        (nw.col("b") - nw.col("c").mean()).mean(),
+        nw.col("b").n_unique(),
+        nw.col("b").std(ddof=0),
+    ],
+)
+def test_group_by_not_pre_projected(expr: nw.Expr) -> None:
+    df = nw.from_native(
+        pd.DataFrame({"a": [1, 1, 3, 3], "b": [4, 4, 6, 7], "c": [7.0, 8, 9, 10]}),
+        eager_only=True,
+    )
+    with pytest.warns(UserWarning, match="complex group-by"):
+        result = df.group_by("a").agg(expr.alias("x")).sort("a")
+    expected = (
+        df.filter(nw.col("a") == 1).select(expr.alias("x"))["x"][0],
+        df.filter(nw.col("a") == 3).select(expr.alias("x"))["x"][0],
+    )
+    compare_dicts(result, {"a": [1, 3], "x": list(expected)})
+
+
+def test_group_by_pyarrow() -> None:
+    df = nw.from_native(
+        pa.table({**data, "d": [True, False, None], "e": [1, None, None]}),
+        eager_only=True,
+    )
+    result = (
+        df.group_by("a", "b")
+        .agg(
+            nw.col("c", "e").sum(),
+            nw.len(),
+            c_mean=nw.col("c").mean(),
+            c_min=nw.col("c").min(),
+            c_max=nw.col("c").max(),
+            c_std=nw.col("c").std(),
+            c_std0=nw.col("c").std(ddof=0),
+            e_len=nw.col("e").len(),
+            e_n_unique=nw.col("e").n_unique(),
+            d_any=nw.col("d").any(),
+            d_all=nw.col("d").all(),
+            bc=(nw.col("b") * nw.col("c")).sum(),
+            bc_max=(nw.col("b") * nw.col("c") - 1).max(),
+        )
+        .sort("a")
+    )
+    expected = {
+        "a": [1, 3],
+        "b": [4, 6],
+        "c": [15.0, 9],
+        "e": [1, 0],
+        "len": [2, 1],
+        "c_mean": [7.5, 9],
+        "c_min": [7.0, 9],
+        "c_max": [8.0, 9],
+        "c_std": [0.707107, None],
+        "c_std0": [0.5, 0],
+        "e_len": [2, 1],
+        "e_n_unique": [2, 1],
+        "d_any": [True, False],
+        "d_all": [False, True],
+        "bc": [60.0, 54],
+        "bc_max": [31.0, 53],
+    }
+    compare_dicts(result, expected)
+    result = df.lazy().group_by("a").agg(nw.col("b").sum()).sort("a").collect()
+    compare_dicts(result, {"a": [1, 3], "b": [8, 6]})
+
+
+def test_group_by_pyarrow_key_named_like_aggregation() -> None:
+    # PyArrow names the sum of "b" "b_sum".
+    df = nw.from_native(pa.table({"b_sum": [1, 1, 2], "b": [4, 5, 6]}), eager_only=True)
+    result = df.group_by("b_sum").agg(nw.col("b").sum()).sort("b_sum")
+    compare_dicts(result, {"b_sum": [1, 2], "b": [9, 6]})
+    result = df.lazy().group_by("b_sum").agg(nw.col("b").sum()).sort("b_sum")
+    compare_dicts(result.collect(), {"b_sum": [1, 2], "b": [9, 6]})
+
+
+def test_group_by_pyarrow_unsupported() -> None:
+    df = nw.from_native(pa.table(data), eager_only=True)
+    with pytest.raises(ValueError, match="Unsupported aggregation"):
+        df.group_by("a").agg(nw.col("b").cum_sum().sum())
+    with pytest.raises(ValueError, match="Anonymous expressions"):
+        df.group_by("a").agg(nw.all().sum())
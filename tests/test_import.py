@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import narwhals as nw
+import narwhals.stable.v1 as nw_v1
+
+
+def imported_modules(statement: str) -> set[str]:
+    code = (
+        f"import sys; {statement}; "
+        "print(' '.join(m for m in sys.modules if m.startswith('narwhals')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy() -> None:
+    assert imported_modules("import narwhals") == {"narwhals"}
+    assert imported_modules("import narwhals.stable") == {"narwhals", "narwhals.stable"}
+    modules = imported_modules("import narwhals.stable.v1")
+    assert "narwhals.selectors" not in modules
+    assert "narwhals.functions" not in modules
+    modules = imported_modules("import narwhals as nw; nw.col")
+    assert "narwhals.expression" in modules
+    assert "narwhals.dataframe" not in modules
+
+
+def test_submodules_in_fresh_interpreter() -> None:
+    code = (
+        "import narwhals as nw; "
+        "print(nw.dtypes.Int64 is nw.Int64, nw.typing.__name__, nw.utils.__name__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["True", "narwhals.typing", "narwhals.utils"]
+
+
+def test_lazy_attributes() -> None:
+    assert nw.col is nw.expression.col
+    assert nw.selectors.numeric is nw_v1.selectors.numeric
+    assert nw_v1.concat is nw.concat
+    assert nw.stable.v1 is nw_v1
+    # Submodules usually get set as attributes when imported, but they may
+    # also be accessed before that.
+    assert nw.__getattr__("stable") is nw.stable
+    assert nw.stable.__getattr__("v1") is nw_v1
+    assert {"col", "DataFrame", "stable", "__version__"} <= set(dir(nw))
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        nw.foo  # noqa: B018
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        nw.stable.foo  # noqa: B018
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        nw_v1.foo  # noqa: B018
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+
+@pytest.fixture()
+def path(tmpdir: pytest.TempdirFactory) -> str:
+    path = str(tmpdir / "data.arrow")  # type: ignore[operator]
+    nw.from_native(pa.table(data), eager_only=True).write_ipc(path)
+    return path
+
+
+@pytest.mark.parametrize("backend", [pd, pa, pl])
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_read_ipc(path: str, backend: Any, *, memory_map: bool) -> None:
+    result = nw.read_ipc(path, backend=backend, memory_map=memory_map)
+    assert isinstance(result, nw.DataFrame)
+    assert nw.get_native_namespace(result) is backend
+    compare_dicts(result, data)
+
+
+@pytest.mark.parametrize("backend", [pd, pa])
+def test_read_ipc_zero_copy(path: str, backend: Any) -> None:
+    allocated = pa.total_allocated_bytes()
+    result = nw.read_ipc(path, backend=backend)
+    # The data stays in the memory-mapped file.
+    assert pa.total_allocated_bytes() == allocated
+    if backend is pd:
+        assert isinstance(nw.to_native(result)["a"].dtype, pd.ArrowDtype)
+    copied = nw.read_ipc(path, backend=backend, memory_map=False)
+    assert pa.total_allocated_bytes() > allocated
+    assert copied.shape == result.shape
+
+
+def test_read_ipc_invalid_backend(path: str) -> None:
+    with pytest.raises(TypeError, match="Expected `backend`"):
+        nw.read_ipc(path, backend=pytest)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match="Expected `backend`"):
+        nw.read_ipc(path, backend=pytest, memory_map=False)  # type: ignore[arg-type]
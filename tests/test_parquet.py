@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._lazy.optimize import optimize
+from narwhals._lazy.plan import Filter
+from tests.utils import compare_dicts
+
+lineitem = "tests/data/lineitem.parquet"
+
+
+def scan(lf: Any) -> Any:
+    """The scan at the bottom of the optimized plan of `lf`."""
+    node = optimize(lf._dataframe._plan)
+    while node.inputs:
+        node = node.input
+    return node
+
+
+def filters(lf: Any, predicate: Any) -> Any:
+    """The filters which `predicate` gets pushed into the scan of `lf` as."""
+    return scan(lf.filter(predicate)).filters
+
+
+@pytest.mark.parametrize("backend", [pd, pa, pl])
+def test_scan_parquet(backend: Any) -> None:
+    result = (
+        nw.scan_parquet(lineitem, backend=backend)
+        .filter(
+            nw.col("l_quantity") > 30,
+            nw.col("l_shipdate") >= date(1998, 1, 1),
+            nw.col("l_returnflag") == "N",
+        )
+        .select("l_orderkey", "l_quantity")
+        .collect()
+    )
+    native = nw.to_native(result)
+    assert isinstance(
+        native, type(nw.to_native(nw.read_parquet(lineitem, backend=backend)))
+    )
+    expected = (
+        pl.read_parquet(lineitem)
+        .filter(
+            pl.col("l_quantity") > 30,
+            pl.col("l_shipdate") >= date(1998, 1, 1),
+            pl.col("l_returnflag") == "N",
+        )
+        .select("l_orderkey", "l_quantity")
+    )
+    compare_dicts(result, expected.to_dict(as_series=False))
+
+
+@pytest.mark.parametrize("backend", [pd, pa, pl])
+def test_read_parquet(backend: Any) -> None:
+    result = nw.read_parquet(lineitem, backend=backend)
+    assert isinstance(result, nw.DataFrame)
+    assert result.shape == (300, 16)
+
+
+def test_scan_parquet_pandas_pushdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    read_parquet = pd.read_parquet
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        calls.append(kwargs)
+        return read_parquet(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_parquet", spy)
+    lf = nw.scan_parquet(lineitem, backend=pd)
+    assert lf.columns[:2] == ["l_orderkey", "l_partkey"]
+    result = (
+        lf.filter(nw.col("l_quantity").is_between(10, 20, closed="left"))
+        .filter(nw.col("l_returnflag").is_in(["A", "R"]), nw.col("l_tax") > 0.05)
+        .select("l_orderkey")
+        .collect()
+    )
+    assert calls == [
+        {
+            "columns": ["l_orderkey"],
+            "filters": [
+                ("l_quantity", ">=", 10),
+                ("l_quantity", "<", 20),
+                ("l_returnflag", "in", ["A", "R"]),
+                ("l_tax", ">", 0.05),
+            ],
+        }
+    ]
+    expected = pl.read_parquet(lineitem).filter(
+        pl.col("l_quantity").is_between(10, 20, closed="left"),
+        pl.col("l_returnflag").is_in(["A", "R"]),
+        pl.col("l_tax") > 0.05,
+    )
+    assert len(result) == len(expected)
+    assert scan(lf.select("l_tax")).output_names() == ["l_tax"]
+    assert (
+        "WHERE l_quantity >= 10 & l_quantity < 20"
+        in lf.filter(nw.col("l_quantity").is_between(10, 20, closed="left")).explain()
+    )
+
+
+def test_scan_parquet_arrow_pushdown() -> None:
+    lf = nw.scan_parquet(lineitem, backend=pa)
+    node = scan(lf.filter(nw.col("l_quantity") > 30).select("l_orderkey"))
+    assert node.columns == ["l_orderkey"]
+    assert node.filters == [("l_quantity", ">", 30)]
+    # Readers can't filter rows as they read them.
+    reader = ds.dataset(lineitem).to_table().to_reader()
+    plan = optimize(
+        nw.from_native(reader).filter(nw.col("l_quantity") > 30)._dataframe._plan
+    )
+    assert isinstance(plan, Filter)
+
+
+@pytest.mark.parametrize("closed", ["both", "left", "right", "none"])
+def test_scan_parquet_is_between(closed: str) -> None:
+    lf = nw.scan_parquet(lineitem, backend=pd)
+    result = lf.filter(nw.col("l_quantity").is_between(10, 20, closed=closed))
+    expected = pl.read_parquet(lineitem).filter(
+        pl.col("l_quantity").is_between(10, 20, closed=closed)  # type: ignore[arg-type]
+    )
+    assert len(result.collect()) == len(expected)
+
+
+def test_parquet_filters() -> None:
+    lf = nw.scan_parquet(lineitem, backend=pd)
+    assert filters(lf, nw.lit(30) < nw.col("l_quantity")) == [("l_quantity", ">", 30)]
+    assert filters(lf, nw.col("l_quantity") <= nw.lit(30)) == [("l_quantity", "<=", 30)]
+    assert filters(lf, (nw.col("l_tax") == 0.0) & (nw.col("l_shipmode") == "AIR")) == [
+        ("l_tax", "==", 0.0),
+        ("l_shipmode", "==", "AIR"),
+    ]
+    assert filters(lf, nw.col("l_shipdate").is_in([date(1998, 1, 1)])) == [
+        ("l_shipdate", "in", [date(1998, 1, 1)])
+    ]
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        # Not comparisons of a column with a literal.
+        nw.col("l_quantity") > nw.col("l_tax"),
+        nw.col("l_quantity") * 2 > 30,
+        nw.col("l_quantity", "l_tax") > 30,
+        (nw.col("l_quantity") > 30) | (nw.col("l_tax") > 0),
+        (nw.col("l_quantity") > 30) & (nw.col("l_tax") > nw.col("l_discount")),
+        (nw.col("l_quantity") > nw.col("l_tax")) & (nw.col("l_quantity") > 30),
+        ~nw.col("l_comment").is_null(),
+        nw.col("l_quantity") > nw.lit(30, nw.Int64),
+        nw.col("l_linenumber").is_in(range(1, 3)),
+        nw.col("l_quantity").is_between(nw.col("l_tax"), 30),
+        # Values which aren't of the same kind as the column.
+        nw.col("l_quantity") > "30",
+        nw.col("l_shipmode") == 1,
+        nw.col("l_shipdate") >= datetime(1998, 1, 1),
+        nw.col("l_orderkey") == True,  # noqa: E712
+        nw.col("l_comment") == None,  # noqa: E711
+        nw.col("l_shipmode").is_in(["AIR", 1]),
+        # Non-boolean columns on their own.
+        nw.col("l_quantity"),
+        # Missing values are unequal to everything in pandas.
+        nw.col("l_quantity") != 30,
+    ],
+)
+def test_parquet_filters_not_pushed(predicate: Any) -> None:
+    lf = nw.scan_parquet(lineitem, backend=pd)
+    assert filters(lf, predicate) == []
+
+
+def test_parquet_filters_types(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "data.parquet")  # type: ignore[operator]
+    data = {
+        "a": [True, False, None],
+        "b": [datetime(2020, 1, 1), datetime(2021, 1, 1), None],
+        "c": [1.0, None, 3.0],
+    }
+    pa.parquet.write_table(pa.table(data), path)
+    lf = nw.scan_parquet(path, backend=pa)
+    assert filters(lf, nw.col("a")) == [("a", "==", True)]
+    assert filters(lf, nw.col("b") > datetime(2020, 6, 1)) == [
+        ("b", ">", datetime(2020, 6, 1))
+    ]
+    assert filters(lf, nw.col("c") != 1.0) == [("c", "!=", 1.0)]
+    assert filters(
+        nw.scan_parquet(path, backend=pd), nw.col("a") == nw.lit(value=True)
+    ) == [("a", "==", True)]
+    assert filters(lf, nw.col("d") > 1) == []
+    result = lf.filter(nw.col("a"), nw.col("c") != 1.0).collect()
+    assert len(result) == 0
+    # Missing values are kept, as in pandas they're unequal to everything.
+    result = nw.scan_parquet(path, backend=pd).filter(nw.col("c") != 1.0).collect()
+    assert nw.to_native(result)["c"].isna().tolist() == [True, False]
+
+
+def test_scan_parquet_pandas_index(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "data.parquet")  # type: ignore[operator]
+    pd.DataFrame({"i": [5, 6, 7], "a": [1, 2, 3]}).set_index("i").to_parquet(path)
+    lf = nw.scan_parquet(path, backend=pd)
+    assert lf.columns == ["a"]
+    native = nw.to_native(lf.filter(nw.col("a") > 1).collect())
+    assert native.index.tolist() == [6, 7]
+
+
+def test_scan_parquet_invalid_backend() -> None:
+    with pytest.raises(TypeError, match="Expected `backend`"):
+        nw.scan_parquet(lineitem, backend=pytest)  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match="Expected `backend`"):
+        nw.read_parquet(lineitem, backend=pytest)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("statistics", [True, False])
+def test_scan_parquet_pandas_dtypes(
+    tmpdir: pytest.TempdirFactory, *, statistics: bool
+) -> None:
+    path = str(tmpdir / "data.parquet")  # type: ignore[operator]
+    table = pa.table(
+        {"a": [1, None, 3, 4], "k": [True, None, False, True], "i": [1, 2, 3, 4]}
+    )
+    pa.parquet.write_table(table, path, write_statistics=statistics)
+    lf = nw.scan_parquet(path, backend=pd)
+    # The rows with missing values get filtered out as they're read, but the
+    # dtypes are still those of the whole file.
+    result = nw.to_native(lf.filter(nw.col("a") > 2).collect())
+    expected = pd.read_parquet(path)
+    assert result.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert result["a"].tolist() == [3.0, 4.0]
+    assert result["k"].tolist() == [False, True]
+    result = nw.to_native(lf.filter(nw.col("i") > 10).collect())
+    assert result.dtypes.to_dict() == expected.dtypes.to_dict()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._pandas_like import partition
+from narwhals._pandas_like.partition import n_partitions
+from narwhals._pandas_like.partition import split
+
+data = {
+    "g": ["x", "y", "x", "z", "y", "x", "z", "x", "y", "x"],
+    "a": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    "b": [1.0, None, 3.0, 4.0, None, 6.0, 7.0, None, 9.0, 10.0],
+    "c": [True, False, True, True, False, False, True, True, True, False],
+}
+
+
+@pytest.fixture()
+def df() -> Any:
+    # A non-default index, which partitioning has to preserve.
+    native = pd.DataFrame(data, index=range(100, 110))
+    return nw.from_native(native, eager_only=True)
+
+
+@pytest.fixture(autouse=True)
+def _small_partitions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(partition, "MIN_ROWS_PER_PARTITION", 2)
+
+
+def assert_partitioned_equal(
+    df: Any, function: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = nw.to_native(function(df))
+    n_splits = 0
+
+    def counting_split(*args: Any) -> Any:
+        nonlocal n_splits
+        n_splits += 1
+        return split(*args)
+
+    monkeypatch.setattr(partition, "split", counting_split)
+    for threads in (1, 3):
+        with nw.Config(partitions=3, threads=threads):
+            result = nw.to_native(function(df))
+        pd.testing.assert_frame_equal(result, expected)
+    assert n_splits == 2
+
+
+def test_split(df: Any) -> None:
+    partitions = split(df._dataframe, 3)
+    assert [len(p._native_dataframe) for p in partitions] == [3, 3, 4]
+    assert n_partitions(df._dataframe) == 1
+    with nw.Config(partitions=20):
+        # Partitions have at least `MIN_ROWS_PER_PARTITION` rows.
+        assert n_partitions(df._dataframe) == 5
+    df._dataframe._implementation = "modin"
+    with nw.Config(partitions=2):
+        assert n_partitions(df._dataframe) == 1
+
+
+def test_partitioned_row_operations(df: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert_partitioned_equal(
+        df, lambda df: df.filter(nw.col("a") > 3, nw.col("c")), monkeypatch
+    )
+    assert_partitioned_equal(
+        df,
+        lambda df: df.with_columns(
+            (nw.col("a") * 2).alias("d"), e=nw.col("b").fill_null(0), f=nw.lit(1)
+        ),
+        monkeypatch,
+    )
+    assert_partitioned_equal(
+        df, lambda df: df.select("g", d=nw.col("a") + nw.col("b")), monkeypatch
+    )
+
+
+def test_not_row_local(df: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_args: Any) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(partition, "split", fail)
+    with nw.Config(partitions=3):
+        # These depend on other rows, so they can't be computed per partition.
+        df.with_columns(d=nw.col("a").cum_sum())
+        df.filter(nw.col("a") > nw.col("a").mean())
+        df.select(nw.lit(1))
+        df.select()
+        df.group_by("g").agg(nw.col("a").std())
+        df.group_by("g").agg(nw.col("a").filter(nw.col("c")).sum())
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.col("g").cast(nw.Categorical),
+        (nw.col("a") + 1).cast(nw.String).cast(nw.Categorical()),
+        nw.col("d").str.to_datetime(format=None),  # type: ignore[arg-type]
+    ],
+)
+def test_inferred_dtypes(df: Any, expr: Any) -> None:
+    # Each partition would infer its own dtype, e.g. its own categories.
+    df = df.with_columns(d=nw.col("a").cast(nw.String) + "-01-2020")
+    expected = nw.to_native(df.with_columns(e=expr))
+    with nw.Config(partitions=3):
+        result = nw.to_native(df.with_columns(e=expr))
+    assert result.dtypes.equals(expected.dtypes)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_partitioned_group_by(df: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert_partitioned_equal(
+        df,
+        lambda df: df.group_by("g").agg(
+            nw.col("a", "b").sum(),
+            nw.col("b").mean().alias("b_mean"),
+            (nw.col("a") * 2).min().alias("a_min"),
+            nw.col("b").max().alias("b_max"),
+            nw.col("c").any().alias("c_any"),
+            nw.col("c").all().alias("c_all"),
+            nw.col("b").len().alias("b_len"),
+            nw.len(),
+        ),
+        monkeypatch,
+    )
+    assert_partitioned_equal(
+        df, lambda df: df.group_by("g", "c").agg(nw.col("a").mean()), monkeypatch
+    )
+
+
+def test_invalid_partitions() -> None:
+    with pytest.raises(ValueError, match="Expected a positive number of partitions"):
+        nw.Config(partitions=0)
+    assert nw.Config.partitions() == 1
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.profiling import _format_bytes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+data = {"a": [1, 2, 3], "b": [4, 5, 6]}
+
+
+def test_profile_eager() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    with nw.profile() as p:
+        df.filter(nw.col("a") > 1).select(nw.col("b") * 2)
+    assert [(e.name, e.category, e.depth) for e in p.events] == [
+        ("filter", "operation", 0),
+        ("expr __gt__", "expression", 1),
+        ("expr col", "expression", 2),
+        ("select", "operation", 0),
+        ("expr __mul__", "expression", 1),
+        ("expr col", "expression", 2),
+    ]
+    assert [(e.rows_in, e.rows_out) for e in p.events] == [
+        (3, 2),
+        (3, 3),
+        (3, 3),
+        (2, 2),
+        (2, 2),
+        (2, 2),
+    ]
+    assert all(e.bytes_retained is not None for e in p.events)
+    assert all(e.duration > 0 for e in p.events)
+    assert repr(p.events[0]).startswith("ProfileEvent('filter', duration=")
+    # Nested events happen within their parent.
+    filter_event, gt_event = p.events[:2]
+    assert filter_event.start <= gt_event.start
+    assert (
+        gt_event.start + gt_event.duration <= filter_event.start + filter_event.duration
+    )
+
+    lines = str(p).splitlines()
+    assert lines[0].split() == [
+        "operation",
+        "time",
+        "(ms)",
+        "rows",
+        "in",
+        "rows",
+        "out",
+        "retained",
+    ]
+    assert lines[2].startswith("  expr __gt__")
+    assert lines[3].startswith("    expr col")
+    assert len(lines) == 7
+
+
+def test_profile_operations() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    other = nw.from_native(pd.DataFrame({"a": [1, 2], "c": [0, 1]}), eager_only=True)
+    table = nw.from_native(pa.table(data), eager_only=True)
+    with nw.profile(memory=False) as p:
+        df.join(other, left_on="a", right_on="a").sort("b")
+        df.with_columns(c=nw.col("a") + 1).group_by("a").agg(nw.col("b").sum())
+        table.with_columns(c=nw.col("a") + 1).select("a", "b").sort("a")
+        table.group_by("a").agg(nw.col("b").sum())
+        df.select(nw.selectors.string())
+    assert [e.name for e in p.events if e.category == "operation"] == [
+        "join",
+        "sort",
+        "with_columns",
+        "group_by.agg",
+        "with_columns",
+        "select",
+        "sort",
+        "group_by.agg",
+        "select",
+    ]
+    assert p.events[0].rows_in == 3
+    assert p.events[0].rows_out == 2
+    assert all(e.bytes_retained is None for e in p.events)
+    # Selecting no columns at all.
+    assert p.events[-1].name == "expr selector"
+    assert p.events[-1].rows_out is None
+
+
+def test_profile_lazy() -> None:
+    df = nw.from_native(pd.DataFrame(data)).lazy()
+    result = df.filter(nw.col("a") > 1).select("b")
+    with nw.profile() as p:
+        result.collect()
+    collect, *rest = p.events
+    assert collect.name == "collect"
+    assert collect.rows_in is None
+    assert collect.rows_out == 2
+    assert [e.name for e in rest if e.depth == 1] == ["filter", "select"]
+
+
+def test_profile_tracemalloc() -> None:
+    with nw.profile():
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+    with nw.profile(memory=False):
+        assert not tracemalloc.is_tracing()
+    tracemalloc.start()
+    try:
+        with nw.profile():
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_profile_bytes_retained() -> None:
+    with nw.profile() as p:
+        with p._record("temporary", "operation"):
+            temporary = bytearray(10**7)
+            del temporary
+        with p._record("kept", "operation"):
+            kept = bytearray(10**7)
+    temporary_event, kept_event = p.events
+    # Memory which got freed again doesn't count, only what's still in use.
+    assert temporary_event.bytes_retained is not None
+    assert temporary_event.bytes_retained < 10**6
+    assert kept_event.bytes_retained is not None
+    assert kept_event.bytes_retained >= len(kept)
+
+
+def test_profile_nested() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    with nw.profile(memory=False) as outer:
+        df.select("a")
+        with nw.profile(memory=False) as inner:
+            df.select("b")
+        df.select("a", "b")
+    df.select("a")
+    assert [e.rows_out for e in outer.events if e.name == "select"] == [3, 3]
+    assert [e.name for e in inner.events] == ["select", "expr col"]
+
+
+def test_chrome_trace(tmp_path: Path) -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    with nw.profile() as p:
+        df.select(nw.col("a") * 2)
+    path = tmp_path / "trace.json"
+    p.write_chrome_trace(path)
+    trace = json.loads(path.read_text())
+    assert trace == p.to_chrome_trace()
+    select, mul, col = trace["traceEvents"]
+    assert select["name"] == "select"
+    assert select["cat"] == "operation"
+    assert select["ph"] == "X"
+    assert select["ts"] <= mul["ts"]
+    assert mul["dur"] <= select["dur"]
+    assert col["args"]["rows_out"] == 3
+    assert col["args"]["bytes_retained"] is not None
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        (None, ""),
+        (100, "100 B"),
+        (-100, "-100 B"),
+        (2048, "2.0 KB"),
+        (3 * 1024**2, "3.0 MB"),
+        (5 * 1024**3, "5.0 GB"),
+    ],
+)
+def test_format_bytes(size: int | None, expected: str) -> None:
+    assert _format_bytes(size) == expected
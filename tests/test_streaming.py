@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+from typing import Iterator
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._arrow.batches import ArrowBatchSource
+from narwhals._lazy.optimize import optimize
+from narwhals._lazy.plan import Concat
+from narwhals._lazy.stream import stream_frames
+from narwhals._lazy.stream import streamed_subplans
+
+data = {
+    "g": ["x", "y", "x", "z", "y", "x", "z", "x", "y", "x"],
+    "a": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    "b": [1.0, None, 3.0, 4.0, None, 6.0, 7.0, None, 9.0, 10.0],
+    "c": [True, False, True, True, False, False, True, True, True, False],
+}
+table = pa.table(data)
+
+
+class CountingReader:
+    """Batches of 3 rows, keeping track of how many have been read."""
+
+    def __init__(self, source: pa.Table = table) -> None:
+        self.source = source
+        self.batches_read = 0
+
+    def __iter__(self) -> Iterator[pa.RecordBatch]:
+        for batch in self.source.to_batches(max_chunksize=3):
+            self.batches_read += 1
+            yield batch
+
+    def reader(self) -> pa.RecordBatchReader:
+        return pa.RecordBatchReader.from_batches(self.source.schema, iter(self))
+
+
+@pytest.fixture(autouse=True)
+def _no_materialising(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_args: Any) -> None:
+        raise AssertionError
+
+    # Streamed plans never read the whole source into a single table.
+    monkeypatch.setattr(ArrowBatchSource, "read", fail)
+
+
+def assert_streamed_equal(function: Any) -> None:
+    expected = nw.to_native(function(nw.from_native(table).lazy()).collect())
+    counting = CountingReader()
+    for source in (counting.reader(), ds.dataset(table)):
+        result = nw.to_native(function(nw.from_native(source)).collect())
+        assert result.equals(expected)
+    assert counting.batches_read == 4
+
+
+def test_stream_row_operations() -> None:
+    assert_streamed_equal(lambda df: df.filter(nw.col("a") > 3, nw.col("c")))
+    assert_streamed_equal(
+        lambda df: df.with_columns(d=nw.col("a") * 2)
+        .drop_nulls()
+        .select("g", "d", e=nw.col("b") + nw.col("a"))
+        .drop("g")
+    )
+
+
+def test_stream_group_by() -> None:
+    def sort_by_keys(df: Any) -> Any:
+        native = nw.to_native(df.collect())
+        return native.sort_by([(name, "ascending") for name in ["g", "c"]])
+
+    def aggregate(df: Any) -> Any:
+        return df.group_by("g", "c").agg(
+            nw.col("a", "b").sum(),
+            nw.col("b").mean().alias("b_mean"),
+            (nw.col("a") * 2).min().alias("a_min"),
+            nw.col("b").max().alias("b_max"),
+            nw.col("c").any().alias("c_any"),
+            nw.col("c").all().alias("c_all"),
+            nw.col("b").len().alias("b_len"),
+            nw.len(),
+        )
+
+    expected = sort_by_keys(aggregate(nw.from_native(table).lazy()))
+    assert sort_by_keys(aggregate(nw.from_native(CountingReader().reader()))).equals(
+        expected
+    )
+    # Groups with no values have a null mean, just like without streaming.
+    result = sort_by_keys(
+        nw.from_native(ds.dataset(table))
+        .filter(nw.col("g") == "y")
+        .group_by("g", "c")
+        .agg(nw.col("b").mean())
+    )
+    assert result["b"].to_pylist() == [None, 9.0]
+
+
+def test_stream_head() -> None:
+    counting = CountingReader()
+    result = nw.from_native(counting.reader()).filter(nw.col("a") > 1).head(4)
+    assert nw.to_native(result.collect())["a"].to_pylist() == [2, 3, 4, 5]
+    # The rest of the source doesn't need to be read.
+    assert counting.batches_read == 2
+    result = nw.from_native(ds.dataset(table)).head(20)
+    assert nw.to_native(result.collect()).equals(table)
+
+
+def test_stream_empty_source() -> None:
+    empty = table.slice(0, 0)
+    result = nw.from_native(CountingReader(empty).reader()).filter(nw.col("a") > 1)
+    assert nw.to_native(result.collect()).equals(empty)
+    result = (
+        nw.from_native(CountingReader(empty).reader())
+        .filter(nw.col("a") > 1)
+        .group_by("g")
+        .agg(nw.col("b").mean())
+    )
+    native = nw.to_native(result.collect())
+    assert native.num_rows == 0
+    assert native.schema == pa.schema([("g", pa.string()), ("b", pa.float64())])
+
+
+def test_stream_scanner() -> None:
+    scanner = ds.dataset(table).scanner(columns=["a", "b"])
+    df = nw.from_native(scanner)
+    assert df.columns == ["a", "b"]
+    result = df.filter(nw.col("a") > 8).select("a")
+    assert nw.to_native(result.collect())["a"].to_pylist() == [9, 10]
+    # Only the columns which are needed get read.
+    scan = optimize(result._dataframe._plan).input.input
+    assert scan.output_names() == ["a"]
+    assert scan.project({"a", "b"}) is scan
+    assert optimize(df.select("b", "a")._dataframe._plan).input.output_names() == [
+        "a",
+        "b",
+    ]
+
+
+def test_not_streamed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.undo()
+    dataset = ds.dataset(table)
+    # Only the filter gets streamed, and the sort runs on its result.
+    result = nw.from_native(dataset).filter(nw.col("a") > 7).sort("a", descending=True)
+    assert nw.to_native(result.collect())["a"].to_pylist() == [10, 9, 8]
+    # These depend on other rows, so the source gets read into a single table.
+    result = nw.from_native(dataset).with_columns(d=nw.col("a").cum_sum())
+    assert nw.to_native(result.collect())["d"].to_pylist()[-1] == 55
+    result = nw.from_native(dataset).group_by("g").agg(nw.col("a").std())
+    assert nw.to_native(result.collect()).num_rows == 3
+    assert nw.to_native(nw.from_native(dataset).collect()).equals(table)
+
+
+def test_shared_subplans_not_streamed() -> None:
+    df = nw.from_native(ds.dataset(table)).filter(nw.col("a") > 1)
+    plan = df._dataframe._plan
+    assert list(streamed_subplans(plan)) == [id(plan)]
+    # Shared nodes only get computed once.
+    assert streamed_subplans(Concat([plan, plan], how="vertical")) == {}
+
+
+def test_stream_reader_without_pyarrow_dataset(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Reading a RecordBatchReader doesn't need `pyarrow.dataset` to be imported.
+    monkeypatch.delitem(sys.modules, "pyarrow.dataset")
+    df = nw.from_native(CountingReader().reader())
+    result = nw.to_native(df.filter(nw.col("a") > 8).select("a").collect())
+    assert result.equals(pa.table({"a": [9, 10]}))
+
+
+def test_reader_read_once() -> None:
+    df = nw.from_native(CountingReader().reader())
+    df.filter(nw.col("a") > 1).collect()
+    with pytest.raises(ValueError, match="RecordBatchReader can only be read once"):
+        df.select("a").collect()
+
+
+def test_sink_parquet(tmpdir: pytest.TempdirFactory) -> None:
+    counting = CountingReader()
+    path = str(tmpdir / "foo.parquet")  # type: ignore[operator]
+    nw.from_native(counting.reader()).filter(nw.col("a") > 1).select(
+        "a", "b"
+    ).sink_parquet(path, row_group_size=4)
+    assert counting.batches_read == 4
+    assert pq.read_table(path)["a"].to_pylist() == list(range(2, 11))
+    # Batches get gathered into full row groups.
+    metadata = pq.ParquetFile(path).metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert sizes == [4, 4, 1]
+
+
+def test_sink_parquet_partitioned(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "dataset")  # type: ignore[operator]
+    nw.from_native(CountingReader().reader()).filter(nw.col("c")).sink_parquet(
+        path, partition_by="g"
+    )
+    assert sorted(os.listdir(path)) == ["g=x", "g=y", "g=z"]
+    result = ds.dataset(path, partitioning="hive").to_table(filter=ds.field("g") == "x")
+    assert sorted(result["a"].to_pylist()) == [1, 3, 8]
+
+
+def test_sink_parquet_not_streamed(
+    monkeypatch: pytest.MonkeyPatch, tmpdir: pytest.TempdirFactory
+) -> None:
+    monkeypatch.undo()
+    path = str(tmpdir / "foo.parquet")  # type: ignore[operator]
+    df = nw.from_native(ds.dataset(table)).sort("a", descending=True)
+    assert stream_frames(df._dataframe._plan) is None
+    df.sink_parquet(path)
+    assert pq.read_table(path)["a"].to_pylist() == list(range(10, 0, -1))
+    empty = nw.from_native(CountingReader(table.slice(0, 0)).reader())
+    empty.sink_parquet(path)
+    assert pq.read_table(path).num_rows == 0
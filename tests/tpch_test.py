@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import inspect
+import json
+import math
+from typing import TYPE_CHECKING
+from typing import Any
+
+import polars as pl
+import pytest
+
+import narwhals.stable.v1 as nw
+from tpch.queries import QUERIES
+from tpch.run import SAMPLE_DATA_DIR
+from tpch.run import load_table
+from tpch.run import main
+from tpch.run import run
+from tpch.run import to_backend
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def assert_rows_equal(
+    result: list[tuple[Any, ...]], expected: list[tuple[Any, ...]]
+) -> None:
+    assert len(result) == len(expected)
+    for row, expected_row in zip(result, expected):
+        for value, expected_value in zip(row, expected_row):
+            if isinstance(expected_value, float):
+                # pandas has no missing floats other than NaN.
+                if math.isnan(expected_value):
+                    assert value is None or math.isnan(value)
+                else:
+                    assert value == pytest.approx(expected_value)
+            else:
+                assert value == expected_value
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("query", list(QUERIES))
+def test_tpch_queries(query: str, backend: str) -> None:
+    function = QUERIES[query]
+    tables = {
+        name: load_table(SAMPLE_DATA_DIR, name)
+        for name in inspect.signature(function).parameters
+        if name != "ns"
+    }
+    expected = function(
+        **{name: to_backend(table, "polars") for name, table in tables.items()}, ns=pl
+    ).collect()
+    result = nw.to_native(
+        function(
+            **{
+                name: nw.from_native(to_backend(table, backend)).lazy()
+                for name, table in tables.items()
+            }
+        ).collect()
+    )
+    result = pl.from_pandas(result) if backend == "pandas" else result
+    assert result.columns == expected.columns
+    assert_rows_equal(result.rows(), expected.rows())
+
+
+def test_run() -> None:
+    results = run(["q1", "q6"], ["pandas", "polars"], SAMPLE_DATA_DIR, 2, isolate=False)
+    assert [(record["query"], record["backend"]) for record in results] == [
+        ("q1", "pandas"),
+        ("q1", "polars"),
+        ("q6", "pandas"),
+        ("q6", "polars"),
+    ]
+    pandas_q1, polars_q1 = results[:2]
+    assert pandas_q1["error"] is None
+    assert pandas_q1["rows"] == 4
+    assert len(pandas_q1["times_s"]) == 2
+    assert pandas_q1["wall_time_s"] == min(pandas_q1["times_s"])
+    assert pandas_q1["native"] is None
+    assert pandas_q1["overhead_ratio"] is None
+    assert polars_q1["native"]["rows"] == 4
+    assert polars_q1["overhead_ratio"] == pytest.approx(
+        polars_q1["wall_time_s"] / polars_q1["native"]["wall_time_s"]
+    )
+
+
+def test_run_errors() -> None:
+    # The PyArrow backend doesn't support joins.
+    (record,) = run(["q3"], ["pyarrow"], SAMPLE_DATA_DIR, 1, isolate=False)
+    assert record["wall_time_s"] is None
+    assert record["error"] is not None
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = tmp_path / "results.json"
+    main(
+        [
+            "--queries",
+            "q6",
+            "--backends",
+            "polars",
+            "--repeat",
+            "1",
+            "--no-isolate",
+            "--output",
+            str(output),
+        ]
+    )
+    report = json.loads(output.read_text())
+    assert report["scale_factor"] is None
+    assert set(report["versions"]) == {"python", "narwhals", "polars"}
+    (record,) = report["results"]
+    assert record["rows"] == 1
+    assert record["overhead_ratio"] is not None
+    assert "q6 polars" in capsys.readouterr().out
+
+
+def test_main_missing_data(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="No TPC-H data found"):
+        main(["--data-dir", str(tmp_path)])
+
+
+def test_invalid_repeat(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Expected a positive number of runs"):
+        run(["q6"], ["pandas"], SAMPLE_DATA_DIR, 0, isolate=False)
+    # Even where there's no data, nothing gets generated.
+    with pytest.raises(ValueError, match="Expected a positive number of runs"):
+        main(["--data-dir", str(tmp_path), "--scale-factor", "1", "--repeat", "0"])
+    assert not list(tmp_path.iterdir())
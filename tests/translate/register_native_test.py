@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals import translate
+from narwhals._pandas_like.dataframe import PandasDataFrame
+from narwhals._pandas_like.series import PandasSeries
+from narwhals.utils import parse_version
+from tests.utils import compare_dicts
+
+
+class Table:
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+
+class Column:
+    def __init__(self, values: list[Any]) -> None:
+        self.values = values
+
+
+def test_handlers_cached() -> None:
+    class SubFrame(pd.DataFrame): ...
+
+    df = nw.from_native(SubFrame({"a": [1, 2]}), eager_only=True)
+    compare_dicts(df, {"a": [1, 2]})
+    handler = translate._HANDLERS[SubFrame]
+    assert handler is not None
+    assert handler[0] == "dataframe"
+    assert df._backend_version == parse_version(pd.__version__)
+    assert nw.from_native(1, strict=False) == 1
+    assert translate._HANDLERS[int] is None
+
+
+def test_register_native(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(translate, "_REGISTERED", [])
+    monkeypatch.setattr(translate, "_HANDLERS", {})
+    backend_version = parse_version(pd.__version__)
+    translate.register_native(
+        Table,
+        "dataframe",
+        lambda table: PandasDataFrame(
+            pd.DataFrame(table.data),
+            implementation="pandas",
+            backend_version=backend_version,
+        ),
+    )
+    translate.register_native(
+        Column,
+        "series",
+        lambda column: PandasSeries(
+            pd.Series(column.values, name="b"),
+            implementation="pandas",
+            backend_version=backend_version,
+        ),
+    )
+    df = nw.from_native(Table({"a": [1, 2]}), eager_only=True)
+    result = df.with_columns(nw.from_native(Column([3, 4]), series_only=True))
+    compare_dicts(result, {"a": [1, 2], "b": [3, 4]})
+    with pytest.raises(TypeError, match="allow_series"):
+        nw.from_native(Column([3, 4]))
+
+    # Registered types take precedence over built-in ones.
+    translate.register_native(
+        pd.DataFrame,
+        "lazyframe",
+        lambda df: PandasDataFrame(
+            df, implementation="pandas", backend_version=backend_version
+        ),
+    )
+    result = nw.from_native(pd.DataFrame({"a": [1]}))
+    assert isinstance(result, nw.LazyFrame)
@@ -0,0 +1,673 @@
+"""The 22 TPC-H queries, written against the Narwhals API.
+
+Each query takes the tables it reads as keyword arguments (named after the
+tables) and returns a lazy frame. The API used here is a subset of Polars',
+so passing `ns=polars` along with native Polars LazyFrames runs the very same
+query in Polars directly, which is what the runner uses as a baseline.
+
+Substitution parameters are the validation values from the TPC-H spec.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from typing import Callable
+
+import narwhals.stable.v1 as nw
+
+
+def q1(lineitem: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1998, 9, 2)
+    return (
+        lineitem.filter(ns.col("l_shipdate") <= var_1)
+        .with_columns(
+            disc_price=ns.col("l_extendedprice") * (1 - ns.col("l_discount")),
+            charge=(
+                ns.col("l_extendedprice")
+                * (1.0 - ns.col("l_discount"))
+                * (1.0 + ns.col("l_tax"))
+            ),
+        )
+        .group_by("l_returnflag", "l_linestatus")
+        .agg(
+            ns.sum("l_quantity").alias("sum_qty"),
+            ns.sum("l_extendedprice").alias("sum_base_price"),
+            ns.sum("disc_price").alias("sum_disc_price"),
+            ns.sum("charge").alias("sum_charge"),
+            ns.mean("l_quantity").alias("avg_qty"),
+            ns.mean("l_extendedprice").alias("avg_price"),
+            ns.mean("l_discount").alias("avg_disc"),
+            ns.len().alias("count_order"),
+        )
+        .sort("l_returnflag", "l_linestatus")
+    )
+
+
+def q2(  # noqa: PLR0913
+    region: Any, nation: Any, supplier: Any, part: Any, partsupp: Any, *, ns: Any = nw
+) -> Any:
+    var_1 = 15
+    var_2 = "BRASS"
+    var_3 = "EUROPE"
+
+    europe = (
+        part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .join(region, left_on="n_regionkey", right_on="r_regionkey")
+        .filter(
+            ns.col("p_size") == var_1,
+            ns.col("p_type").str.ends_with(var_2),
+            ns.col("r_name") == var_3,
+        )
+    )
+    return (
+        europe.group_by("p_partkey")
+        .agg(ns.min("ps_supplycost"))
+        .join(
+            europe,
+            left_on=["p_partkey", "ps_supplycost"],
+            right_on=["p_partkey", "ps_supplycost"],
+        )
+        .select(
+            "s_acctbal",
+            "s_name",
+            "n_name",
+            "p_partkey",
+            "p_mfgr",
+            "s_address",
+            "s_phone",
+            "s_comment",
+        )
+        .sort(
+            "s_acctbal",
+            "n_name",
+            "s_name",
+            "p_partkey",
+            descending=[True, False, False, False],
+        )
+        .head(100)
+    )
+
+
+def q3(customer: Any, lineitem: Any, orders: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1995, 3, 15)
+    var_2 = "BUILDING"
+    return (
+        customer.filter(ns.col("c_mktsegment") == var_2)
+        .join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .filter(ns.col("o_orderdate") < var_1, ns.col("l_shipdate") > var_1)
+        .with_columns(revenue=ns.col("l_extendedprice") * (1 - ns.col("l_discount")))
+        .group_by("o_orderkey", "o_orderdate", "o_shippriority")
+        .agg(ns.sum("revenue"))
+        .select(
+            ns.col("o_orderkey").alias("l_orderkey"),
+            "revenue",
+            "o_orderdate",
+            "o_shippriority",
+        )
+        .sort("revenue", "o_orderdate", descending=[True, False])
+        .head(10)
+    )
+
+
+def q4(lineitem: Any, orders: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1993, 7, 1)
+    var_2 = datetime(1993, 10, 1)
+    late = lineitem.filter(ns.col("l_commitdate") < ns.col("l_receiptdate"))
+    return (
+        orders.filter(ns.col("o_orderdate").is_between(var_1, var_2, closed="left"))
+        .join(late, left_on="o_orderkey", right_on="l_orderkey", how="semi")
+        .group_by("o_orderpriority")
+        .agg(ns.len().alias("order_count"))
+        .with_columns(ns.col("order_count").cast(ns.Int64))
+        .sort("o_orderpriority")
+    )
+
+
+def q5(  # noqa: PLR0913
+    region: Any,
+    nation: Any,
+    customer: Any,
+    lineitem: Any,
+    orders: Any,
+    supplier: Any,
+    *,
+    ns: Any = nw,
+) -> Any:
+    var_1 = "ASIA"
+    var_2 = datetime(1994, 1, 1)
+    var_3 = datetime(1995, 1, 1)
+    return (
+        region.join(nation, left_on="r_regionkey", right_on="n_regionkey")
+        .join(customer, left_on="n_nationkey", right_on="c_nationkey")
+        .join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(
+            supplier,
+            left_on=["l_suppkey", "n_nationkey"],
+            right_on=["s_suppkey", "s_nationkey"],
+        )
+        .filter(
+            ns.col("r_name") == var_1,
+            ns.col("o_orderdate").is_between(var_2, var_3, closed="left"),
+        )
+        .with_columns(revenue=ns.col("l_extendedprice") * (1 - ns.col("l_discount")))
+        .group_by("n_name")
+        .agg(ns.sum("revenue"))
+        .sort("revenue", descending=True)
+    )
+
+
+def q6(lineitem: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1994, 1, 1)
+    var_2 = datetime(1995, 1, 1)
+    var_3 = 24
+    return lineitem.filter(
+        ns.col("l_shipdate").is_between(var_1, var_2, closed="left"),
+        ns.col("l_discount").is_between(0.05, 0.07),
+        ns.col("l_quantity") < var_3,
+    ).select((ns.col("l_extendedprice") * ns.col("l_discount")).sum().alias("revenue"))
+
+
+def q7(  # noqa: PLR0913
+    nation: Any,
+    customer: Any,
+    lineitem: Any,
+    orders: Any,
+    supplier: Any,
+    *,
+    ns: Any = nw,
+) -> Any:
+    var_1 = datetime(1995, 1, 1)
+    var_2 = datetime(1996, 12, 31)
+
+    def shipments(customer_nation: Any, supplier_nation: Any) -> Any:
+        return (
+            customer.join(customer_nation, left_on="c_nationkey", right_on="n_nationkey")
+            .join(orders, left_on="c_custkey", right_on="o_custkey")
+            .rename({"n_name": "cust_nation"})
+            .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+            .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
+            .join(supplier_nation, left_on="s_nationkey", right_on="n_nationkey")
+            .rename({"n_name": "supp_nation"})
+            .select(
+                "supp_nation",
+                "cust_nation",
+                "l_shipdate",
+                "l_extendedprice",
+                "l_discount",
+            )
+        )
+
+    france = nation.filter(ns.col("n_name") == "FRANCE").select("n_nationkey", "n_name")
+    germany = nation.filter(ns.col("n_name") == "GERMANY").select("n_nationkey", "n_name")
+    return (
+        ns.concat([shipments(france, germany), shipments(germany, france)])
+        .filter(ns.col("l_shipdate").is_between(var_1, var_2))
+        .with_columns(
+            volume=ns.col("l_extendedprice") * (1 - ns.col("l_discount")),
+            l_year=ns.col("l_shipdate").dt.year(),
+        )
+        .group_by("supp_nation", "cust_nation", "l_year")
+        .agg(ns.sum("volume").alias("revenue"))
+        .sort("supp_nation", "cust_nation", "l_year")
+    )
+
+
+def q8(  # noqa: PLR0913
+    region: Any,
+    nation: Any,
+    customer: Any,
+    lineitem: Any,
+    orders: Any,
+    supplier: Any,
+    part: Any,
+    *,
+    ns: Any = nw,
+) -> Any:
+    var_1 = "BRAZIL"
+    var_2 = "AMERICA"
+    var_3 = "ECONOMY ANODIZED STEEL"
+    var_4 = datetime(1995, 1, 1)
+    var_5 = datetime(1996, 12, 31)
+
+    customer_nation = nation.select("n_nationkey", "n_regionkey")
+    supplier_nation = nation.select(
+        ns.col("n_nationkey").alias("supp_nationkey"),
+        ns.col("n_name").alias("nation"),
+    )
+    return (
+        part.filter(ns.col("p_type") == var_3)
+        .join(lineitem, left_on="p_partkey", right_on="l_partkey")
+        .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
+        .join(orders, left_on="l_orderkey", right_on="o_orderkey")
+        .join(customer, left_on="o_custkey", right_on="c_custkey")
+        .join(customer_nation, left_on="c_nationkey", right_on="n_nationkey")
+        .join(region, left_on="n_regionkey", right_on="r_regionkey")
+        .join(supplier_nation, left_on="s_nationkey", right_on="supp_nationkey")
+        .filter(
+            ns.col("r_name") == var_2,
+            ns.col("o_orderdate").is_between(var_4, var_5),
+        )
+        .with_columns(
+            o_year=ns.col("o_orderdate").dt.year(),
+            volume=ns.col("l_extendedprice") * (1 - ns.col("l_discount")),
+        )
+        # There's no `when/then/otherwise`, so multiply by the condition instead.
+        .with_columns(
+            brazil_volume=(ns.col("nation") == var_1).cast(ns.Float64) * ns.col("volume")
+        )
+        .group_by("o_year")
+        .agg(ns.sum("brazil_volume"), ns.sum("volume"))
+        .select(
+            "o_year",
+            (ns.col("brazil_volume") / ns.col("volume")).round(2).alias("mkt_share"),
+        )
+        .sort("o_year")
+    )
+
+
+def q9(  # noqa: PLR0913
+    part: Any,
+    partsupp: Any,
+    nation: Any,
+    lineitem: Any,
+    orders: Any,
+    supplier: Any,
+    *,
+    ns: Any = nw,
+) -> Any:
+    return (
+        part.filter(ns.col("p_name").str.contains("green"))
+        .join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
+        .join(
+            lineitem,
+            left_on=["p_partkey", "ps_suppkey"],
+            right_on=["l_partkey", "l_suppkey"],
+        )
+        .join(orders, left_on="l_orderkey", right_on="o_orderkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .select(
+            ns.col("n_name").alias("nation"),
+            ns.col("o_orderdate").dt.year().alias("o_year"),
+            (
+                ns.col("l_extendedprice") * (1 - ns.col("l_discount"))
+                - ns.col("ps_supplycost") * ns.col("l_quantity")
+            ).alias("amount"),
+        )
+        .group_by("nation", "o_year")
+        .agg(ns.sum("amount").alias("sum_profit"))
+        .sort("nation", "o_year", descending=[False, True])
+    )
+
+
+def q10(customer: Any, nation: Any, lineitem: Any, orders: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1993, 10, 1)
+    var_2 = datetime(1994, 1, 1)
+    return (
+        customer.join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(nation, left_on="c_nationkey", right_on="n_nationkey")
+        .filter(
+            ns.col("o_orderdate").is_between(var_1, var_2, closed="left"),
+            ns.col("l_returnflag") == "R",
+        )
+        .with_columns(revenue=ns.col("l_extendedprice") * (1 - ns.col("l_discount")))
+        .group_by(
+            "c_custkey",
+            "c_name",
+            "c_acctbal",
+            "c_phone",
+            "n_name",
+            "c_address",
+            "c_comment",
+        )
+        .agg(ns.sum("revenue"))
+        .select(
+            "c_custkey",
+            "c_name",
+            "revenue",
+            "c_acctbal",
+            "n_name",
+            "c_address",
+            "c_phone",
+            "c_comment",
+        )
+        .sort("revenue", descending=True)
+        .head(20)
+    )
+
+
+def q11(partsupp: Any, nation: Any, supplier: Any, *, ns: Any = nw) -> Any:
+    var_1 = "GERMANY"
+    var_2 = 0.0001
+
+    germany = (
+        partsupp.join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .filter(ns.col("n_name") == var_1)
+        .with_columns(value=ns.col("ps_supplycost") * ns.col("ps_availqty"))
+    )
+    threshold = germany.select((ns.col("value").sum() * var_2).alias("threshold"))
+    return (
+        germany.group_by("ps_partkey")
+        .agg(ns.sum("value"))
+        .join(threshold, how="cross")
+        .filter(ns.col("value") > ns.col("threshold"))
+        .select("ps_partkey", "value")
+        .sort("value", descending=True)
+    )
+
+
+def q12(orders: Any, lineitem: Any, *, ns: Any = nw) -> Any:
+    var_1 = ["MAIL", "SHIP"]
+    var_2 = datetime(1994, 1, 1)
+    var_3 = datetime(1995, 1, 1)
+
+    high_priority = ns.col("o_orderpriority").is_in(["1-URGENT", "2-HIGH"])
+    return (
+        orders.join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .filter(
+            ns.col("l_shipmode").is_in(var_1),
+            ns.col("l_commitdate") < ns.col("l_receiptdate"),
+            ns.col("l_shipdate") < ns.col("l_commitdate"),
+            ns.col("l_receiptdate").is_between(var_2, var_3, closed="left"),
+        )
+        .with_columns(
+            high_line_count=high_priority.cast(ns.Int64),
+            low_line_count=(~high_priority).cast(ns.Int64),
+        )
+        .group_by("l_shipmode")
+        .agg(ns.sum("high_line_count"), ns.sum("low_line_count"))
+        .sort("l_shipmode")
+    )
+
+
+def q13(customer: Any, orders: Any, *, ns: Any = nw) -> Any:
+    var_1 = "special.*requests"
+
+    relevant_orders = orders.filter(~ns.col("o_comment").str.contains(var_1))
+    # A left join of customers with their orders, counting orders per
+    # customer: those without any get a count of zero.
+    with_orders = (
+        customer.join(relevant_orders, left_on="c_custkey", right_on="o_custkey")
+        .group_by("c_custkey")
+        .agg(ns.len().alias("c_count"))
+        .with_columns(ns.col("c_count").cast(ns.Int64))
+    )
+    without_orders = (
+        customer.join(
+            relevant_orders, left_on="c_custkey", right_on="o_custkey", how="anti"
+        )
+        .with_columns(c_count=ns.lit(0, ns.Int64))
+        .select("c_custkey", "c_count")
+    )
+    return (
+        ns.concat([with_orders, without_orders])
+        .group_by("c_count")
+        .agg(ns.len().alias("custdist"))
+        .sort("custdist", "c_count", descending=[True, True])
+    )
+
+
+def q14(lineitem: Any, part: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1995, 9, 1)
+    var_2 = datetime(1995, 10, 1)
+    return (
+        lineitem.join(part, left_on="l_partkey", right_on="p_partkey")
+        .filter(ns.col("l_shipdate").is_between(var_1, var_2, closed="left"))
+        .with_columns(revenue=ns.col("l_extendedprice") * (1 - ns.col("l_discount")))
+        .with_columns(
+            promo_revenue=ns.col("p_type").str.starts_with("PROMO").cast(ns.Float64)
+            * ns.col("revenue")
+        )
+        .select(
+            (ns.sum("promo_revenue") * 100.0 / ns.sum("revenue"))
+            .round(2)
+            .alias("promo_revenue")
+        )
+    )
+
+
+def q15(lineitem: Any, supplier: Any, *, ns: Any = nw) -> Any:
+    var_1 = datetime(1996, 1, 1)
+    var_2 = datetime(1996, 4, 1)
+
+    revenue = (
+        lineitem.filter(ns.col("l_shipdate").is_between(var_1, var_2, closed="left"))
+        .with_columns(
+            total_revenue=ns.col("l_extendedprice") * (1 - ns.col("l_discount"))
+        )
+        .group_by("l_suppkey")
+        .agg(ns.sum("total_revenue"))
+    )
+    return (
+        supplier.join(revenue, left_on="s_suppkey", right_on="l_suppkey")
+        .filter(ns.col("total_revenue") == ns.col("total_revenue").max())
+        .with_columns(ns.col("total_revenue").round(2))
+        .select("s_suppkey", "s_name", "s_address", "s_phone", "total_revenue")
+        .sort("s_suppkey")
+    )
+
+
+def q16(part: Any, partsupp: Any, supplier: Any, *, ns: Any = nw) -> Any:
+    var_1 = "Brand#45"
+    var_2 = "MEDIUM POLISHED"
+    var_3 = [49, 14, 23, 45, 19, 3, 36, 9]
+
+    complaints = supplier.filter(
+        ns.col("s_comment").str.contains("Customer.*Complaints")
+    ).select("s_suppkey")
+    return (
+        part.filter(
+            ns.col("p_brand") != var_1,
+            ~ns.col("p_type").str.starts_with(var_2),
+            ns.col("p_size").is_in(var_3),
+        )
+        .join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .join(complaints, left_on="ps_suppkey", right_on="s_suppkey", how="anti")
+        # count(distinct ps_suppkey)
+        .unique(subset=["p_brand", "p_type", "p_size", "ps_suppkey"])
+        .group_by("p_brand", "p_type", "p_size")
+        .agg(ns.len().alias("supplier_cnt"))
+        .with_columns(ns.col("supplier_cnt").cast(ns.Int64))
+        .sort(
+            "supplier_cnt",
+            "p_brand",
+            "p_type",
+            "p_size",
+            descending=[True, False, False, False],
+        )
+    )
+
+
+def q17(lineitem: Any, part: Any, *, ns: Any = nw) -> Any:
+    var_1 = "Brand#23"
+    var_2 = "MED BOX"
+
+    average_quantity = (
+        lineitem.group_by("l_partkey")
+        .agg(ns.mean("l_quantity").alias("avg_quantity"))
+        .with_columns(ns.col("avg_quantity") * 0.2)
+    )
+    return (
+        part.filter(ns.col("p_brand") == var_1, ns.col("p_container") == var_2)
+        .join(lineitem, left_on="p_partkey", right_on="l_partkey")
+        .join(average_quantity, left_on="p_partkey", right_on="l_partkey")
+        .filter(ns.col("l_quantity") < ns.col("avg_quantity"))
+        .select((ns.col("l_extendedprice").sum() / 7.0).round(2).alias("avg_yearly"))
+    )
+
+
+def q18(customer: Any, lineitem: Any, orders: Any, *, ns: Any = nw) -> Any:
+    var_1 = 300
+
+    large_orders = (
+        lineitem.group_by("l_orderkey")
+        .agg(ns.sum("l_quantity").alias("sum_quantity"))
+        .filter(ns.col("sum_quantity") > var_1)
+    )
+    return (
+        orders.join(large_orders, left_on="o_orderkey", right_on="l_orderkey", how="semi")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(customer, left_on="o_custkey", right_on="c_custkey")
+        .group_by("c_name", "o_custkey", "o_orderkey", "o_orderdate", "o_totalprice")
+        .agg(ns.sum("l_quantity").alias("col6"))
+        .select(
+            "c_name",
+            ns.col("o_custkey").alias("c_custkey"),
+            "o_orderkey",
+            ns.col("o_orderdate").alias("o_orderdat"),
+            "o_totalprice",
+            "col6",
+        )
+        .sort("o_totalprice", "o_orderdat", descending=[True, False])
+        .head(100)
+    )
+
+
+def q19(lineitem: Any, part: Any, *, ns: Any = nw) -> Any:
+    def condition(
+        brand: str, containers: list[str], quantity: tuple[int, int], size: int
+    ) -> Any:
+        return (
+            (ns.col("p_brand") == brand)
+            & ns.col("p_container").is_in(containers)
+            & ns.col("l_quantity").is_between(*quantity)
+            & ns.col("p_size").is_between(1, size)
+        )
+
+    return (
+        part.join(lineitem, left_on="p_partkey", right_on="l_partkey")
+        .filter(
+            ns.col("l_shipmode").is_in(["AIR", "AIR REG"]),
+            ns.col("l_shipinstruct") == "DELIVER IN PERSON",
+        )
+        .filter(
+            condition("Brand#12", ["SM CASE", "SM BOX", "SM PACK", "SM PKG"], (1, 11), 5)
+            | condition(
+                "Brand#23", ["MED BAG", "MED BOX", "MED PKG", "MED PACK"], (10, 20), 10
+            )
+            | condition(
+                "Brand#34", ["LG CASE", "LG BOX", "LG PACK", "LG PKG"], (20, 30), 15
+            )
+        )
+        .select(
+            (ns.col("l_extendedprice") * (1 - ns.col("l_discount")))
+            .sum()
+            .round(2)
+            .alias("revenue")
+        )
+    )
+
+
+def q20(  # noqa: PLR0913
+    part: Any,
+    partsupp: Any,
+    nation: Any,
+    lineitem: Any,
+    supplier: Any,
+    *,
+    ns: Any = nw,
+) -> Any:
+    var_1 = datetime(1994, 1, 1)
+    var_2 = datetime(1995, 1, 1)
+    var_3 = "CANADA"
+    var_4 = "forest"
+
+    shipped = (
+        lineitem.filter(ns.col("l_shipdate").is_between(var_1, var_2, closed="left"))
+        .group_by("l_partkey", "l_suppkey")
+        .agg(ns.sum("l_quantity").alias("sum_quantity"))
+        .with_columns(ns.col("sum_quantity") * 0.5)
+    )
+    canada = nation.filter(ns.col("n_name") == var_3)
+    canadian_suppliers = supplier.join(
+        canada, left_on="s_nationkey", right_on="n_nationkey"
+    )
+    return (
+        part.filter(ns.col("p_name").str.starts_with(var_4))
+        .select(ns.col("p_partkey").unique())
+        .join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .join(
+            shipped,
+            left_on=["ps_suppkey", "p_partkey"],
+            right_on=["l_suppkey", "l_partkey"],
+        )
+        .filter(ns.col("ps_availqty") > ns.col("sum_quantity"))
+        .select(ns.col("ps_suppkey").unique())
+        .join(canadian_suppliers, left_on="ps_suppkey", right_on="s_suppkey")
+        .select("s_name", "s_address")
+        .sort("s_name")
+    )
+
+
+def q21(lineitem: Any, nation: Any, orders: Any, supplier: Any, *, ns: Any = nw) -> Any:
+    var_1 = "SAUDI ARABIA"
+
+    # Late line items of orders with more than one line item.
+    late = (
+        lineitem.group_by("l_orderkey")
+        .agg(ns.len().alias("n_supp_by_order"))
+        .filter(ns.col("n_supp_by_order") > 1)
+        .join(
+            lineitem.filter(ns.col("l_receiptdate") > ns.col("l_commitdate")),
+            left_on="l_orderkey",
+            right_on="l_orderkey",
+        )
+        .select("l_orderkey", "l_suppkey")
+    )
+    # ...where only one of the suppliers was late.
+    return (
+        late.group_by("l_orderkey")
+        .agg(ns.len().alias("n_late_by_order"))
+        .filter(ns.col("n_late_by_order") == 1)
+        .join(late, left_on="l_orderkey", right_on="l_orderkey")
+        .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .join(orders, left_on="l_orderkey", right_on="o_orderkey")
+        .filter(ns.col("n_name") == var_1, ns.col("o_orderstatus") == "F")
+        .group_by("s_name")
+        .agg(ns.len().alias("numwait"))
+        .with_columns(ns.col("numwait").cast(ns.Int64))
+        .sort("numwait", "s_name", descending=[True, False])
+        .head(100)
+    )
+
+
+def q22(customer: Any, orders: Any, *, ns: Any = nw) -> Any:
+    var_1 = ["13", "31", "23", "29", "30", "18", "17"]
+
+    candidates = (
+        customer.with_columns(cntrycode=ns.col("c_phone").str.slice(0, 2))
+        .filter(ns.col("cntrycode").is_in(var_1))
+        .select("c_custkey", "cntrycode", "c_acctbal")
+    )
+    average_balance = candidates.filter(ns.col("c_acctbal") > 0.0).select(
+        ns.col("c_acctbal").mean().alias("avg_acctbal")
+    )
+    return (
+        candidates.join(orders, left_on="c_custkey", right_on="o_custkey", how="anti")
+        .join(average_balance, how="cross")
+        .filter(ns.col("c_acctbal") > ns.col("avg_acctbal"))
+        .group_by("cntrycode")
+        .agg(ns.len().alias("numcust"), ns.sum("c_acctbal").alias("totacctbal"))
+        .with_columns(ns.col("numcust").cast(ns.Int64))
+        .sort("cntrycode")
+    )
+
+
+QUERIES: dict[str, Callable[..., Any]] = {
+    f"q{i}": query
+    for i, query in enumerate(
+        (
+            *(q1, q2, q3, q4, q5, q6, q7, q8, q9, q10, q11),
+            *(q12, q13, q14, q15, q16, q17, q18, q19, q20, q21, q22),
+        ),
+        start=1,
+    )
+}
@@ -0,0 +1,298 @@
+"""Run the TPC-H queries against every installed backend and record the results.
+
+Usage:
+
+    python -m tpch --scale-factor 1 --repeat 5 --output results.json
+
+For each query and backend, this records the best wall time out of `--repeat`
+runs, the peak memory of the process running it, and the number of rows in the
+result. Polars also gets run natively (the queries only use the subset of the
+API which Narwhals shares with Polars), giving the overhead of going through
+Narwhals as `overhead_ratio`. There's no native version of the queries for the
+other backends, so their ratio is `null`.
+
+Without `--scale-factor`, the small sample of the tables in `tests/data` is used.
+Otherwise, the tables are read from `--data-dir` (by default `tpch/data/sf{N}`),
+and generated there with DuckDB if they aren't there yet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Sequence
+
+import narwhals.stable.v1 as nw
+from tpch.queries import QUERIES
+
+TABLES = (
+    "customer",
+    "lineitem",
+    "nation",
+    "orders",
+    "part",
+    "partsupp",
+    "region",
+    "supplier",
+)
+BACKENDS = ("pandas", "polars", "pyarrow")
+SAMPLE_DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def installed_backends() -> list[str]:
+    return [
+        backend for backend in BACKENDS if importlib.util.find_spec(backend) is not None
+    ]
+
+
+def generate_data(scale_factor: float, data_dir: Path) -> None:
+    """Generate the tables at the given scale factor with DuckDB's `dbgen`."""
+    try:
+        import duckdb
+    except ImportError:
+        msg = (
+            f"No TPC-H data found in {data_dir}, and generating it requires DuckDB.\n\n"
+            "Hint: either `pip install duckdb`, or pass the directory containing "
+            "the tables as parquet files (e.g. `lineitem.parquet`) via `--data-dir`."
+        )
+        raise ModuleNotFoundError(msg) from None
+    data_dir.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect()
+    con.sql("INSTALL tpch")
+    con.sql("LOAD tpch")
+    con.sql(f"CALL dbgen(sf={scale_factor})")
+    for table in TABLES:
+        con.sql(f"COPY {table} TO '{data_dir / table}.parquet' (FORMAT PARQUET)")
+
+
+def load_table(data_dir: Path, table: str) -> Any:
+    """Read a table as a PyArrow Table, with dates as datetimes.
+
+    Not all backends support dates, so they get turned into datetimes for all
+    of them, to keep the comparison fair.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    native = pq.read_table(data_dir / f"{table}.parquet")
+    schema = pa.schema(
+        [
+            field.with_type(pa.timestamp("ns")) if pa.types.is_date(field.type) else field
+            for field in native.schema
+        ]
+    )
+    return native.cast(schema)
+
+
+def to_backend(table: Any, backend: str) -> Any:
+    if backend == "pandas":
+        return table.to_pandas()
+    if backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table).lazy()  # type: ignore[union-attr]
+    return table
+
+
+def peak_memory() -> int | None:
+    """Peak resident set size of the current process, in bytes."""
+    try:
+        import resource
+    except ImportError:
+        # e.g. on Windows.
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def run_query(
+    query: str,
+    backend: str,
+    data_dir: Path,
+    repeat: int,
+    *,
+    native: bool = False,
+) -> dict[str, Any]:
+    """Time one query on one backend, through Narwhals or (for Polars) natively."""
+    if repeat < 1:
+        msg = f"Expected a positive number of runs to repeat, got: {repeat}"
+        raise ValueError(msg)
+    function = QUERIES[query]
+    tables = [name for name in inspect.signature(function).parameters if name != "ns"]
+    inputs = {name: to_backend(load_table(data_dir, name), backend) for name in tables}
+    memory_before = peak_memory()
+    times = []
+    rows = None
+    error = None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if native:
+                import polars as pl
+
+                result = function(**inputs, ns=pl).collect()
+            else:
+                result = nw.to_native(
+                    function(
+                        **{name: nw.from_native(df).lazy() for name, df in inputs.items()}
+                    ).collect()
+                )
+            times.append(time.perf_counter() - start)
+        rows = len(result)
+    except Exception as exc:  # noqa: BLE001
+        error = f"{type(exc).__name__}: {exc}"
+    memory_after = peak_memory()
+    return {
+        "wall_time_s": min(times) if error is None else None,
+        "times_s": times,
+        "peak_memory_bytes": memory_after,
+        "query_memory_bytes": (
+            memory_after - memory_before
+            if memory_after is not None and memory_before is not None
+            else None
+        ),
+        "rows": rows,
+        "error": error,
+    }
+
+
+def _run_isolated(*args: Any, **kwargs: Any) -> dict[str, Any]:
+    # A fresh process per run, so that the peak memory is that of the run alone.
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(run_query, args, kwargs)
+
+
+def run(
+    queries: Sequence[str],
+    backends: Sequence[str],
+    data_dir: Path,
+    repeat: int = 3,
+    *,
+    isolate: bool = True,
+) -> list[dict[str, Any]]:
+    """Run each of `queries` on each of `backends`, and return one record per pair."""
+    runner: Callable[..., dict[str, Any]] = _run_isolated if isolate else run_query
+    results = []
+    for query in queries:
+        for backend in backends:
+            record: dict[str, Any] = {"query": query, "backend": backend}
+            record.update(runner(query, backend, data_dir, repeat))
+            record["native"] = None
+            record["overhead_ratio"] = None
+            if backend == "polars":
+                native = runner(query, backend, data_dir, repeat, native=True)
+                record["native"] = native
+                if record["error"] is None and native["error"] is None:
+                    record["overhead_ratio"] = (
+                        record["wall_time_s"] / native["wall_time_s"]
+                    )
+            results.append(record)
+    return results
+
+
+def versions(backends: Sequence[str]) -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        **{
+            module: importlib.import_module(module).__version__
+            for module in ("narwhals", *backends)
+        },
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m tpch",
+        description="Run the TPC-H queries through Narwhals.",
+    )
+    parser.add_argument(
+        "--scale-factor",
+        type=float,
+        default=None,
+        help="scale factor of the data (default: the sample in tests/data)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=None,
+        help="directory with the tables as parquet files (default: tpch/data/sf{N})",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        default=None,
+        help="backends to run (default: all installed ones)",
+    )
+    parser.add_argument(
+        "--queries",
+        nargs="+",
+        choices=list(QUERIES),
+        default=list(QUERIES),
+        help="queries to run (default: all of them)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="number of runs to take the best of"
+    )
+    parser.add_argument(
+        "--no-isolate",
+        dest="isolate",
+        action="store_false",
+        help="run everything in this process (faster, but merges peak memory)",
+    )
+    parser.add_argument("--output", type=Path, default=Path("tpch_results.json"))
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        # Before generating any data, rather than in `run_query`.
+        msg = f"Expected a positive number of runs to repeat, got: {args.repeat}"
+        raise ValueError(msg)
+
+    data_dir = args.data_dir
+    if data_dir is None:
+        data_dir = (
+            SAMPLE_DATA_DIR
+            if args.scale_factor is None
+            else Path(__file__).parent / "data" / f"sf{args.scale_factor:g}"
+        )
+    if not all((data_dir / f"{table}.parquet").exists() for table in TABLES):
+        if args.scale_factor is None:
+            msg = f"No TPC-H data found in {data_dir}, and no scale factor to generate it at."
+            raise FileNotFoundError(msg)
+        generate_data(args.scale_factor, data_dir)
+    backends = args.backends or installed_backends()
+
+    results = run(args.queries, backends, data_dir, args.repeat, isolate=args.isolate)
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "scale_factor": args.scale_factor,
+        "data_dir": str(data_dir),
+        "repeat": args.repeat,
+        "isolated": args.isolate,
+        "versions": versions(backends),
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    for record in results:
+        summary = (
+            f"{record['wall_time_s']:.4f}s"
+            if record["error"] is None
+            else record["error"].splitlines()[0]
+        )
+        if record["overhead_ratio"] is not None:
+            summary += f" ({record['overhead_ratio']:.2f}x native)"
+        print(f"{record['query']:>4} {record['backend']:<8} {summary}")  # noqa: T201
+    print(f"Results written to {args.output}")  # noqa: T201